@@ -8,55 +8,83 @@ Modules:
     bscore: Median-polish B-scoring implementation
     edge_effects: Edge effect detection and spatial analysis
     hit_calling: Multi-stage hit calling analytics and reporting
+
+Submodules are imported on first access of one of their names (PEP 562), so
+``import analytics.edge_effects`` does not also load B-scoring and hit calling.
 """
 
-from .bscore import (
-    median_polish,
-    calculate_bscore,
-    BScoreProcessor,
-    BScoreError,
-    apply_bscoring_to_dataframe,
-    validate_bscore_matrix,
-)
-
-from .edge_effects import (
-    EdgeEffectDetector,
-    EdgeEffectResult,
-    WarningLevel,
-    EdgeEffectError,
-    detect_edge_effects_simple,
-    is_edge_effect_significant,
-    format_edge_effect_summary,
-)
-
-from .hit_calling import (
-    HitCallingAnalyzer,
-    HitCallingError,
-    analyze_multi_plate_hits,
-    format_hit_calling_report,
-)
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .bscore import (
+        median_polish,
+        calculate_bscore,
+        BScoreProcessor,
+        BScoreError,
+        apply_bscoring_to_dataframe,
+        validate_bscore_matrix,
+    )
+    from .edge_effects import (
+        EdgeEffectDetector,
+        EdgeEffectResult,
+        WarningLevel,
+        EdgeEffectError,
+        detect_edge_effects_simple,
+        is_edge_effect_significant,
+        format_edge_effect_summary,
+        edge_effects_to_dataframe,
+    )
+    from .hit_calling import (
+        HitCallingAnalyzer,
+        HitCallingError,
+        analyze_multi_plate_hits,
+        format_hit_calling_report,
+        summarize_plate_analyses,
+    )
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
     # B-scoring exports
-    'median_polish',
-    'calculate_bscore', 
-    'BScoreProcessor',
-    'BScoreError',
-    'apply_bscoring_to_dataframe',
-    'validate_bscore_matrix',
-    
+    'median_polish': 'bscore',
+    'calculate_bscore': 'bscore',
+    'BScoreProcessor': 'bscore',
+    'BScoreError': 'bscore',
+    'apply_bscoring_to_dataframe': 'bscore',
+    'validate_bscore_matrix': 'bscore',
+
     # Edge effects exports
-    'EdgeEffectDetector',
-    'EdgeEffectResult',
-    'WarningLevel',
-    'EdgeEffectError',
-    'detect_edge_effects_simple',
-    'is_edge_effect_significant',
-    'format_edge_effect_summary',
-    
+    'EdgeEffectDetector': 'edge_effects',
+    'EdgeEffectResult': 'edge_effects',
+    'WarningLevel': 'edge_effects',
+    'EdgeEffectError': 'edge_effects',
+    'detect_edge_effects_simple': 'edge_effects',
+    'is_edge_effect_significant': 'edge_effects',
+    'format_edge_effect_summary': 'edge_effects',
+    'edge_effects_to_dataframe': 'edge_effects',
+
     # Hit calling exports
-    'HitCallingAnalyzer',
-    'HitCallingError',
-    'analyze_multi_plate_hits',
-    'format_hit_calling_report',
-]
\ No newline at end of file
+    'HitCallingAnalyzer': 'hit_calling',
+    'HitCallingError': 'hit_calling',
+    'analyze_multi_plate_hits': 'hit_calling',
+    'format_hit_calling_report': 'hit_calling',
+    'summarize_plate_analyses': 'hit_calling',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
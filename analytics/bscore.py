@@ -23,16 +23,27 @@ import numpy as np
 import pandas as pd
 
 try:
-    from ..core.statistics import nan_safe_median, mad, robust_zscore
+    from ..core.statistics import BOTTLENECK_AVAILABLE, nanmedian
 except ImportError:
     # Fallback for direct execution
     import sys
     import os
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from core.statistics import nan_safe_median, mad, robust_zscore
+    from core.statistics import BOTTLENECK_AVAILABLE, nanmedian
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT compilation of the median-polish sweeps
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Rows/columns up to this length (every 96- and 384-well line) are
+# insertion-sorted in the numba kernel; quickselect wins beyond it
+SMALL_LINE_MAX = 24
+
 # Type aliases
 ArrayLike = Union[np.ndarray, pd.Series, list[float]]
 MatrixLike = Union[np.ndarray, pd.DataFrame]
@@ -48,10 +59,207 @@ class ConvergenceError(BScoreError):
     pass
 
 
+def _middle_index(counts: np.ndarray, axis: int) -> Tuple[tuple, tuple]:
+    """Fancy indices of the lower and upper middle value of each sorted line.
+    
+    Args:
+        counts: Number of non-NaN values per line (array shape without ``axis``)
+        axis: Axis along which the lines run
+        
+    Returns:
+        Tuple of (lower, upper) index tuples into the sorted array
+    """
+    grids = list(np.indices(counts.shape, sparse=True))
+    lower = grids[:axis] + [np.maximum(counts - 1, 0) // 2] + grids[axis:]
+    upper = grids[:axis] + [counts // 2] + grids[axis:]
+    return tuple(lower), tuple(upper)
+
+
+def _sweep_medians(values: np.ndarray,
+                   axis: int,
+                   counts: np.ndarray,
+                   middle: Tuple[tuple, tuple]) -> np.ndarray:
+    """Medians of ``values`` along ``axis`` for median-polish sweeps.
+    
+    The sweeps never change how many non-NaN values (``counts``) each line
+    holds, so ``middle`` (from :func:`_middle_index`) is computed once per
+    polish. Without bottleneck, lines are sorted (NaN sorts last) and each
+    median is read from the middle of the line's valid prefix, skipping
+    np.nanmedian's per-line NaN handling. Empty lines and medians within
+    1e-12 of zero give 0.0.
+    """
+    if BOTTLENECK_AVAILABLE:
+        medians = nanmedian(values, axis=axis)
+    else:
+        lines = np.sort(values, axis=axis)
+        lower, upper = middle
+        medians = (lines[lower] + lines[upper]) / 2
+    medians = np.where(counts > 0, medians, 0.0)
+    return np.where(np.abs(medians) > 1e-12, medians, 0.0)
+
+
+def _median_polish_sweeps(matrix: np.ndarray,
+                          max_iter: int,
+                          tol: float,
+                          row_effects: np.ndarray,
+                          col_effects: np.ndarray) -> Tuple[int, float]:
+    """Run median-polish sweeps with NumPy, accumulating effects in place.
+    
+    Args:
+        matrix: 2D array of plate values (NaN for missing wells)
+        max_iter: Maximum number of sweeps
+        tol: Convergence tolerance on the largest effect update
+        row_effects: Row effects, updated in place
+        col_effects: Column effects, updated in place
+        
+    Returns:
+        Tuple of (iterations run, largest effect update of the last sweep)
+    """
+    # Working copy of matrix
+    working_matrix = matrix.copy()
+    max_change = np.inf
+    
+    # NaN wells stay NaN, so each row/column keeps the same number of
+    # values every sweep; lines without data keep a zero effect
+    has_data = ~np.isnan(matrix)
+    row_counts = has_data.sum(axis=1)
+    col_counts = has_data.sum(axis=0)
+    row_middle = _middle_index(row_counts, 1)
+    col_middle = _middle_index(col_counts, 0)
+    
+    for iteration in range(max_iter):
+        # Step 1: Update row effects
+        # r_i = median_j(X_ij - c_j) for each row i; the working matrix
+        # already has the column effects removed
+        row_medians = _sweep_medians(working_matrix, 1, row_counts, row_middle)
+        row_effects += row_medians
+        working_matrix -= row_medians[:, None]
+        
+        # Step 2: Update column effects
+        # c_j = median_i(X_ij - r_i) for each column j
+        col_medians = _sweep_medians(working_matrix, 0, col_counts, col_middle)
+        col_effects += col_medians
+        working_matrix -= col_medians[None, :]
+        
+        # The medians removed this sweep are the change in the effects
+        # (and in every residual)
+        max_change = max(np.max(np.abs(row_medians)), np.max(np.abs(col_medians)))
+        
+        logger.debug(f"Iteration {iteration + 1}: effects_change = {max_change:.9f}")
+        
+        if max_change < tol:
+            return iteration + 1, max_change
+    
+    return max_iter, max_change
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _select_kth(buf, n, k):
+        """Return the k-th smallest of ``buf[:n]`` by quickselect.
+        
+        The prefix is reordered so that ``buf[:k]`` holds values <= the result.
+        """
+        lo = 0
+        hi = n - 1
+        while lo < hi:
+            pivot = buf[(lo + hi) // 2]
+            i = lo
+            j = hi
+            while i <= j:
+                while buf[i] < pivot:
+                    i += 1
+                while buf[j] > pivot:
+                    j -= 1
+                if i <= j:
+                    tmp = buf[i]
+                    buf[i] = buf[j]
+                    buf[j] = tmp
+                    i += 1
+                    j -= 1
+            if k <= j:
+                hi = j
+            elif k >= i:
+                lo = i
+            else:
+                break
+        return buf[k]
+    
+    @njit(cache=True)
+    def _insertion_sort(buf, n):
+        """Sort ``buf[:n]`` in place; fastest for the 8-24 values of a plate line."""
+        for i in range(1, n):
+            value = buf[i]
+            j = i - 1
+            while j >= 0 and buf[j] > value:
+                buf[j + 1] = buf[j]
+                j -= 1
+            buf[j + 1] = value
+    
+    @njit(cache=True)
+    def _prefix_median(buf, n):
+        """Median of ``buf[:n]`` (0.0 when empty, tiny values snapped to 0.0)."""
+        if n == 0:
+            return 0.0
+        k = n // 2
+        if n <= SMALL_LINE_MAX:
+            _insertion_sort(buf, n)
+            median_val = buf[k]
+            if n % 2 == 0:
+                median_val = (buf[k - 1] + median_val) / 2
+        else:
+            median_val = _select_kth(buf, n, k)
+            if n % 2 == 0:
+                median_val = (np.max(buf[:k]) + median_val) / 2
+        return median_val if abs(median_val) > 1e-12 else 0.0
+    
+    # fastmath is left off: it assumes no NaNs, which would break the NaN skipping
+    @njit(cache=True)
+    def _median_polish_kernel(matrix, max_iter, tol, row_effects, col_effects):
+        """Same sweeps as ``_median_polish_sweeps`` without per-sweep array temporaries."""
+        n_rows, n_cols = matrix.shape
+        working = matrix.copy()
+        buf = np.empty(max(n_rows, n_cols))
+        max_change = np.inf
+        
+        for iteration in range(max_iter):
+            max_change = 0.0
+            
+            for i in range(n_rows):
+                n = 0
+                for j in range(n_cols):
+                    if not np.isnan(working[i, j]):
+                        buf[n] = working[i, j]
+                        n += 1
+                median_val = _prefix_median(buf, n)
+                row_effects[i] += median_val
+                for j in range(n_cols):
+                    working[i, j] -= median_val
+                max_change = max(max_change, abs(median_val))
+            
+            for j in range(n_cols):
+                n = 0
+                for i in range(n_rows):
+                    if not np.isnan(working[i, j]):
+                        buf[n] = working[i, j]
+                        n += 1
+                median_val = _prefix_median(buf, n)
+                col_effects[j] += median_val
+                for i in range(n_rows):
+                    working[i, j] -= median_val
+                max_change = max(max_change, abs(median_val))
+            
+            if max_change < tol:
+                return iteration + 1, max_change
+        
+        return max_iter, max_change
+
+
 def median_polish(matrix: np.ndarray, 
                   max_iter: int = 10, 
                   tol: float = 1e-6,
-                  return_components: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+                  return_components: bool = False,
+                  out: Optional[np.ndarray] = None) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
     """Apply median-polish algorithm to remove row and column effects.
     
     The median-polish algorithm iteratively estimates and removes row and column
@@ -70,6 +278,7 @@ def median_polish(matrix: np.ndarray,
         max_iter: Maximum number of iterations
         tol: Convergence tolerance (change in effects)
         return_components: If True, return (residuals, row_effects, col_effects)
+        out: Optional float array of the same shape to write the residuals into
         
     Returns:
         If return_components=False: residuals matrix (same shape as input)
@@ -103,75 +312,36 @@ def median_polish(matrix: np.ndarray,
     if n_rows == 0 or n_cols == 0:
         raise ValueError("Matrix cannot have zero rows or columns")
     
+    if out is not None and out.shape != matrix.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {matrix.shape}")
+    
     logger.debug(f"Starting median-polish on {n_rows}x{n_cols} matrix")
     
     # Initialize effects arrays
     row_effects = np.zeros(n_rows)
     col_effects = np.zeros(n_cols)
     
-    # Working copy of matrix
-    working_matrix = matrix.copy()
-    
-    # Track convergence
-    converged = False
-    prev_residuals = None
-    
-    for iteration in range(max_iter):
-        prev_row_effects = row_effects.copy()
-        prev_col_effects = col_effects.copy()
-        
-        # Step 1: Update row effects
-        # r_i = median_j(X_ij - c_j) for each row i
-        for i in range(n_rows):
-            row_values = working_matrix[i, :] - col_effects
-            row_median = nan_safe_median(row_values)
-            if not np.isnan(row_median) and np.abs(row_median) > 1e-12:
-                row_effects[i] += row_median
-                working_matrix[i, :] -= row_median
-        
-        # Step 2: Update column effects  
-        # c_j = median_i(X_ij - r_i) for each column j  
-        for j in range(n_cols):
-            col_values = working_matrix[:, j] - (row_effects - prev_row_effects)
-            col_median = nan_safe_median(col_values)
-            if not np.isnan(col_median) and np.abs(col_median) > 1e-12:
-                col_effects[j] += col_median
-                working_matrix[:, j] -= col_median
-        
-        # Check convergence using residuals instead of effects
-        current_residuals = working_matrix.copy()
-        
-        if prev_residuals is not None:
-            residual_change = np.nanmax(np.abs(current_residuals - prev_residuals))
-        else:
-            residual_change = np.inf
-        
-        prev_residuals = current_residuals.copy()
-        
-        # Also check effects change as backup
-        row_change = np.max(np.abs(row_effects - prev_row_effects))
-        col_change = np.max(np.abs(col_effects - prev_col_effects))
-        max_change = min(residual_change, max(row_change, col_change))
-        
-        logger.debug(f"Iteration {iteration + 1}: residual_change = {residual_change:.9f}, effects_change = {max(row_change, col_change):.9f}")
-        
-        if max_change < tol:
-            converged = True
-            logger.debug(f"Converged after {iteration + 1} iterations")
-            break
+    if NUMBA_AVAILABLE:
+        iterations, max_change = _median_polish_kernel(
+            np.ascontiguousarray(matrix, dtype=np.float64), int(max_iter), float(tol),
+            row_effects, col_effects
+        )
+    else:
+        iterations, max_change = _median_polish_sweeps(
+            matrix, max_iter, tol, row_effects, col_effects
+        )
     
-    if not converged:
+    if max_change < tol:
+        logger.debug(f"Converged after {iterations} iterations")
+    else:
         logger.warning(f"Median-polish did not converge after {max_iter} iterations "
                       f"(final change = {max_change:.9f})")
         # Don't raise exception - use partial result
     
     # Calculate final residuals
-    # Residuals = Original - RowEffects - ColEffects  
-    residuals = matrix.copy()
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if not np.isnan(matrix[i, j]):
-                residuals[i, j] = matrix[i, j] - row_effects[i] - col_effects[j]
+    # Residuals = Original - RowEffects - ColEffects (NaN wells stay NaN)
+    residuals = np.subtract(matrix, row_effects[:, None], out=out)
+    residuals -= col_effects[None, :]
     
     logger.debug(f"Median-polish complete: "
                 f"row_effects range [{np.min(row_effects):.6f}, {np.max(row_effects):.6f}], "
@@ -185,7 +355,8 @@ def median_polish(matrix: np.ndarray,
 
 def calculate_bscore(matrix: np.ndarray, 
                     max_iter: int = 10, 
-                    tol: float = 1e-6) -> np.ndarray:
+                    tol: float = 1e-6,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
     """Calculate B-scores from a matrix using median-polish and robust scaling.
     
     B-score calculation:
@@ -196,6 +367,7 @@ def calculate_bscore(matrix: np.ndarray,
         matrix: 2D numpy array with plate data
         max_iter: Maximum iterations for median-polish
         tol: Convergence tolerance for median-polish
+        out: Optional float array of the same shape to write the B-scores into
         
     Returns:
         B-score matrix with same shape as input
@@ -223,33 +395,36 @@ def calculate_bscore(matrix: np.ndarray,
     logger.debug("Calculating B-scores")
     
     try:
-        # Apply median-polish to get residuals
-        residuals = median_polish(matrix, max_iter=max_iter, tol=tol)
+        # Apply median-polish to get residuals; the residual array is then
+        # scaled in place into the B-scores
+        residuals = median_polish(matrix, max_iter=max_iter, tol=tol, out=out)
         
         # Apply robust scaling to residuals
-        # Flatten residuals to calculate global median and MAD
-        residuals_flat = residuals.flatten()
+        # Global median and MAD over the whole plate (nanmedian reduces all axes)
+        with warnings.catch_warnings():
+            # An all-NaN plate yields a NaN median
+            warnings.simplefilter("ignore", RuntimeWarning)
+            residual_median = float(nanmedian(residuals))
         
-        # Remove NaN values for statistics calculation
-        valid_residuals = residuals_flat[~np.isnan(residuals_flat)]
-        
-        if len(valid_residuals) == 0:
+        if np.isnan(residual_median):
             logger.warning("No valid residuals for B-score calculation")
-            return np.full_like(matrix, np.nan)
+            return residuals
         
         # Calculate robust scaling parameters
-        residual_median = nan_safe_median(valid_residuals)
-        residual_mad = mad(valid_residuals)
+        residual_mad = float(nanmedian(np.abs(residuals - residual_median)))
         
         logger.debug(f"Residuals: median={residual_median:.6f}, MAD={residual_mad:.6f}")
         
         # Handle zero MAD case
         if np.isnan(residual_mad) or residual_mad == 0.0:
             logger.warning("MAD of residuals is zero - cannot compute B-scores")
-            return np.full_like(matrix, np.nan)
+            residuals.fill(np.nan)
+            return residuals
         
         # Calculate B-scores: (residuals - median) / (1.4826 * MAD)
-        bscores = (residuals - residual_median) / (1.4826 * residual_mad)
+        bscores = residuals
+        bscores -= residual_median
+        bscores /= 1.4826 * residual_mad
         
         # Count valid B-scores
         valid_bscores = np.sum(~np.isnan(bscores))
@@ -294,6 +469,8 @@ class BScoreProcessor:
         self.cache_enabled = cache_enabled
         self.cache: Dict[str, np.ndarray] = {}
         self.enabled_metrics = self.DEFAULT_METRICS.copy()
+        # Row label -> 0-based index, per number of plate rows
+        self._row_mappings: Dict[int, Dict[str, int]] = {}
         
         logger.info(f"Initialized BScoreProcessor: max_iter={max_iter}, tol={tol}")
     
@@ -316,25 +493,59 @@ class BScoreProcessor:
         if not self.cache_enabled:
             return ""
         
-        # Use hash of non-NaN values for cache key
-        valid_values = matrix[~np.isnan(matrix)]
-        if len(valid_values) == 0:
-            return f"{metric}_empty"
-        
-        value_hash = hash(tuple(valid_values.tolist()))
+        # Hash the raw buffer: covers NaN positions too, without boxing each value
+        value_hash = hash(matrix.tobytes())
         shape_str = f"{matrix.shape[0]}x{matrix.shape[1]}"
         return f"{metric}_{shape_str}_{value_hash}_{self.max_iter}_{self.tol}"
     
+    def _get_row_mapping(self, plate_layout: Tuple[int, int]) -> Dict[str, int]:
+        """Return the row label mapping (A -> 0, B -> 1, ...) for a plate layout."""
+        n_rows = plate_layout[0]
+        row_mapping = self._row_mappings.get(n_rows)
+        if row_mapping is None:
+            row_mapping = {chr(ord('A') + i): i for i in range(n_rows)}
+            self._row_mappings[n_rows] = row_mapping
+        return row_mapping
+    
+    def _well_indices(self,
+                      df: pd.DataFrame,
+                      plate_layout: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Map Row labels (A, B, ...) and 1-based Col numbers to matrix indices.
+        
+        Args:
+            df: DataFrame with Row and Col columns
+            plate_layout: Tuple of (n_rows, n_cols) for plate dimensions
+            
+        Returns:
+            Tuple of (row_idx, col_idx, valid): ``valid`` flags the DataFrame rows
+            with an on-plate position, and the index arrays hold the 0-based
+            positions of those rows only
+        """
+        n_cols = plate_layout[1]
+        row_mapping = self._get_row_mapping(plate_layout)
+        
+        row_idx = df['Row'].astype(str).str.upper().str.strip().map(row_mapping).to_numpy(dtype=float)
+        col_idx = pd.to_numeric(df['Col'], errors='coerce').to_numpy(dtype=float) - 1
+        
+        valid = ~np.isnan(row_idx) & (col_idx >= 0) & (col_idx < n_cols)
+        if not valid.all():
+            logger.warning(f"Skipping {int((~valid).sum())} wells with invalid plate positions")
+        
+        return row_idx[valid].astype(int), col_idx[valid].astype(int), valid
+    
     def _matrix_from_plate_data(self, 
                                df: pd.DataFrame, 
                                metric: str,
-                               plate_layout: Tuple[int, int] = (8, 12)) -> np.ndarray:
+                               plate_layout: Tuple[int, int] = (8, 12),
+                               well_indices: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> np.ndarray:
         """Convert plate data to matrix format for B-scoring.
         
         Args:
             df: DataFrame with plate data including Row and Col columns
             metric: Name of the metric column to extract
             plate_layout: Tuple of (n_rows, n_cols) for plate dimensions
+            well_indices: Result of :meth:`_well_indices` for ``df``, to reuse
+                across metrics (computed if omitted)
             
         Returns:
             2D numpy array with plate layout
@@ -352,33 +563,12 @@ class BScoreProcessor:
         # Initialize matrix with NaN
         matrix = np.full((n_rows, n_cols), np.nan)
         
-        # Map rows (A, B, C, ...) to indices (0, 1, 2, ...)
-        row_mapping = {chr(ord('A') + i): i for i in range(n_rows)}
+        if well_indices is None:
+            well_indices = self._well_indices(df, plate_layout)
+        row_idx, col_idx, valid = well_indices
         
-        valid_wells = 0
-        for _, row in df.iterrows():
-            try:
-                row_label = str(row['Row']).upper().strip()
-                col_num = int(row['Col'])
-                
-                if row_label not in row_mapping:
-                    logger.warning(f"Invalid row label: {row_label}")
-                    continue
-                
-                row_idx = row_mapping[row_label]
-                col_idx = col_num - 1  # Convert 1-based to 0-based
-                
-                if col_idx < 0 or col_idx >= n_cols:
-                    logger.warning(f"Column {col_num} out of range for plate layout")
-                    continue
-                
-                if not np.isnan(row[metric]):
-                    matrix[row_idx, col_idx] = row[metric]
-                    valid_wells += 1
-                    
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Skipping invalid well position: {e}")
-                continue
+        matrix[row_idx, col_idx] = pd.to_numeric(df[metric], errors='coerce').to_numpy(dtype=float)[valid]
+        valid_wells = int(np.count_nonzero(~np.isnan(matrix)))
         
         logger.debug(f"Created {n_rows}x{n_cols} matrix for {metric}: {valid_wells} valid wells")
         return matrix
@@ -387,7 +577,8 @@ class BScoreProcessor:
                              matrix: np.ndarray, 
                              df: pd.DataFrame, 
                              metric_name: str,
-                             plate_layout: Tuple[int, int] = (8, 12)) -> pd.Series:
+                             plate_layout: Tuple[int, int] = (8, 12),
+                             well_indices: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> pd.Series:
         """Convert matrix back to plate data format.
         
         Args:
@@ -395,33 +586,20 @@ class BScoreProcessor:
             df: Original DataFrame to map back to
             metric_name: Name for the new B-score column
             plate_layout: Plate dimensions
+            well_indices: Result of :meth:`_well_indices` for ``df`` (computed if omitted)
             
         Returns:
             Series with B-scores in same order as input DataFrame
         """
-        n_rows, n_cols = plate_layout
-        
-        # Initialize result series with NaN
-        result = pd.Series(np.nan, index=df.index, name=metric_name)
-        
-        # Map rows (A, B, C, ...) to indices
-        row_mapping = {chr(ord('A') + i): i for i in range(n_rows)}
+        if well_indices is None:
+            well_indices = self._well_indices(df, plate_layout)
+        row_idx, col_idx, valid = well_indices
         
-        for idx, row in df.iterrows():
-            try:
-                row_label = str(row['Row']).upper().strip()
-                col_num = int(row['Col'])
-                
-                if row_label in row_mapping and 1 <= col_num <= n_cols:
-                    row_idx = row_mapping[row_label]
-                    col_idx = col_num - 1
-                    
-                    result.iloc[idx] = matrix[row_idx, col_idx]
-                    
-            except (ValueError, KeyError):
-                continue  # Keep NaN for invalid positions
+        # Off-plate positions keep NaN
+        result = np.full(len(df), np.nan)
+        result[valid] = matrix[row_idx, col_idx]
         
-        return result
+        return pd.Series(result, index=df.index, name=metric_name)
     
     def calculate_bscores_for_plate(self, 
                                    df: pd.DataFrame,
@@ -435,7 +613,8 @@ class BScoreProcessor:
             plate_layout: Tuple of (n_rows, n_cols) for plate dimensions
             
         Returns:
-            DataFrame with original data plus B-score columns (B_<metric>)
+            DataFrame with original data plus B-score columns (B_<metric>);
+            the original columns share their data with ``df``
             
         Raises:
             ValueError: If required columns are missing
@@ -459,32 +638,40 @@ class BScoreProcessor:
         if missing_cols:
             raise ValueError(f"Missing required columns for B-scoring: {missing_cols}")
         
-        result_df = df.copy()
+        # Only B-score columns are added, so the input columns' data can be shared
+        result_df = df.copy(deep=False)
         
+        # Row/Col positions are shared by all metrics: parse them once
+        well_indices = self._well_indices(df, plate_layout)
+        
+        # Convert to matrix format
+        matrices = {}
         for metric in metrics:
             try:
                 logger.debug(f"Processing metric: {metric}")
-                
-                # Convert to matrix format
-                matrix = self._matrix_from_plate_data(df, metric, plate_layout)
-                
-                # Check cache
-                cache_key = self._get_cache_key(metric, matrix)
-                if cache_key and cache_key in self.cache:
-                    logger.debug(f"Using cached B-scores for {metric}")
-                    bscore_matrix = self.cache[cache_key]
-                else:
-                    # Calculate B-scores
-                    bscore_matrix = calculate_bscore(matrix, self.max_iter, self.tol)
-                    
-                    # Cache result
-                    if cache_key:
-                        self.cache[cache_key] = bscore_matrix
-                
+                matrices[metric] = self._matrix_from_plate_data(df, metric, plate_layout, well_indices)
+            except Exception as e:
+                logger.error(f"Failed to build plate matrix for {metric}: {e}")
+        
+        # Calculate B-scores (cached)
+        try:
+            bscore_matrices = self._bscore_matrices(matrices)
+        except Exception as e:
+            logger.error(f"Failed to calculate B-scores for {list(matrices)}: {e}")
+            bscore_matrices = {}
+        
+        for metric in metrics:
+            bscore_matrix = bscore_matrices.get(metric)
+            if bscore_matrix is None:
+                # Add NaN column so downstream processing doesn't fail
+                result_df[f"B_{metric}"] = np.nan
+                continue
+            
+            try:
                 # Convert back to plate format
                 bscore_column_name = f"B_{metric}"
                 bscore_series = self._matrix_to_plate_data(
-                    bscore_matrix, df, bscore_column_name, plate_layout
+                    bscore_matrix, df, bscore_column_name, plate_layout, well_indices
                 )
                 
                 result_df[bscore_column_name] = bscore_series
@@ -501,6 +688,152 @@ class BScoreProcessor:
         
         return result_df
     
+    def _bscore_matrices(self, matrices: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Calculate B-scores for the metric matrices of one plate, using the cache if enabled.
+        
+        Without numba, uncached metrics are polished together as one
+        (n_metrics, n_rows, n_cols) stack by :meth:`calculate_bscores_batch`;
+        with numba the per-matrix kernel in :func:`calculate_bscore` is faster.
+        """
+        results = {}
+        pending = {}
+        for metric, matrix in matrices.items():
+            cache_key = self._get_cache_key(metric, matrix)
+            if cache_key and cache_key in self.cache:
+                logger.debug(f"Using cached B-scores for {metric}")
+                results[metric] = self.cache[cache_key]
+            else:
+                pending[metric] = (cache_key, matrix)
+        
+        if NUMBA_AVAILABLE or len(pending) < 2:
+            computed = {metric: calculate_bscore(matrix, self.max_iter, self.tol)
+                        for metric, (_, matrix) in pending.items()}
+        else:
+            stack = np.stack([matrix for _, matrix in pending.values()])
+            computed = dict(zip(pending, self.calculate_bscores_batch(stack)))
+        
+        for metric, bscore_matrix in computed.items():
+            cache_key = pending[metric][0]
+            if cache_key:
+                self.cache[cache_key] = bscore_matrix
+            results[metric] = bscore_matrix
+        
+        return results
+    
+    def calculate_bscores_batch(self, matrices: np.ndarray) -> np.ndarray:
+        """Calculate B-scores for a stack of plates in one vectorized pass.
+        
+        Median-polish runs on all plates at once with NumPy reductions over
+        the row and column axes, followed by per-plate robust scaling.
+        
+        Args:
+            matrices: 3D array of shape (n_plates, n_rows, n_cols); missing wells NaN
+            
+        Returns:
+            B-score array with the same shape. Plates whose residual MAD is
+            zero or undefined are all NaN, as in :func:`calculate_bscore`.
+            
+        Raises:
+            ValueError: If ``matrices`` is not 3D
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.ndim != 3:
+            raise ValueError(f"Expected 3D plate stack, got {matrices.ndim}D")
+        
+        residuals = matrices.copy()
+        
+        # Valid-value counts per row, column and plate; all-NaN lines and
+        # plates get zero effects and zero scale
+        has_data = ~np.isnan(matrices)
+        row_counts = has_data.sum(axis=2)
+        col_counts = has_data.sum(axis=1)
+        plate_counts = row_counts.sum(axis=1)
+        row_middle = _middle_index(row_counts, 2)
+        col_middle = _middle_index(col_counts, 1)
+        plate_middle = _middle_index(plate_counts, 1)
+        
+        for iteration in range(self.max_iter):
+            row_medians = _sweep_medians(residuals, 2, row_counts, row_middle)[:, :, None]
+            residuals -= row_medians
+            col_medians = _sweep_medians(residuals, 1, col_counts, col_middle)[:, None, :]
+            residuals -= col_medians
+            
+            change = max(np.max(np.abs(row_medians), initial=0.0),
+                         np.max(np.abs(col_medians), initial=0.0))
+            if change < self.tol:
+                logger.debug(f"Batch median-polish converged after {iteration + 1} iterations")
+                break
+        
+        plate_residuals = residuals.reshape(len(residuals), -1)
+        center = _sweep_medians(plate_residuals, 1, plate_counts, plate_middle)[:, None, None]
+        plate_mad = _sweep_medians(np.abs(plate_residuals - center[:, :, 0]), 1, plate_counts,
+                                   plate_middle)[:, None, None]
+        
+        scale = 1.4826 * plate_mad
+        bad_scale = ~np.isfinite(scale) | (scale == 0.0)
+        if np.any(bad_scale):
+            logger.warning(f"MAD of residuals is zero for {int(bad_scale.sum())} plate(s) - B-scores set to NaN")
+        scale = np.where(bad_scale, np.nan, scale)
+        
+        return (residuals - center) / scale
+    
+    def calculate_bscores_for_plates(self,
+                                     df: pd.DataFrame,
+                                     metrics: Optional[List[str]] = None,
+                                     plate_col: str = 'PlateID',
+                                     plate_layout: Tuple[int, int] = (8, 12)) -> pd.DataFrame:
+        """Add B-score columns to a multi-plate DataFrame using the batch routine.
+        
+        All plates are scattered into one (n_plates, n_rows, n_cols) stack per
+        metric, scored with :meth:`calculate_bscores_batch` and gathered back.
+        
+        Args:
+            df: DataFrame with Row, Col and plate ID columns
+            metrics: Metrics to B-score (default: enabled_metrics)
+            plate_col: Column identifying plates
+            plate_layout: Tuple of (n_rows, n_cols) for plate dimensions
+            
+        Returns:
+            DataFrame with original data plus B-score columns (B_<metric>);
+            the original columns share their data with ``df``
+            
+        Raises:
+            ValueError: If required columns are missing
+        """
+        if metrics is None:
+            metrics = self.enabled_metrics
+        
+        required_cols = ['Row', 'Col', plate_col] + list(metrics)
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        if missing_cols:
+            raise ValueError(f"Missing required columns for B-scoring: {missing_cols}")
+        
+        n_rows, n_cols = plate_layout
+        row_mapping = self._get_row_mapping(plate_layout)
+        
+        plate_idx, plate_ids = pd.factorize(df[plate_col], sort=False)
+        row_idx = df['Row'].astype(str).str.upper().str.strip().map(row_mapping).to_numpy(dtype=float)
+        col_idx = pd.to_numeric(df['Col'], errors='coerce').to_numpy(dtype=float) - 1
+        
+        valid = (plate_idx >= 0) & ~np.isnan(row_idx) & (col_idx >= 0) & (col_idx < n_cols)
+        if not valid.all():
+            logger.warning(f"Skipping {int((~valid).sum())} wells with invalid plate positions")
+        p, r, c = plate_idx[valid], row_idx[valid].astype(int), col_idx[valid].astype(int)
+        
+        # Only B-score columns are added, so the input columns' data can be shared
+        result_df = df.copy(deep=False)
+        for metric in metrics:
+            matrices = np.full((len(plate_ids), n_rows, n_cols), np.nan)
+            matrices[p, r, c] = pd.to_numeric(df[metric], errors='coerce').to_numpy(dtype=float)[valid]
+            
+            bscores = np.full(len(df), np.nan)
+            bscores[valid] = self.calculate_bscores_batch(matrices)[p, r, c]
+            result_df[f"B_{metric}"] = bscores
+            
+            logger.info(f"Generated batch B-scores for {metric} across {len(plate_ids)} plates")
+        
+        return result_df
+    
     def get_processing_summary(self) -> Dict[str, any]:
         """Get summary of B-score processing status.
         
@@ -522,7 +855,8 @@ def apply_bscoring_to_dataframe(df: pd.DataFrame,
                                metrics: Optional[List[str]] = None,
                                max_iter: int = 10,
                                tol: float = 1e-6,
-                               plate_layout: Tuple[int, int] = (8, 12)) -> pd.DataFrame:
+                               plate_layout: Tuple[int, int] = (8, 12),
+                               processor: Optional[BScoreProcessor] = None) -> pd.DataFrame:
     """Apply B-scoring to a plate DataFrame with automatic setup.
     
     Args:
@@ -531,6 +865,8 @@ def apply_bscoring_to_dataframe(df: pd.DataFrame,
         max_iter: Maximum iterations for median-polish
         tol: Convergence tolerance
         plate_layout: Plate dimensions
+        processor: Processor to reuse across calls so its result cache and
+            row mappings persist; ``max_iter`` and ``tol`` are then ignored
         
     Returns:
         DataFrame with original data plus B-score columns
@@ -540,10 +876,16 @@ def apply_bscoring_to_dataframe(df: pd.DataFrame,
         >>> result_df = apply_bscoring_to_dataframe(df, ['Z_lptA', 'Z_ldtD'])
         >>> 'B_Z_lptA' in result_df.columns
         True
+        
+        >>> # Share one processor across the plates of a batch
+        >>> processor = BScoreProcessor()
+        >>> results = [apply_bscoring_to_dataframe(plate_df, processor=processor)
+        ...            for plate_df in plate_dfs]
     """
-    processor = BScoreProcessor(max_iter=max_iter, tol=tol)
-    if metrics:
-        processor.set_enabled_metrics(metrics)
+    if processor is None:
+        processor = BScoreProcessor(max_iter=max_iter, tol=tol)
+        if metrics:
+            processor.set_enabled_metrics(metrics)
     
     return processor.calculate_bscores_for_plate(df, metrics, plate_layout)
 
@@ -569,13 +911,14 @@ def validate_bscore_matrix(matrix: np.ndarray,
         raise ValueError("Matrix is empty")
     
     # Check NaN fraction
-    nan_fraction = np.sum(np.isnan(matrix)) / matrix.size
+    nan_count = int(np.count_nonzero(np.isnan(matrix)))
+    nan_fraction = nan_count / matrix.size
     if nan_fraction > max_nan_fraction:
         raise ValueError(f"Too many NaN values: {nan_fraction:.1%} > {max_nan_fraction:.1%}")
     
     # Check if we have sufficient data
-    valid_values = matrix[~np.isnan(matrix)]
-    if len(valid_values) < 4:  # Need at least 4 values for meaningful statistics
-        raise ValueError(f"Insufficient valid data: {len(valid_values)} values")
+    valid_count = matrix.size - nan_count
+    if valid_count < 4:  # Need at least 4 values for meaningful statistics
+        raise ValueError(f"Insufficient valid data: {valid_count} values")
     
     return True
\ No newline at end of file
@@ -12,14 +12,14 @@ gradients, or other physical factors.
 from __future__ import annotations
 
 import logging
+import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union, NamedTuple
 from enum import Enum
 import warnings
 
 import numpy as np
 import pandas as pd
-from scipy import stats
-from scipy.spatial.distance import pdist, squareform
 
 try:
     from ..core.statistics import nan_safe_median, mad
@@ -69,6 +69,21 @@ class EdgeEffectError(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _edge_mask(plate_layout: Tuple[int, int]) -> np.ndarray:
+    """Boolean (n_rows, n_cols) mask of perimeter wells, built once per layout.
+    
+    The cached array is shared between callers and therefore read-only.
+    """
+    n_rows, n_cols = plate_layout
+    mask = np.zeros((n_rows, n_cols), dtype=bool)
+    if n_rows and n_cols:
+        mask[[0, -1], :] = True
+        mask[:, [0, -1]] = True
+    mask.setflags(write=False)
+    return mask
+
+
 class EdgeEffectDetector:
     """Detector class for comprehensive edge effect analysis.
     
@@ -134,18 +149,10 @@ class EdgeEffectDetector:
             >>> (3, 5) in interior_pos  # Interior well
             True
         """
-        n_rows, n_cols = plate_layout
-        
-        edge_positions = []
-        interior_positions = []
-        
-        for row in range(n_rows):
-            for col in range(n_cols):
-                # Edge wells are on the perimeter
-                if row == 0 or row == n_rows - 1 or col == 0 or col == n_cols - 1:
-                    edge_positions.append((row, col))
-                else:
-                    interior_positions.append((row, col))
+        # Edge wells are on the perimeter; argwhere keeps row-major order
+        edge_mask = _edge_mask(tuple(plate_layout))
+        edge_positions = list(map(tuple, np.argwhere(edge_mask).tolist()))
+        interior_positions = list(map(tuple, np.argwhere(~edge_mask).tolist()))
         
         logger.debug(f"Identified {len(edge_positions)} edge wells and {len(interior_positions)} interior wells")
         return edge_positions, interior_positions
@@ -162,14 +169,12 @@ class EdgeEffectDetector:
         Returns:
             1D array of valid (non-NaN) values from specified positions
         """
-        values = []
-        for row, col in positions:
-            if 0 <= row < matrix.shape[0] and 0 <= col < matrix.shape[1]:
-                value = matrix[row, col]
-                if not np.isnan(value):
-                    values.append(value)
-        
-        return np.array(values)
+        positions = np.asarray(positions, dtype=int).reshape(-1, 2)
+        rows, cols = positions[:, 0], positions[:, 1]
+        in_bounds = (rows >= 0) & (rows < matrix.shape[0]) & (cols >= 0) & (cols < matrix.shape[1])
+        
+        values = np.asarray(matrix[rows[in_bounds], cols[in_bounds]], dtype=float)
+        return values[~np.isnan(values)]
     
     def _calculate_effect_size(self, 
                               edge_values: np.ndarray, 
@@ -221,6 +226,9 @@ class EdgeEffectDetector:
                 row_medians.append(nan_safe_median(valid_values))
                 row_indices.append(i)
         
+        # scipy.stats is slow to import; load it only when trends are computed
+        from scipy import stats
+        
         if len(row_medians) < 3:
             row_correlation, row_p_value = np.nan, np.nan
         else:
@@ -248,7 +256,9 @@ class EdgeEffectDetector:
             except Exception:
                 col_correlation, col_p_value = np.nan, np.nan
         
-        return row_correlation, row_p_value, col_correlation, col_p_value
+        # Plain floats so callers can test NaN with math.isnan and results
+        # pickle without NumPy scalar wrappers
+        return float(row_correlation), float(row_p_value), float(col_correlation), float(col_p_value)
     
     def _calculate_corner_effects(self, 
                                 matrix: np.ndarray, 
@@ -329,6 +339,7 @@ class EdgeEffectDetector:
             values = np.array(values)
             
             # Calculate distance matrix
+            from scipy.spatial.distance import pdist, squareform
             distances = squareform(pdist(positions, metric='euclidean'))
             
             # Create spatial weights (inverse distance, with neighbors within distance 2)
@@ -437,12 +448,18 @@ class EdgeEffectDetector:
             logger.warning(f"Matrix shape {matrix.shape} doesn't match expected {plate_layout}")
         
         try:
-            # Identify edge and interior wells
-            edge_positions, interior_positions = self._identify_edge_wells(plate_layout)
+            # Identify edge and interior wells; only layout positions that
+            # fall inside the matrix are used
+            n_rows = min(plate_layout[0], matrix.shape[0])
+            n_cols = min(plate_layout[1], matrix.shape[1])
+            edge_mask = _edge_mask(tuple(plate_layout))[:n_rows, :n_cols]
+            wells = np.asarray(matrix[:n_rows, :n_cols], dtype=float)
             
             # Extract values
-            edge_values = self._extract_well_values(matrix, edge_positions)
-            interior_values = self._extract_well_values(matrix, interior_positions)
+            edge_values = wells[edge_mask]
+            edge_values = edge_values[~np.isnan(edge_values)]
+            interior_values = wells[~edge_mask]
+            interior_values = interior_values[~np.isnan(interior_values)]
             
             logger.debug(f"Extracted {len(edge_values)} edge and {len(interior_values)} interior values")
             
@@ -522,36 +539,193 @@ class EdgeEffectDetector:
         if missing_cols:
             raise EdgeEffectError(f"Missing required columns: {missing_cols}")
         
-        results = []
+        try:
+            # Scatter every plate into one stack and analyse them together
+            matrices, plate_ids = self._dataframe_to_stack(df, metric, plate_id_col, plate_layout)
+            results = self.detect_batch(matrices, plate_ids, metric)
+        except Exception as e:
+            # Don't let one bad plate fail the rest: redo them one at a time
+            logger.warning(f"Batch edge effect analysis failed ({e}); analyzing plates individually")
+            results = self._detect_per_plate(df, metric, plate_id_col, plate_layout)
         
+        logger.info(f"Analyzed edge effects for {len(results)} plates")
+        return results
+    
+    def _detect_per_plate(self,
+                          df: pd.DataFrame,
+                          metric: str,
+                          plate_id_col: str = "PlateID",
+                          plate_layout: Tuple[int, int] = (8, 12)) -> List[EdgeEffectResult]:
+        """Analyze each plate on its own, skipping plates that fail."""
         if plate_id_col in df.columns:
-            # Multiple plates
-            plate_ids = df[plate_id_col].unique()
+            plates = df.groupby(plate_id_col, sort=False)
         else:
-            # Single plate
-            plate_ids = ["Unknown"]
+            plates = [("Unknown", df)]
         
-        for plate_id in plate_ids:
+        results = []
+        for plate_id, plate_df in plates:
             try:
-                if plate_id_col in df.columns:
-                    plate_df = df[df[plate_id_col] == plate_id]
-                else:
-                    plate_df = df
-                
-                # Convert to matrix format
-                matrix = self._dataframe_to_matrix(plate_df, metric, plate_layout)
-                
-                # Detect edge effects
-                result = self.detect_edge_effects(matrix, metric, str(plate_id), plate_layout)
-                results.append(result)
-                
+                matrices, _ = self._dataframe_to_stack(plate_df, metric, plate_id_col, plate_layout)
+                results.extend(self.detect_batch(matrices, [str(plate_id)], metric))
             except Exception as e:
                 logger.error(f"Failed to analyze plate {plate_id}: {e}")
                 continue
         
-        logger.info(f"Analyzed edge effects for {len(results)} plates")
         return results
     
+    def detect_batch(self,
+                     matrices: np.ndarray,
+                     plate_ids: List[str],
+                     metric: str = "Z_lptA") -> List[EdgeEffectResult]:
+        """Detect edge effects for a stack of plates in one vectorized pass.
+        
+        Edge/interior medians, interior MAD, effect sizes, corner deviations
+        and warning levels are computed with single NumPy reductions over the
+        (rows, cols) axes of the whole stack. Only the Spearman trend tests
+        (and Moran's I, if enabled) run per plate, on precomputed row and
+        column medians. Results match :meth:`detect_edge_effects` per plate.
+        
+        Args:
+            matrices: 3D array of shape (n_plates, n_rows, n_cols); missing wells NaN
+            plate_ids: Plate identifiers, one per matrix
+            metric: Name of the metric being analyzed
+            
+        Returns:
+            List of EdgeEffectResult objects in the order of ``plate_ids``
+            
+        Raises:
+            EdgeEffectError: If the stack is not 3D or ids don't match
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.ndim != 3:
+            raise EdgeEffectError(f"Expected 3D plate stack, got {matrices.ndim}D")
+        if len(plate_ids) != matrices.shape[0]:
+            raise EdgeEffectError(f"Got {len(plate_ids)} plate IDs for {matrices.shape[0]} plates")
+        
+        n_plates, n_rows, n_cols = matrices.shape
+        if n_plates == 0:
+            return []
+        
+        edge_mask = _edge_mask((n_rows, n_cols))
+        
+        edge_values = matrices[:, edge_mask]        # (n_plates, n_edge)
+        interior_values = matrices[:, ~edge_mask]   # (n_plates, n_interior)
+        
+        with warnings.catch_warnings():
+            # Plates, rows or columns without data give NaN medians
+            warnings.simplefilter("ignore", RuntimeWarning)
+            edge_median = np.nanmedian(edge_values, axis=1)
+            interior_median = np.nanmedian(interior_values, axis=1)
+            interior_mad = np.nanmedian(np.abs(interior_values - interior_median[:, None]), axis=1)
+            row_medians = np.nanmedian(matrices, axis=2)
+            col_medians = np.nanmedian(matrices, axis=1)
+        
+        n_edge = np.sum(~np.isnan(edge_values), axis=1)
+        n_interior = np.sum(~np.isnan(interior_values), axis=1)
+        
+        # Effect size and corners are undefined without both groups or with zero MAD
+        has_groups = (n_edge > 0) & (n_interior > 0)
+        edge_median = np.where(has_groups, edge_median, np.nan)
+        interior_median = np.where(has_groups, interior_median, np.nan)
+        interior_mad = np.where(has_groups, interior_mad, np.nan)
+        usable_mad = np.where(interior_mad > 0, interior_mad, np.nan)
+        effect_size_d = (edge_median - interior_median) / usable_mad
+        
+        corner_names = ['top_left', 'top_right', 'bottom_left', 'bottom_right']
+        corners = matrices[:, [0, 0, -1, -1], [0, -1, 0, -1]]
+        corner_devs = np.abs(corners - interior_median[:, None]) / usable_mad[:, None]
+        
+        # Vectorized warning levels (NaN effect sizes count as zero)
+        abs_d = np.nan_to_num(np.abs(effect_size_d), nan=0.0)
+        levels = np.select(
+            [abs_d >= self.thresholds['critical_d'], abs_d >= self.thresholds['warn_d']],
+            [2, 1],
+            default=0
+        )
+        level_enum = [WarningLevel.INFO, WarningLevel.WARN, WarningLevel.CRITICAL]
+        
+        results = []
+        for i, plate_id in enumerate(plate_ids):
+            if n_edge[i] < self.min_group_wells or n_interior[i] < self.min_group_wells:
+                logger.warning(f"Insufficient data on plate {plate_id}: {n_edge[i]} edge, "
+                               f"{n_interior[i]} interior (minimum {self.min_group_wells} each)")
+            
+            row_correlation, row_p_value = self._spearman_trend(row_medians[i])
+            col_correlation, col_p_value = self._spearman_trend(col_medians[i])
+            spatial_autocorr, spatial_p_value = self._calculate_spatial_autocorr(matrices[i])
+            
+            results.append(EdgeEffectResult(
+                metric=metric,
+                plate_id=str(plate_id),
+                effect_size_d=float(effect_size_d[i]),
+                edge_median=float(edge_median[i]),
+                interior_median=float(interior_median[i]),
+                interior_mad=float(interior_mad[i]),
+                row_correlation=row_correlation,
+                row_p_value=row_p_value,
+                col_correlation=col_correlation,
+                col_p_value=col_p_value,
+                corner_deviations={name: float(v) for name, v in zip(corner_names, corner_devs[i])},
+                warning_level=level_enum[levels[i]],
+                n_edge_wells=int(n_edge[i]),
+                n_interior_wells=int(n_interior[i]),
+                spatial_autocorr=spatial_autocorr,
+                spatial_p_value=spatial_p_value
+            ))
+        
+        logger.info(f"Batch edge effect analysis complete for {n_plates} plates")
+        return results
+    
+    def _spearman_trend(self, medians: np.ndarray) -> Tuple[float, float]:
+        """Spearman correlation of line index vs. line medians, skipping empty lines."""
+        from scipy import stats
+        
+        valid = ~np.isnan(medians)
+        if np.sum(valid) < 3:
+            return np.nan, np.nan
+        try:
+            correlation, p_value = stats.spearmanr(np.flatnonzero(valid), medians[valid])
+            return float(correlation), float(p_value)
+        except Exception:
+            return np.nan, np.nan
+    
+    def _dataframe_to_stack(self,
+                            df: pd.DataFrame,
+                            metric: str,
+                            plate_id_col: str = "PlateID",
+                            plate_layout: Tuple[int, int] = (8, 12)) -> Tuple[np.ndarray, List[str]]:
+        """Scatter a (multi-plate) DataFrame into a (n_plates, rows, cols) stack.
+        
+        Args:
+            df: DataFrame with Row, Col and metric columns
+            metric: Metric column to extract
+            plate_id_col: Column containing plate identifiers (single plate if absent)
+            plate_layout: Plate dimensions
+            
+        Returns:
+            Tuple of (stack, plate_ids) with plates in order of first appearance
+        """
+        n_rows, n_cols = plate_layout
+        
+        if plate_id_col in df.columns:
+            plate_idx, plate_ids = pd.factorize(df[plate_id_col], sort=False)
+            plate_ids = [str(p) for p in plate_ids]
+        else:
+            plate_idx, plate_ids = np.zeros(len(df), dtype=int), ["Unknown"]
+        
+        row_mapping = {chr(ord('A') + i): i for i in range(n_rows)}
+        row_idx = df['Row'].astype(str).str.upper().str.strip().map(row_mapping).to_numpy(dtype=float)
+        col_idx = pd.to_numeric(df['Col'], errors='coerce').to_numpy(dtype=float) - 1
+        values = pd.to_numeric(df[metric], errors='coerce').to_numpy(dtype=float)
+        
+        valid = ((plate_idx >= 0) & ~np.isnan(row_idx) & (col_idx >= 0) & (col_idx < n_cols)
+                 & ~np.isnan(values))
+        
+        stack = np.full((len(plate_ids), n_rows, n_cols), np.nan)
+        stack[plate_idx[valid], row_idx[valid].astype(int), col_idx[valid].astype(int)] = values[valid]
+        
+        return stack, plate_ids
+    
     def _dataframe_to_matrix(self, 
                            df: pd.DataFrame,
                            metric: str, 
@@ -602,7 +776,7 @@ class EdgeEffectDetector:
             return {'summary': 'No edge effect results to report'}
         
         # Aggregate statistics
-        effect_sizes = [r.effect_size_d for r in results if not np.isnan(r.effect_size_d)]
+        effect_sizes = [r.effect_size_d for r in results if not math.isnan(r.effect_size_d)]
         warning_levels = [r.warning_level for r in results]
         
         # Count warning levels
@@ -614,9 +788,9 @@ class EdgeEffectDetector:
         
         # Row/column trend analysis
         strong_row_trends = [r.plate_id for r in results 
-                           if not np.isnan(r.row_correlation) and abs(r.row_correlation) > self.thresholds['spearman_rho']]
+                           if not math.isnan(r.row_correlation) and abs(r.row_correlation) > self.thresholds['spearman_rho']]
         strong_col_trends = [r.plate_id for r in results 
-                           if not np.isnan(r.col_correlation) and abs(r.col_correlation) > self.thresholds['spearman_rho']]
+                           if not math.isnan(r.col_correlation) and abs(r.col_correlation) > self.thresholds['spearman_rho']]
         
         # Corner effects
         corner_issues = []
@@ -673,8 +847,8 @@ class EdgeEffectDetector:
         
         # Check for directional trends
         strong_trends = sum(1 for r in results 
-                          if (not np.isnan(r.row_correlation) and abs(r.row_correlation) > 0.5) or
-                             (not np.isnan(r.col_correlation) and abs(r.col_correlation) > 0.5))
+                          if (not math.isnan(r.row_correlation) and abs(r.row_correlation) > 0.5) or
+                             (not math.isnan(r.col_correlation) and abs(r.col_correlation) > 0.5))
         
         if strong_trends > 0:
             recommendations.append(f"{strong_trends} plates show directional trends - check for temperature gradients or pipetting bias")
@@ -729,7 +903,7 @@ def is_edge_effect_significant(result: EdgeEffectResult,
     Returns:
         True if effect size exceeds threshold
     """
-    return not np.isnan(result.effect_size_d) and abs(result.effect_size_d) >= threshold
+    return not math.isnan(result.effect_size_d) and abs(result.effect_size_d) >= threshold
 
 
 def format_edge_effect_summary(result: EdgeEffectResult) -> str:
@@ -749,10 +923,10 @@ def format_edge_effect_summary(result: EdgeEffectResult) -> str:
         f"Effect size d={d:.3f} ({level})"
     ]
     
-    if not np.isnan(result.row_correlation) and abs(result.row_correlation) > 0.3:
+    if not math.isnan(result.row_correlation) and abs(result.row_correlation) > 0.3:
         summary_parts.append(f"Row trend rho={result.row_correlation:.3f}")
     
-    if not np.isnan(result.col_correlation) and abs(result.col_correlation) > 0.3:
+    if not math.isnan(result.col_correlation) and abs(result.col_correlation) > 0.3:
         summary_parts.append(f"Col trend rho={result.col_correlation:.3f}")
     
     # Check corner effects
@@ -760,4 +934,23 @@ def format_edge_effect_summary(result: EdgeEffectResult) -> str:
     if max_corner > 1.0:
         summary_parts.append(f"Max corner deviation {max_corner:.1f} MADs")
     
-    return " | ".join(summary_parts)
\ No newline at end of file
+    return " | ".join(summary_parts)
+
+
+def edge_effects_to_dataframe(results: List[EdgeEffectResult]) -> pd.DataFrame:
+    """Tabulate edge effect results, one row per plate/metric.
+    
+    The frame is built straight from the result tuples. Corner deviations
+    are expanded into ``corner_<name>`` columns and warning levels are
+    stored by value, so the table round-trips through CSV.
+    
+    Args:
+        results: EdgeEffectResult objects
+        
+    Returns:
+        DataFrame with one column per result field
+    """
+    df = pd.DataFrame(results, columns=EdgeEffectResult._fields)
+    corners = pd.DataFrame(df.pop('corner_deviations').tolist(), index=df.index).add_prefix('corner_')
+    df['warning_level'] = [level.value for level in df['warning_level']]
+    return pd.concat([df, corners], axis=1)
@@ -361,23 +361,42 @@ def analyze_multi_plate_hits(plate_data: dict[str, pd.DataFrame],
     analyzer = HitCallingAnalyzer(config)
     
     plate_analyses = {}
-    combined_summaries = []
     
     # Analyze each plate individually
     for plate_id, df in plate_data.items():
         try:
-            analysis = analyzer.analyze_plate_hits(df)
-            plate_analyses[plate_id] = analysis
-            
-            # Add plate ID to summary for aggregation
-            summary = analysis['summary'].copy()
-            summary['plate_id'] = plate_id
-            combined_summaries.append(summary)
-            
+            plate_analyses[plate_id] = analyzer.analyze_plate_hits(df)
         except Exception as e:
             logger.error(f"Failed to analyze plate {plate_id}: {e}")
             continue
     
+    result = summarize_plate_analyses(plate_analyses)
+    
+    logger.info(f"Multi-plate analysis complete: {len(plate_analyses)} plates processed")
+    
+    return result
+
+
+def summarize_plate_analyses(plate_analyses: dict[str, dict]) -> dict:
+    """Aggregate per-plate hit calling analyses into a cross-plate result.
+    
+    Lets callers analyze many plates in one :func:`analyze_multi_plate_hits`
+    call and still build results for any subset of them (e.g. per sheet).
+    
+    Args:
+        plate_analyses: Dictionary mapping plate IDs to analyze_plate_hits results
+        
+    Returns:
+        Dictionary with cross_plate_summary, plate_analyses and summary_table,
+        in the same format as :func:`analyze_multi_plate_hits`
+    """
+    combined_summaries = []
+    for plate_id, analysis in plate_analyses.items():
+        # Add plate ID to summary for aggregation
+        summary = analysis['summary'].copy()
+        summary['plate_id'] = plate_id
+        combined_summaries.append(summary)
+    
     # Aggregate cross-plate statistics
     if combined_summaries:
         summary_df = pd.DataFrame(combined_summaries)
@@ -393,17 +412,14 @@ def analyze_multi_plate_hits(plate_data: dict[str, pd.DataFrame],
             'mean_platform_hit_rate': summary_df.get('platform_hit_rate', pd.Series([0])).mean(),
         }
     else:
+        summary_df = pd.DataFrame()
         cross_plate_summary = {}
     
-    result = {
+    return {
         'cross_plate_summary': cross_plate_summary,
         'plate_analyses': plate_analyses,
-        'summary_table': pd.DataFrame(combined_summaries) if combined_summaries else pd.DataFrame(),
+        'summary_table': summary_df,
     }
-    
-    logger.info(f"Multi-plate analysis complete: {len(plate_analyses)} plates processed")
-    
-    return result
 
 
 def format_hit_calling_report(analysis_results: dict) -> str:
@@ -0,0 +1,204 @@
+"""Per-sheet processing pipeline for multi-sheet uploads.
+
+This module holds the work done for a single plate sheet (column mapping,
+plate calculations, B-scoring, edge effect detection and hit calling) as a
+module-level function so it can be shipped to worker processes. The
+Streamlit app fans sheets out over a process pool with
+:func:`process_sheets_parallel`, since the analytics stage is CPU-bound and
+threads would serialize on the GIL.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from core.calculations import calculate_plate_summary
+from core.plate_processor import PlateProcessor
+from .bscore import BScoreProcessor
+from .edge_effects import EdgeEffectDetector
+from .hit_calling import analyze_multi_plate_hits
+
+logger = logging.getLogger(__name__)
+
+# Z-score metrics that receive B-score columns
+BSCORE_METRICS = ['Z_lptA', 'Z_ldtD']
+
+# Fewer raw wells than this across all jobs run serially. A sheet costs
+# ~0.1 ms per well in process_one_sheet, while every pool start pays more
+# than a second for worker interpreters to re-import pandas and the
+# analytics modules, so the pool only pays off on very large uploads.
+POOL_MIN_WELLS = 20_000
+
+
+def sheet_error_result(filename: str, sheet_name: Optional[str], message: str) -> Dict[str, Any]:
+    """Build the result entry for a sheet that failed to process."""
+    return {
+        "processed_data": None,
+        "edge_results": [],
+        "processing_summary": {},
+        "hit_calling_results": {},
+        "metadata": {
+            "filename": filename,
+            "sheet_name": sheet_name,
+            "plate_count": 0,
+            "total_wells": 0
+        },
+        "error": True,
+        "error_message": message
+    }
+
+
+def process_one_sheet(raw_df: pd.DataFrame,
+                      filename: str,
+                      sheet_name: Optional[str],
+                      viability_threshold: float,
+                      apply_bscore: bool,
+                      hit_calling_config: Optional[Dict[str, Any]] = None,
+                      column_mapping: Optional[Dict[str, str]] = None,
+                      detect_edges: bool = True,
+                      call_hits: bool = True) -> Dict[str, Any]:
+    """Run the full analysis pipeline for one sheet.
+
+    Each call builds its own processors, so it is safe to run in a worker
+    process. Failures are returned as an error entry rather than raised.
+
+    Args:
+        raw_df: Raw sheet data as loaded from the upload
+        filename: Name of the uploaded file
+        sheet_name: Sheet name (None for CSV uploads)
+        viability_threshold: Viability threshold for the plate processor
+        apply_bscore: Whether to add B-score columns
+        hit_calling_config: Hit calling configuration (None disables hit calling)
+        column_mapping: Column mapping to apply; auto-detected when None
+        detect_edges: Run edge effect detection here; callers batching
+            detection across sheets pass False and fill ``edge_results`` later
+        call_hits: Run hit calling analysis here; callers batching it across
+            sheets pass False and fill ``hit_calling_results`` later
+
+    Returns:
+        Dict with processed_data, edge_results, processing_summary,
+        hit_calling_results, metadata, error and error_message
+    """
+    sheet_key = f"{filename}::{sheet_name}" if sheet_name else filename
+
+    try:
+        processor = PlateProcessor(viability_threshold=viability_threshold)
+
+        if column_mapping:
+            processor.set_column_mapping(column_mapping)
+        else:
+            processor.auto_detect_columns(raw_df)
+
+        mapped_df = processor.apply_column_mapping(raw_df)
+
+        # Generate plate ID
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        plate_id = f"{stem}_{sheet_name}" if sheet_name else stem
+
+        # Process with appropriate method
+        if hit_calling_config:
+            processed_df = processor.process_dual_readout_plate(
+                mapped_df, plate_id, hit_calling_config
+            )
+        else:
+            processed_df = processor.process_single_plate(mapped_df, plate_id)
+
+        # Apply B-scoring if requested
+        if apply_bscore and len(processed_df) > 0:
+            metrics = [m for m in BSCORE_METRICS if m in processed_df.columns]
+            if metrics:
+                processed_df = BScoreProcessor().calculate_bscores_for_plate(processed_df, metrics)
+
+        # Calculate edge effects
+        edge_results = []
+        if detect_edges and len(processed_df) > 0:
+            edge_results = EdgeEffectDetector().detect_edge_effects_dataframe(
+                processed_df, metric="Z_lptA"
+            )
+
+        summary = calculate_plate_summary(processed_df)
+
+        # Calculate hit calling results
+        hit_calling_results = {}
+        if hit_calling_config and call_hits:
+            try:
+                hit_calling_results = analyze_multi_plate_hits({plate_id: processed_df}, hit_calling_config)
+            except Exception as e:
+                logger.warning(f"Hit calling failed for {sheet_key}: {e}")
+
+        return {
+            "processed_data": processed_df,
+            "edge_results": edge_results,
+            "processing_summary": summary,
+            "hit_calling_results": hit_calling_results,
+            "metadata": {
+                "filename": filename,
+                "sheet_name": sheet_name,
+                "plate_id": plate_id,
+                "plate_count": processed_df['PlateID'].nunique() if 'PlateID' in processed_df.columns else 1,
+                "total_wells": len(processed_df)
+            },
+            "error": False,
+            "error_message": None
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to process {sheet_key}: {e}")
+        return sheet_error_result(filename, sheet_name, str(e))
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start workers without forking this process where possible.
+
+    The Streamlit server runs its own threads, and forking a process with
+    live threads can leave their locks held in the child. Use a fork server
+    on platforms that have one and spawn elsewhere.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def process_sheets_parallel(jobs: List[Dict[str, Any]],
+                            max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Run :func:`process_one_sheet` for many sheets on a process pool.
+
+    Results are returned in job order. Jobs run in the current process when
+    there is only one worker, when they hold fewer than ``POOL_MIN_WELLS``
+    rows in total, or when a pool cannot be started.
+
+    Args:
+        jobs: Keyword-argument dicts for :func:`process_one_sheet`
+        max_workers: Worker count (default: ``os.cpu_count()``, capped at len(jobs))
+
+    Returns:
+        List of per-sheet result dicts in the same order as ``jobs``
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    total_wells = sum(len(job['raw_df']) for job in jobs)
+    if workers <= 1 or total_wells < POOL_MIN_WELLS:
+        return [process_one_sheet(**job) for job in jobs]
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+            futures = {executor.submit(process_one_sheet, **job): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    job = jobs[i]
+                    logger.error(f"Worker failed for sheet {job.get('sheet_name')}: {e}")
+                    results[i] = sheet_error_result(job['filename'], job.get('sheet_name'), str(e))
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"Process pool unavailable ({e}); processing sheets serially")
+        return [process_one_sheet(**job) for job in jobs]
+
+    return results
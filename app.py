@@ -9,30 +9,60 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import yaml
+import json
 import io
+import hashlib
+import math
 import zipfile
-import tempfile
 import time
+import uuid
+from datetime import datetime
+from functools import partial
+from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import logging
 
 # Import core modules
-from core.plate_processor import PlateProcessor, PlateProcessingError, get_available_excel_sheets
+from core.plate_processor import (
+    PlateProcessor, PlateProcessingError, get_available_excel_sheets, excel_engine, read_xlsx_sheet_names
+)
 from core.calculations import calculate_plate_summary
-from analytics.edge_effects import EdgeEffectDetector, WarningLevel
+from core.statistics import top_n_indices
+from core.well_position_utils import GRID_INDEX_COLUMNS, add_grid_indices
+from analytics.edge_effects import (
+    EdgeEffectDetector, EdgeEffectResult, WarningLevel, edge_effects_to_dataframe
+)
 from analytics.bscore import BScoreProcessor
-from analytics.hit_calling import HitCallingAnalyzer, analyze_multi_plate_hits, format_hit_calling_report
+from analytics.hit_calling import (
+    HitCallingAnalyzer, analyze_multi_plate_hits, format_hit_calling_report, summarize_plate_analyses
+)
+from analytics.sheet_pipeline import process_sheets_parallel, sheet_error_result
 from sample_data_generator import create_demo_data
 
-# Import advanced visualization modules
-from visualizations.advanced.qc_dashboard import QCDashboard
+# Visualization modules (QC dashboard, figure legends) pull in matplotlib,
+# seaborn and scipy.stats; they are imported inside main() where first needed
+# so the upload page renders without paying for them.
+
+# Optional fast JSON serializer for export bundles
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Import figure legend system
-from visualizations.legends.models import ChartType, ExpertiseLevel
-from visualizations.legends.integration import StreamlitIntegration, VisualizationIntegrator
+# st.download_button accepts a callable that builds the file on click from
+# Streamlit 1.52; older releases need the bytes up front
+DEFERRED_DOWNLOADS = tuple(int(part) for part in st.__version__.split('.')[:2]) >= (1, 52)
+
+# Optional Arrow CSV writer for table downloads (pyarrow ships with Streamlit)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -57,7 +87,50 @@ def load_config() -> Dict[str, Any]:
         return {}
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource
+def load_sample_bytes() -> bytes:
+    """Read the bundled sample plate once and share the bytes across sessions."""
+    return Path('sample_plate_data.csv').read_bytes()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _process_one_file(file_bytes_hash: str,
+                      filename: str,
+                      _file_bytes: bytes,
+                      sheet_name: Optional[str],
+                      viability_threshold: float,
+                      apply_bscore: bool = False,
+                      hit_calling_enabled: bool = False,
+                      hit_calling_config: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """Process one uploaded file into a fully scored plate DataFrame.
+    
+    Cached per file on ``file_bytes_hash`` so that adding or changing one
+    upload does not reprocess the others. The raw bytes are not hashed by
+    Streamlit (leading underscore).
+    """
+    processor = PlateProcessor(viability_threshold=viability_threshold)
+    plate_id = Path(filename).stem
+    
+    # Read uploads straight from memory
+    raw_df = processor.load_plate_data(_upload_buffer(filename, _file_bytes), sheet_name=sheet_name)
+    processor.auto_detect_columns(raw_df)
+    mapped_df = processor.apply_column_mapping(raw_df)
+    
+    if hit_calling_enabled and hit_calling_config:
+        # Process with dual-readout hit calling
+        plate_df = processor.process_dual_readout_plate(mapped_df, plate_id, hit_calling_config)
+    else:
+        plate_df = processor.process_single_plate(mapped_df, plate_id)
+    
+    # B-score the plate before it is combined with the others
+    if apply_bscore and len(plate_df) > 0:
+        metrics = [m for m in ['Z_lptA', 'Z_ldtD'] if m in plate_df.columns]
+        if metrics:
+            plate_df = BScoreProcessor().calculate_bscores_for_plates(plate_df, metrics)
+    
+    return plate_df
+
+
 def process_uploaded_files(files_data: Dict[str, bytes], 
                           sheet_selections: Dict[str, str],
                           viability_threshold: float,
@@ -65,75 +138,21 @@ def process_uploaded_files(files_data: Dict[str, bytes],
                           hit_calling_enabled: bool = False,
                           hit_calling_config: Optional[Dict[str, Any]] = None,
                           column_mapping: Optional[Dict[str, str]] = None) -> Optional[pd.DataFrame]:
-    """Process uploaded files and return combined dataframe."""
+    """Process uploaded files and return combined dataframe.
+    
+    Each file goes through the cached :func:`_process_one_file`, keyed on a
+    content hash, so only new or changed uploads are reprocessed.
+    """
     try:
-        processor = PlateProcessor(viability_threshold=viability_threshold)
-        
-        # Process each file
-        plate_files = {}
-        sheet_names = {}
-        
+        processed_plates = []
         for filename, file_data in files_data.items():
-            # Create temporary file
-            temp_path = Path(f"/tmp/{filename}")
-            temp_path.parent.mkdir(exist_ok=True)
-            temp_path.write_bytes(file_data)
-            
-            plate_id = Path(filename).stem
-            plate_files[plate_id] = temp_path
-            
-            if filename in sheet_selections:
-                sheet_names[plate_id] = sheet_selections[filename]
-        
-        # Process multiple plates with hit calling if enabled
-        if hit_calling_enabled and hit_calling_config:
-            # Process each plate individually with dual-readout method
-            processed_plates = []
-            for plate_id, temp_path in plate_files.items():
-                sheet_name = sheet_names.get(plate_id)
-                raw_df = processor.load_plate_data(temp_path, sheet_name=sheet_name)
-                
-                # Auto-detect columns for first plate, reuse mapping for subsequent plates
-                if not processor.column_mapping:
-                    processor.auto_detect_columns(raw_df)
-                
-                # Apply column mapping
-                mapped_df = processor.apply_column_mapping(raw_df)
-                
-                # Process with dual-readout hit calling
-                processed_df = processor.process_dual_readout_plate(mapped_df, plate_id, hit_calling_config)
-                processed_plates.append(processed_df)
-            
-            combined_df = pd.concat(processed_plates, ignore_index=True)
-        else:
-            # Standard processing
-            combined_df = processor.process_multiple_plates(plate_files, sheet_names)
-        
-        # Apply B-scoring if requested
-        if apply_bscore and len(combined_df) > 0:
-            bscore_processor = BScoreProcessor()
-            
-            # Group by plate for B-scoring
-            processed_plates = []
-            for plate_id in combined_df['PlateID'].unique():
-                plate_df = combined_df[combined_df['PlateID'] == plate_id].copy()
-                
-                # Apply B-scoring to Z-scores
-                for metric in ['Z_lptA', 'Z_ldtD']:
-                    if metric in plate_df.columns:
-                        b_scores = bscore_processor.calculate_bscores_for_plate(plate_df, metric)
-                        plate_df[f'B_{metric}'] = b_scores
-                
-                processed_plates.append(plate_df)
-            
-            combined_df = pd.concat(processed_plates, ignore_index=True)
-        
-        # Clean up temporary files
-        for temp_path in plate_files.values():
-            if temp_path.exists():
-                temp_path.unlink()
+            processed_plates.append(_process_one_file(
+                _upload_hash(file_data), filename, file_data, sheet_selections.get(filename),
+                viability_threshold, apply_bscore, hit_calling_enabled, hit_calling_config
+            ))
         
-        return combined_df
+        # Single concat of fully scored plates
+        return pd.concat(processed_plates, ignore_index=True)
         
     except Exception as e:
         logger.error(f"Failed to process files: {e}")
@@ -159,22 +178,20 @@ def _unused_load_dataframe_from_bytes(filename: str, file_data: bytes, sheet_nam
         if filename.endswith(('.xlsx', '.xls')):
             # For Excel files, we need to use BytesIO
             excel_buffer = io.BytesIO(file_data)
+            engine = excel_engine(Path(filename).suffix)
             if sheet_name is None:
-                df = pd.read_excel(excel_buffer)
+                df = pd.read_excel(excel_buffer, engine=engine)
             else:
-                df = pd.read_excel(excel_buffer, sheet_name=sheet_name)
+                df = pd.read_excel(excel_buffer, sheet_name=sheet_name, engine=engine)
             excel_buffer.close()  # Close BytesIO buffer
         elif filename.endswith('.csv'):
-            # For CSV files, use StringIO
-            text_data = file_data.decode('utf-8')
-            csv_buffer = io.StringIO(text_data)
-            df = pd.read_csv(csv_buffer)
-            csv_buffer.close()  # Close StringIO buffer
+            # The C parser decodes UTF-8 straight from the bytes buffer
+            df = pd.read_csv(io.BytesIO(file_data), encoding='utf-8', engine='c')
         else:
             raise ValueError(f"Unsupported file format: {filename}")
             
         # Clean column names
-        df.columns = df.columns.str.strip()
+        df.columns = [str(col).strip() for col in df.columns]
         return df
         
     except Exception as e:
@@ -191,92 +208,186 @@ def get_excel_sheet_names_from_bytes(file_data: bytes) -> List[str]:
     Returns:
         List of sheet names
     """
+    sheet_names = read_xlsx_sheet_names(file_data)
+    if sheet_names is not None:
+        return sheet_names
+    
     excel_buffer = io.BytesIO(file_data)
     try:
-        with pd.ExcelFile(excel_buffer) as excel_file:
+        with pd.ExcelFile(excel_buffer, engine=excel_engine()) as excel_file:
             return excel_file.sheet_names
     finally:
         excel_buffer.close()
 
 
-class TemporaryFileManager:
-    """Context manager for safely handling temporary files with Windows file locking."""
+def _upload_hash(file_data: bytes) -> str:
+    """Content hash of an upload, used as the key of the per-upload caches.
     
-    def __init__(self, filename: str, file_data: bytes):
-        self.filename = filename
-        self.file_data = file_data
-        self.temp_path = None
-        self.excel_file = None
-        
-    def __enter__(self):
-        # Create temporary file
-        self.temp_path = Path(tempfile.gettempdir()) / self.filename
-        self.temp_path.parent.mkdir(exist_ok=True)
-        self.temp_path.write_bytes(self.file_data)
-        return self
-        
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # Close any open Excel files first
-        if self.excel_file is not None:
-            try:
-                self.excel_file.close()
-            except:
-                pass  # Ignore close errors
-        
-        # Force garbage collection
-        gc.collect()
-        
-        # Clean up temporary file
-        if self.temp_path:
-            safe_cleanup_temp_file(self.temp_path)
-    
-    def get_sheet_names(self):
-        """Get sheet names for Excel files, handling file closure properly."""
-        if self.filename.endswith(('.xlsx', '.xls')):
-            # Use context manager to ensure file is closed
-            with pd.ExcelFile(self.temp_path) as excel_file:
-                sheet_names = excel_file.sheet_names
-            return sheet_names
-        else:
-            return [None]  # CSV has no sheets
+    The cached functions take the bytes as an unhashed ``_``-prefixed
+    argument next to this key, so Streamlit does not hash them again.
+    """
+    return hashlib.blake2b(file_data, digest_size=16).hexdigest()
 
 
-def safe_cleanup_temp_file(temp_path: Path, max_attempts: int = 5, delay: float = 0.1) -> bool:
-    """Safely clean up temporary file with retry logic for Windows file locking.
+def _upload_buffer(filename: str, file_data: bytes) -> io.BytesIO:
+    """Wrap uploaded bytes in a named in-memory buffer.
     
-    Args:
-        temp_path: Path to the temporary file to delete
-        max_attempts: Maximum number of deletion attempts
-        delay: Delay between attempts in seconds
-        
-    Returns:
-        True if file was successfully deleted or doesn't exist, False otherwise
+    The ``name`` attribute lets ``PlateProcessor.load_plate_data`` pick the
+    CSV or Excel reader without writing the upload to disk first.
     """
-    if not temp_path.exists():
-        return True
+    buf = io.BytesIO(file_data)
+    buf.name = filename
+    buf.seek(0)
+    return buf
+
+
+def _open_excel_upload(filename: str, file_data: bytes) -> pd.ExcelFile:
+    """Open an uploaded workbook once so every sheet can be parsed from it."""
+    engine = excel_engine(Path(filename).suffix)
+    return pd.ExcelFile(_upload_buffer(filename, file_data), engine=engine)
+
+
+@st.cache_data(show_spinner=False)
+def _sheet_names_cached(name: str, data_hash: str, _data: bytes) -> List[str]:
+    """Sheet names of an uploaded workbook, cached per upload content.
     
-    # Force garbage collection to release any lingering file handles
-    gc.collect()
+    The sidebar asks for sheet names on every rerun; ``data_hash`` keys the
+    cache so the workbook is opened once per distinct upload.
+    """
+    sheet_names = read_xlsx_sheet_names(_data)
+    if sheet_names is not None:
+        return sheet_names
     
-    for attempt in range(max_attempts):
+    with _open_excel_upload(name, _data) as excel_file:
+        return excel_file.sheet_names
+
+
+def _upload_sheet_names(file) -> List[str]:
+    """Sheet names for a Streamlit ``UploadedFile``."""
+    data = file.getvalue()
+    return _sheet_names_cached(file.name, _upload_hash(data), data)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_uploaded_sheets(
+    filename: str,
+    file_hash: str,
+    _file_data: bytes
+) -> tuple[Dict[Optional[str], Optional[pd.DataFrame]], Dict[Optional[str], str]]:
+    """Parse every sheet of an upload once.
+    
+    The workbook is unzipped and parsed a single time and each sheet is read
+    from the open ``pd.ExcelFile``. Results are keyed on ``file_hash``
+    (see :func:`_upload_hash`); the raw bytes are not hashed by Streamlit.
+    
+    Returns:
+        Tuple of (sheet_name -> raw DataFrame or None, sheet_name -> error message).
+        CSV uploads use ``None`` as their only sheet name.
+    """
+    processor = PlateProcessor()
+    raw_sheets: Dict[Optional[str], Optional[pd.DataFrame]] = {}
+    load_errors: Dict[Optional[str], str] = {}
+    
+    if filename.endswith(('.xlsx', '.xls')):
+        with _open_excel_upload(filename, _file_data) as excel_file:
+            for sheet_name in excel_file.sheet_names:
+                try:
+                    raw_sheets[sheet_name] = processor.load_from_excelfile(excel_file, sheet_name)
+                except PlateProcessingError as e:
+                    raw_sheets[sheet_name] = None
+                    load_errors[sheet_name] = str(e)
+    else:
         try:
-            temp_path.unlink()
-            return True
-        except PermissionError:
-            if attempt < max_attempts - 1:
-                time.sleep(delay)
-                gc.collect()  # Try to force garbage collection again
-            else:
-                logger.warning(f"Failed to delete temporary file {temp_path} after {max_attempts} attempts")
-                return False
-        except FileNotFoundError:
-            # File was already deleted
-            return True
-        except Exception as e:
-            logger.warning(f"Unexpected error deleting temporary file {temp_path}: {e}")
-            return False
+            raw_sheets[None] = processor.load_plate_data(_upload_buffer(filename, _file_data))
+        except PlateProcessingError as e:
+            raw_sheets[None] = None
+            load_errors[None] = str(e)
     
-    return False
+    return raw_sheets, load_errors
+
+
+def build_hit_calling_config(z_threshold_lptA: float,
+                             z_threshold_ldtD: float,
+                             tolc_max_threshold: float,
+                             wt_min_threshold: float,
+                             sa_min_threshold: float) -> Dict[str, Any]:
+    """Build the hit calling configuration from the sidebar thresholds.
+
+    Only needed when the data is (re)processed, so callers build it inside
+    the processing branch rather than on every script rerun.
+    """
+    return {
+        'hit_calling': {
+            'multi_stage_enabled': True,
+            'reporter': {
+                'z_threshold_lptA': z_threshold_lptA,
+                'z_threshold_ldtD': z_threshold_ldtD,
+                'require_viability': True,
+                'combine_mode': 'OR'
+            },
+            'vitality': {
+                'tolC_max_threshold': tolc_max_threshold,
+                'wt_min_threshold': wt_min_threshold,
+                'sa_min_threshold': sa_min_threshold,
+                'require_all_conditions': True
+            },
+            'platform': {
+                'require_both_stages': True
+            }
+        }
+    }
+
+
+# Score columns shown to 3 decimals in the hit tables; single precision is ample there
+DISPLAY_FLOAT32_COLUMNS = ['Ratio_lptA', 'Ratio_ldtD', 'Z_lptA', 'Z_ldtD', 'B_Z_lptA', 'B_Z_ldtD']
+
+# Low-cardinality well identifiers stored as categoricals for display
+DISPLAY_CATEGORY_COLUMNS = ['PlateID', 'Well', 'Row']
+
+# Accepted spellings of the well identifier columns in the hit tables
+DISPLAY_COLUMN_ALIASES = {
+    'PlateID': ['PlateID', 'Plate_ID', 'plate_id'],
+    'Well': ['Well', 'WellID', 'well_id'],
+}
+
+
+def to_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert processed data to PyArrow-backed dtypes for the display tabs.
+    
+    Arrow columns are contiguous buffers with separate validity bitmaps, so
+    the per-rerun column sums and null checks in the tabs run in Arrow's
+    compute kernels and hit flags are stored as bits. Floats keep double
+    precision, since the combined CSV and analysis bundle are written from
+    these frames. PlateID, Well and Row become categoricals, so their
+    unique/isin/color-mapping work runs on small integer codes. Other text
+    columns stay as object since some visualizations compare them against
+    integers. Only call this once analysis is finished; the analytics code
+    works on NumPy columns.
+    """
+    arrow_df = df.convert_dtypes(dtype_backend='pyarrow', convert_string=False)
+    return arrow_df.astype({col: 'category' for col in DISPLAY_CATEGORY_COLUMNS if col in arrow_df.columns})
+
+
+def narrow_display_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the ratio and Z-score columns of a hit table frame to float32.
+    
+    Only used on the top-N display frames, which are rounded to 3 decimals
+    anyway; full-data exports keep float64.
+    """
+    return df.astype({
+        col: 'float32[pyarrow]' for col in DISPLAY_FLOAT32_COLUMNS
+        if col in df.columns and pd.api.types.is_float_dtype(df[col])
+    })
+
+
+def max_warning_level(edge_results: List[EdgeEffectResult]) -> Optional[WarningLevel]:
+    """Most severe warning level in a set of edge effect results.
+
+    Computed once when the results are produced and stored next to them, so
+    the Summary tab does not rescan the results on every rerun.
+    """
+    severity = list(WarningLevel)  # declared INFO, WARN, CRITICAL
+    return max((result.warning_level for result in edge_results), key=severity.index, default=None)
 
 
 @st.cache_data(ttl=3600)
@@ -290,129 +401,661 @@ def process_all_sheets_from_files(
 ) -> Dict[str, Dict[str, Any]]:
     """Process ALL sheets from uploaded Excel files.
     
+    Sheets are analysed in parallel worker processes (see
+    ``analytics.sheet_pipeline``); each worker gets the raw sheet frame and
+    builds its own processors.
+    
     Returns:
         Dict mapping sheet_key -> {processed_data, edge_results, processing_summary, 
                                    hit_calling_results, metadata, error, error_message}
     """
     sheet_results = {}
-    processor = PlateProcessor(viability_threshold=viability_threshold)
+    jobs = []
+    job_keys = []
+    shared_mapping = None
+    active_hit_config = hit_calling_config if hit_calling_enabled else None
     
     for filename, file_data in files_data.items():
-        # Create temporary file
-        temp_path = Path(tempfile.gettempdir()) / filename
-        temp_path.parent.mkdir(exist_ok=True)
-        temp_path.write_bytes(file_data)
+        # Parsed sheets are cached per upload across Streamlit reruns
+        raw_sheets, load_errors = load_uploaded_sheets(filename, _upload_hash(file_data), file_data)
         
-        try:
-            # Get all sheets for Excel files
-            if filename.endswith(('.xlsx', '.xls')):
-                excel_file = pd.ExcelFile(temp_path)
-                sheet_names = excel_file.sheet_names
-                excel_file.close()  # Explicitly close to release file handle
-            else:
-                sheet_names = [None]  # CSV has no sheets
+        for sheet_name, raw_df in raw_sheets.items():
+            sheet_key = f"{filename}::{sheet_name}" if sheet_name else filename
             
-            # Process each sheet
-            for sheet_name in sheet_names:
-                sheet_key = f"{filename}::{sheet_name}" if sheet_name else filename
-                
+            if raw_df is None:
+                logger.error(f"Failed to process {sheet_key}: {load_errors[sheet_name]}")
+                sheet_results[sheet_key] = sheet_error_result(filename, sheet_name, load_errors[sheet_name])
+                continue
+            
+            # Auto-detect columns on the first sheet and reuse the mapping for the rest
+            if shared_mapping is None:
                 try:
-                    # Load and process individual sheet
-                    raw_df = processor.load_plate_data(temp_path, sheet_name=sheet_name)
-                    
-                    # Auto-detect columns for first sheet, reuse mapping for subsequent sheets
-                    if not processor.column_mapping:
-                        processor.auto_detect_columns(raw_df)
-                    
-                    # Apply column mapping
-                    mapped_df = processor.apply_column_mapping(raw_df)
-                    
-                    # Generate plate ID
-                    plate_id = f"{Path(filename).stem}_{sheet_name}" if sheet_name else Path(filename).stem
-                    
-                    # Process with appropriate method
-                    if hit_calling_enabled and hit_calling_config:
-                        processed_df = processor.process_dual_readout_plate(
-                            mapped_df, plate_id, hit_calling_config
-                        )
-                    else:
-                        processed_df = processor.process_single_plate(mapped_df, plate_id)
-                    
-                    # Apply B-scoring if requested
-                    if apply_bscore and len(processed_df) > 0:
-                        bscore_processor = BScoreProcessor()
-                        for metric in ['Z_lptA', 'Z_ldtD']:
-                            if metric in processed_df.columns:
-                                b_scores = bscore_processor.calculate_bscores_for_plate(processed_df, metric)
-                                processed_df[f'B_{metric}'] = b_scores
-                    
-                    # Calculate edge effects
-                    edge_results = []
-                    if len(processed_df) > 0:
-                        edge_detector = EdgeEffectDetector()
-                        edge_results = edge_detector.detect_edge_effects_dataframe(
-                            processed_df, metric="Z_lptA"
-                        )
-                    
-                    # Calculate processing summary
-                    summary = calculate_plate_summary(processed_df)
-                    
-                    # Calculate hit calling results
-                    hit_calling_results = {}
-                    if hit_calling_enabled and hit_calling_config:
-                        try:
-                            plate_data = {plate_id: processed_df}
-                            hit_calling_results = analyze_multi_plate_hits(plate_data, hit_calling_config)
-                        except Exception as e:
-                            logger.warning(f"Hit calling failed for {sheet_key}: {e}")
-                    
-                    # Store successful result
-                    sheet_results[sheet_key] = {
-                        "processed_data": processed_df,
-                        "edge_results": edge_results,
-                        "processing_summary": summary,
-                        "hit_calling_results": hit_calling_results,
-                        "metadata": {
-                            "filename": filename,
-                            "sheet_name": sheet_name,
-                            "plate_count": len(processed_df['PlateID'].unique()) if 'PlateID' in processed_df.columns else 1,
-                            "total_wells": len(processed_df)
-                        },
-                        "error": False,
-                        "error_message": None
-                    }
-                    
-                except Exception as e:
-                    # Store error result
-                    logger.error(f"Failed to process {sheet_key}: {e}")
-                    sheet_results[sheet_key] = {
-                        "processed_data": None,
-                        "edge_results": [],
-                        "processing_summary": {},
-                        "hit_calling_results": {},
-                        "metadata": {
-                            "filename": filename,
-                            "sheet_name": sheet_name,
-                            "plate_count": 0,
-                            "total_wells": 0
-                        },
-                        "error": True,
-                        "error_message": str(e)
-                    }
+                    shared_mapping = PlateProcessor().auto_detect_columns(raw_df)
+                except PlateProcessingError as e:
+                    logger.debug(f"Column auto-detection failed for {sheet_key}: {e}")
+            
+            sheet_results[sheet_key] = None  # keep sheet order
+            job_keys.append(sheet_key)
+            jobs.append({
+                "raw_df": raw_df,
+                "filename": filename,
+                "sheet_name": sheet_name,
+                "viability_threshold": viability_threshold,
+                "apply_bscore": apply_bscore,
+                "hit_calling_config": active_hit_config,
+                "column_mapping": shared_mapping,
+                "detect_edges": False,
+                "call_hits": False,
+            })
+    
+    for sheet_key, result in zip(job_keys, process_sheets_parallel(jobs)):
+        sheet_results[sheet_key] = result
+    
+    # Edge effects: one vectorized pass per file over all of its sheets
+    edge_detector = EdgeEffectDetector()
+    for filename in files_data:
+        file_results = [
+            r for r in sheet_results.values()
+            if not r['error'] and r['metadata']['filename'] == filename and len(r['processed_data']) > 0
+        ]
+        if not file_results:
+            continue
         
-        finally:
-            # Clean up temporary file - handle Windows file locking gracefully
-            if temp_path.exists():
-                try:
-                    temp_path.unlink()
-                except (PermissionError, OSError) as e:
-                    # Windows file locking - ignore cleanup error, file will be cleaned by OS
-                    logger.debug(f"Could not delete temp file {temp_path}: {e}")
-                    pass
+        try:
+            # Prefix plate IDs with the sheet's position so sheets sharing a
+            # PlateID stay separate plates in the combined frame
+            edge_frame = pd.concat(
+                [
+                    r['processed_data'][['Row', 'Col', 'Z_lptA']].assign(
+                        PlateID=f"{i}:" + r['processed_data']['PlateID'].astype(str)
+                    )
+                    for i, r in enumerate(file_results)
+                ],
+                ignore_index=True
+            )
+            file_edge_results = edge_detector.detect_edge_effects_dataframe(edge_frame, metric="Z_lptA")
+        except Exception as e:
+            logger.warning(f"Edge effect detection failed for {filename}: {e}")
+            continue
+        
+        edge_by_sheet = {i: [] for i in range(len(file_results))}
+        for res in file_edge_results:
+            sheet_index, _, plate_id = res.plate_id.partition(':')
+            edge_by_sheet[int(sheet_index)].append(res._replace(plate_id=plate_id))
+        
+        for i, r in enumerate(file_results):
+            r['edge_results'] = edge_by_sheet[i]
+            r['edge_max_warning'] = max_warning_level(r['edge_results'])
+    
+    # Hit calling: one analysis over every successful plate, split back per sheet
+    if active_hit_config:
+        # Keyed by sheet, since PlateIDs can repeat across sheets
+        hit_results = {
+            sheet_key: r
+            for sheet_key, r in sheet_results.items()
+            if not r['error'] and len(r['processed_data']) > 0
+        }
+        try:
+            sheet_analyses = analyze_multi_plate_hits(
+                {sheet_key: r['processed_data'] for sheet_key, r in hit_results.items()}, active_hit_config
+            )['plate_analyses']
+        except Exception as e:
+            logger.warning(f"Hit calling failed: {e}")
+            sheet_analyses = {}
+        
+        for sheet_key, analysis in sheet_analyses.items():
+            r = hit_results[sheet_key]
+            r['hit_calling_results'] = summarize_plate_analyses({r['metadata']['plate_id']: analysis})
+    
+    # Analysis is done; keep the per-sheet frames Arrow-backed for display and
+    # give each one an id for the display caches
+    for r in sheet_results.values():
+        if not r['error']:
+            r['processed_data'] = to_arrow_dtypes(r['processed_data'])
+            r['data_key'] = uuid.uuid4().hex
     
     return sheet_results
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def combined_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize processed data for the combined CSV download.
+    
+    Cached on the DataFrame contents so reruns of the Summary tab reuse the
+    bytes instead of re-formatting every well. Internal grid index columns
+    are left out of the export.
+    """
+    return df.drop(columns=GRID_INDEX_COLUMNS, errors='ignore').to_csv(index=False).encode('utf-8')
+
+
+def display_table_and_csv(df: pd.DataFrame) -> Tuple[Any, bytes]:
+    """Prepare a display table for st.dataframe and its download button.
+    
+    With pyarrow available the frame is converted to an Arrow table once;
+    Streamlit renders that table without its own pandas conversion and
+    Arrow's multithreaded C++ CSV writer produces the download from the
+    same buffers. Without pyarrow the frame is returned as-is and pandas
+    writes the CSV. Arrow quotes text fields and writes booleans as
+    true/false; both forms read back identically with pandas.
+    
+    Returns:
+        (table to pass to st.dataframe, CSV bytes)
+    """
+    sink = io.BytesIO()
+    if PYARROW_AVAILABLE:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, sink)
+        return table, sink.getvalue()
+    df.to_csv(sink, index=False, encoding='utf-8')
+    return df, sink.getvalue()
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy and Enum values for the stdlib JSON fallback."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def bundle_json_bytes(obj: Any) -> bytes:
+    """Serialize bundle metadata as indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def analysis_bundle_bytes(df: pd.DataFrame,
+                          summary: Dict[str, Any],
+                          edge_df: pd.DataFrame) -> bytes:
+    """Build the ZIP analysis bundle (CSV, processing summary, edge effects).
+    
+    Args:
+        df: Processed plate data
+        summary: Processing summary
+        edge_df: Edge effect results table (empty to omit)
+        
+    Returns:
+        ZIP archive contents
+    """
+    zip_buffer = io.BytesIO()
+    # Fastest deflate level: the CSV dominates the bundle and level 1 keeps most
+    # of the size reduction for a fraction of the default level's CPU time
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        # Add CSV data
+        zip_file.writestr("combined_data.csv", combined_csv_bytes(df))
+        
+        # Add processing summary
+        zip_file.writestr("processing_summary.json", bundle_json_bytes(summary))
+        
+        # Add edge effect results if available
+        if not edge_df.empty:
+            zip_file.writestr("edge_effects.csv", edge_df.to_csv(index=False))
+    
+    return zip_buffer.getvalue()
+
+
+# Static reference text for the Summary tab
+_QUICK_REF_MD = """\
+**⚡ At-a-Glance Summary**
+
+| **Measurement** | **Biological Meaning** | **Hit Criteria** |
+|----------------|------------------------|------------------|
+| **lptA Z-score** | LPS transport stress | ≥ 2.0 (+ viability) |
+| **ldtD Z-score** | Peptidoglycan remodeling | ≥ 2.0 (+ viability) |
+| **WT Growth** | Intact OM resistance | > 80% (normal) |
+| **ΔtolC Growth** | Compromised OM sensitivity | ≤ 80% (inhibited) |
+| **SA Growth** | Gram-positive control | > 80% (unaffected) |
+
+**🎯 Hit Classification:**
+- **Reporter Hit:** lptA OR ldtD activated + viable
+- **Vitality Hit:** WT>80% + ΔtolC≤80% + SA>80%
+- **Platform Hit:** Reporter Hit AND Vitality Hit
+
+**📊 Expected Rates (from 880 extracts):**
+- Reporter hits: ~8% | Vitality hits: ~6.5% | Platform hits: ~1%
+
+**⚠️ Key Quality Checks:**
+- Viability: BT ≥ 30% of plate median
+- Edge effects: Check spatial bias warnings  
+- B-scores: Use when systematic row/column bias detected
+
+**📐 Key Formulas:**
+"""
+
+_INTERP_HITS_MD = """\
+**Understanding Your Screening Results**
+
+### 🔬 Reporter Hits (Stage 1): Biological Response
+
+**High lptA Z-scores (≥ 2.0):**
+• **Mechanistic interpretation**: σE stress response activation
+• **Biological meaning**: LPS transport disruption, OM protein misfolding
+• **Pathway specificity**: Outer membrane biogenesis stress
+• **Clinical relevance**: Targets essential OM assembly machinery
+
+**High ldtD Z-scores (≥ 2.0):**
+• **Mechanistic interpretation**: Cpx envelope stress activation
+• **Biological meaning**: Peptidoglycan remodeling, structural compensation
+• **Cellular response**: Adaptive mechanism to maintain envelope integrity
+• **Indicator function**: Detects combined OM/peptidoglycan perturbation
+
+**Dual-positive reporters (lptA+ and ldtD+):**
+• **Highest confidence**: Orthogonal evidence of OM disruption
+• **Synergistic stress**: Multiple envelope systems activated simultaneously
+• **Priority hits**: Most likely to have genuine OM-targeting activity
+• **Mechanism diversity**: May affect multiple envelope pathways
+
+### ⚡ Vitality Hits (Stage 2): Selectivity Profiling
+
+**Ideal selectivity pattern (WT > 80%, ΔtolC ≤ 80%, SA > 80%):**
+• **WT resistance**: Intact OM provides natural protection
+• **ΔtolC sensitivity**: Compromised efflux enhances compound accumulation
+• **S. aureus tolerance**: Lack of OM target confers resistance
+• **Therapeutic relevance**: Selective targeting minimizes host toxicity
+
+**Alternative patterns and interpretations:**
+• **All strains sensitive**: Broad-spectrum cytotoxin (deprioritize)
+• **Only WT affected**: Unusual, may target WT-specific pathways
+• **Variable S. aureus**: May have secondary Gram-positive targets
+• **Dose-dependent**: Different patterns at varying concentrations
+
+### 🎯 Platform Hits (Stage 3): High-Confidence Candidates
+
+**Integration of biological and phenotypic evidence:**
+• **Mechanistic plausibility**: Reporter activation consistent with OM targeting
+• **Selectivity confirmation**: Differential strain susceptibility pattern
+• **Statistical significance**: Robust scoring across multiple metrics
+• **Quality control**: Passes viability gating and spatial artifact checks
+
+**Therapeutic potential:**
+• **Antibiotic adjuvants**: Enhance existing drug efficacy
+• **Combination therapy**: Synergize with conventional antibiotics
+• **Resistance circumvention**: Overcome OM-mediated resistance
+• **Novel mechanisms**: Alternative to traditional antimicrobial targets
+
+**Expected outcomes:**
+• **Hit rate**: ~1% of screened compounds (library-dependent)
+• **Validation success**: 10-30% confirm in secondary assays
+• **Lead compounds**: 1-5% advance to optimization
+• **Clinical candidates**: <1% reach preclinical development
+"""
+
+_INTERP_QUALITY_MD = """\
+### 📊 Statistical Quality Indicators
+
+**Z-score interpretation:**
+• **Z ≥ 3.0**: Strong hits, high confidence (>99.7% significance)
+• **Z 2.0-3.0**: Moderate hits, good confidence (95-99.7% significance)
+• **Z 1.5-2.0**: Weak hits, consider with caution (87-95% significance)
+• **Z < 1.5**: Below detection threshold, likely inactive
+
+**B-score vs. Raw Z-score comparison:**
+• **Concordant hits**: Both methods agree → High confidence
+• **B-score exclusive**: May be artifacts corrected by spatial adjustment
+• **Raw Z exclusive**: May be systematic bias amplified by B-scoring
+• **Magnitude differences**: B-scoring can enhance or diminish signals
+
+**Viability gating impact:**
+• **ATP-filtered hits**: Focus on viable cellular responses
+• **Below threshold**: May indicate cytotoxicity or assay failure
+• **Borderline viability**: Interpret with caution, may be stress-induced
+• **Viability recovery**: Some compounds may allow adaptation
+
+### 🗺️ Spatial Pattern Recognition
+
+**Legitimate biological patterns:**
+• **Random distribution**: Expected for genuine bioactive compounds
+• **Clustered hits**: May indicate structural similarity or concentration gradients
+• **Isolated signals**: Single well hits require confirmation
+• **Replicate consistency**: Activity reproducible across plate replicates
+
+**Technical artifacts to avoid:**
+• **Edge enhancement**: Systematic elevation at plate periphery
+• **Row/column streaks**: Linear patterns suggesting systematic bias
+• **Corner effects**: Extreme values in plate corners
+• **Gradient patterns**: Smooth transitions suggesting technical variation
+
+### 📈 Multi-Plate Analysis
+
+**Cross-plate validation:**
+• **Reproducible hits**: Active across multiple plates/experiments
+• **Plate-specific artifacts**: Activity limited to single plates
+• **Concentration-response**: Consistent potency across dose ranges
+• **Batch effects**: Account for reagent/media lot variations
+"""
+
+_INTERP_TROUBLESHOOTING_MD = """\
+### ⚠️ Common Issues and Troubleshooting
+
+**Low hit rates (<0.1%):**
+• **Library composition**: May lack bioactive compounds
+• **Assay sensitivity**: Thresholds too stringent
+• **Screening conditions**: Suboptimal compound concentrations
+• **Reporter system**: Check positive controls and strain viability
+
+**Excessive hit rates (>5%):**
+• **Systematic bias**: Check for edge effects or pipetting errors
+• **Contamination**: Bacterial, chemical, or cross-well contamination
+• **Assay artifacts**: Non-specific compound interactions
+• **Threshold adjustment**: Consider more stringent cutoffs
+
+**Inconsistent selectivity patterns:**
+• **Strain viability**: Verify all strains grow comparably
+• **OM integrity**: Confirm ΔtolC strain phenotype
+• **Growth conditions**: Optimize media and incubation parameters
+• **Compound stability**: Check for degradation or precipitation
+
+**Edge effects dominating results:**
+• **Plate handling**: Review pipetting and incubation protocols
+• **Environmental control**: Minimize temperature/humidity gradients
+• **Plate sealing**: Prevent evaporation and contamination
+• **B-score correction**: Apply spatial bias correction methods
+
+**Viability issues:**
+• **Low ATP signals**: Check bacterial growth conditions
+• **Reagent quality**: Verify BacTiter-Glo performance
+• **Incubation timing**: Optimize assay duration
+• **Threshold adjustment**: May need library-specific optimization
+
+### 🔄 Follow-up Studies
+
+**Secondary assays for hit validation:**
+• **Dose-response curves**: Confirm concentration-dependent activity
+• **Time-course studies**: Assess kinetics of reporter activation
+• **Mechanism-of-action**: Additional envelope stress markers
+• **Synergy testing**: Combination with known antibiotics
+
+**Orthogonal validation methods:**
+• **Live/dead staining**: Direct viability assessment
+• **OM permeability**: Fluorescent probe uptake assays
+• **Electron microscopy**: Morphological changes
+• **Proteomics**: Global stress response analysis
+
+### 📋 Quality Control Checklist
+
+**Before concluding analysis:**
+- ✅ Check positive/negative controls
+- ✅ Verify edge effect warnings
+- ✅ Review spatial heatmaps for artifacts
+- ✅ Confirm viability gating appropriateness
+- ✅ Compare B-score vs. raw Z-score results
+- ✅ Assess hit distribution across plates
+- ✅ Validate selectivity patterns make biological sense
+"""
+
+
+_QC_REFERENCES_MD = """\
+**Primary Literature:**
+
+**🔬 Outer Membrane Biology & LPS Transport:**
+1. **Silhavy, T.J., Kahne, D. and Walker, S.** (2010) 'The Bacterial Cell Envelope', *Cold Spring Harbor Perspectives in Biology*, 2(5), p. a000414.
+   - Foundational review of Gram-negative cell envelope structure and function
+
+2. **Yoon, Y., Song, S.** (2024) 'Structural Insights into the Lipopolysaccharide Transport (Lpt) System as a Novel Antibiotic Target', *J Microbiol.* 62, 261–275.
+   - Recent structural biology of LPS transport machinery
+
+3. **Martorana, A.M. et al.** (2011) 'Complex transcriptional organization regulates an Escherichia coli locus implicated in lipopolysaccharide biogenesis' *Research in Microbiology*, 162(5), pp. 470–482.
+   - lptA gene regulation and σE stress response pathway
+
+**⚡ Peptidoglycan Remodeling & Stress Response:**
+4. **Morè, N. et al.** (2019) 'Peptidoglycan Remodeling Enables Escherichia coli To Survive Severe Outer Membrane Assembly Defect' *mBio*, 10(1), p. 10.1128/mbio.02729-18.
+   - ldtD function and 3-3 crosslink formation during OM stress
+
+**🎯 OM Permeabilization & Antibiotic Sensitization:**
+5. **Chan, L.W. et al.** (2021) 'Selective Permeabilization of Gram-Negative Bacterial Membranes Using Multivalent Peptide Constructs for Antibiotic Sensitization' *ACS Infectious Diseases*, 7(4), p. 721.
+   - Proof-of-concept for OM permeabilizer + antibiotic combination therapy
+
+6. **Zhu, S. et al.** (2024) 'The inactivation of tolC sensitizes Escherichia coli to perturbations in lipopolysaccharide transport,' *iScience*, 27(5), p. 109592.
+   - ΔtolC strain hypersensitivity to OM perturbation
+
+**📊 Statistical Methods:**
+7. **Tukey, J.W.** (1977) 'Exploratory Data Analysis', Addison-Wesley.
+   - Median polish algorithm for B-score calculation
+
+8. **Rousseeuw, P.J. and Croux, C.** (1993) 'Alternatives to the median absolute deviation', *Journal of the American Statistical Association*, 88, pp. 1273-1283.
+   - Robust statistics and MAD-based scaling
+
+**🏆 Funding Acknowledgment:**
+- This work is supported by the **BREAKthrough project**, funded by the European Union
+- Grant focus: Novel antimicrobial strategies against Gram-negative pathogens
+"""
+
+# Optional QC report sections, in manifest order
+QC_REPORT_SECTIONS = ('formulas', 'methodology', 'edge_effects', 'bscore_details')
+
+_QC_REPORT_SUMMARY_TMPL = """\
+# Plate Data Processing QC Report
+Generated: {report_date}
+
+## Summary
+- Plates processed: {plates_processed}
+- Total wells: {total_wells}
+- Viability threshold: {viability_threshold}
+- Z-score cutoff: {z_cutoff}
+- B-scoring applied: {b_scoring_applied}
+"""
+
+_QC_FORMULAS_MD = """\
+## Scientific Calculation Formulas
+### 1. Reporter Signal Processing
+**BetaGlo/BacTiter Ratios (Normalized Reporter Activity):**
+- Ratio_lptA = BG_lptA / BT_lptA
+- Ratio_ldtD = BG_ldtD / BT_ldtD
+
+**Biochemical Basis:**
+- BG (BetaGlo): β-galactosidase activity from lacZ reporter
+- BT (BacTiter): ATP-dependent luciferase activity (viability)
+- Ratio normalizes reporter signal to viable cell count
+
+### 2. Growth Measurements
+**OD Normalization (Plate-Relative Growth):**
+- OD_WT_norm = OD_WT / median(OD_WT_plate)
+- OD_tolC_norm = OD_tolC / median(OD_tolC_plate)
+- OD_SA_norm = OD_SA / median(OD_SA_plate)
+
+### 3. Robust Statistical Scoring
+**Robust Z-scores (MAD-based, outlier-resistant):**
+- Z = (value - median) / (1.4826 × MAD)
+- MAD = median(|values - median(values)|)
+- 1.4826 = consistency factor for normal distributions
+
+**Statistical Advantages:**
+- Resistant to outliers (up to 50% contamination)
+- No assumption of normal distribution
+- More stable than mean/standard deviation
+"""
+
+_QC_BSCORE_FORMULA_MD = """\
+### 4. B-score Spatial Correction
+**Median Polish Algorithm:**
+1. Subtract row medians: X'ᵢⱼ = Xᵢⱼ - median(row_i)
+2. Subtract column medians: X''ᵢⱼ = X'ᵢⱼ - median(col_j)
+3. Iterate until convergence (tolerance = 1e-6)
+4. Apply robust scaling: B = X'' / (1.4826 × MAD(X''))
+"""
+
+_QC_GATING_TMPL = """\
+### 5. Viability Gating
+**ATP-based Viability Filter:**
+- viability_ok = BT ≥ {viability_threshold} × median(BT_plate)
+- Excludes wells with insufficient ATP for reliable measurements
+- Based on D-luciferin + ATP → oxyluciferin + light reaction
+
+### 6. Multi-Stage Hit Calling
+**Stage 1 - Reporter Hits:**
+- lptA_hit = (Z_lptA ≥ {z_cutoff}) AND viability_ok
+- ldtD_hit = (Z_ldtD ≥ {z_cutoff}) AND viability_ok
+- reporter_hit = lptA_hit OR ldtD_hit
+
+**Stage 2 - Vitality Hits:**
+- WT_resist = OD_WT_norm > 0.8 (intact OM protection)
+- tolC_sensitive = OD_tolC_norm ≤ 0.8 (compromised OM vulnerability)
+- SA_unaffected = OD_SA_norm > 0.8 (no OM target)
+- vitality_hit = WT_resist AND tolC_sensitive AND SA_unaffected
+
+**Stage 3 - Platform Hits:**
+- platform_hit = reporter_hit AND vitality_hit
+- High-confidence OM permeabilizers with dual evidence
+"""
+
+_QC_METHODOLOGY_TMPL = """\
+## Methodology
+This analysis follows the plate data processing pipeline:
+1. Data validation and column mapping
+2. Ratio calculations (BG/BT)
+3. Robust Z-score calculation using median and MAD
+4. Viability gating based on ATP levels
+{bscore_step}6. Edge effect detection and quality assessment
+"""
+
+_FOOTER_HTML = """\
+---
+<div style='text-align: center; padding: 2rem 0 1rem 0; color: #6b7280;'>
+    <p style='margin: 0; font-size: 0.9rem;'>
+        🏆 <strong>BREAKthrough Project</strong> - Novel Antimicrobial Strategies Against Gram-Negative Pathogens
+    </p>
+    <p style='margin: 0.5rem 0 0 0; font-size: 0.8rem;'>
+        🇪🇺 Funded by the European Union | 🧬 Advancing Combination Therapy Research
+    </p>
+    <p style='margin: 0.5rem 0 0 0; font-size: 0.7rem; color: #9ca3af;'>
+        Platform for identifying outer membrane permeabilizers as antibiotic adjuvants
+    </p>
+</div>
+"""
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def qc_edge_effects_section(data_key: str, _edge_results: List[EdgeEffectResult]) -> str:
+    """Format the edge effects section of the QC text report.
+    
+    Keyed on ``data_key`` like the hit tables, so pressing Generate again
+    for the same dataset reuses the text. ``_edge_results`` is not hashed.
+    """
+    plate_sections = []
+    for result in _edge_results:
+        correlations = "".join(
+            f"- {name} correlation: {value:.3f}\n"
+            for name, value in (("Row", result.row_correlation), ("Column", result.col_correlation))
+            if not math.isnan(value)
+        )
+        plate_sections.append(
+            f"### Plate {result.plate_id}\n"
+            f"- Warning level: {result.warning_level.value}\n"
+            f"- Effect size (d): {result.effect_size_d:.3f}\n"
+            f"- Edge wells: {result.n_edge_wells}\n"
+            f"- Interior wells: {result.n_interior_wells}\n"
+            f"{correlations}"
+        )
+    return "\n".join(["## Edge Effects Analysis", *plate_sections])
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def qc_report_bytes(data_key: str,
+                    _edge_results: List[EdgeEffectResult],
+                    manifest: Dict[str, Any]) -> bytes:
+    """Build the QC text report described by a report manifest.
+    
+    Passed to the download button as a deferred payload, so the text is
+    only assembled when the user actually downloads it. The manifest holds
+    the settings and included sections; repeated downloads of the same
+    report reuse the cached bytes. ``_edge_results`` is not hashed.
+    
+    Args:
+        data_key: Identifier of the processed dataset
+        _edge_results: Edge effect results for the dataset
+        manifest: Report manifest built when Generate was pressed
+        
+    Returns:
+        UTF-8 encoded report text
+    """
+    sections = manifest['sections_included']
+    apply_b_scoring = manifest['b_scoring_applied']
+    
+    # For now, create a comprehensive text report
+    # (PDF generation would require additional libraries like reportlab)
+    report_sections = [_QC_REPORT_SUMMARY_TMPL.format(**manifest)]
+    
+    # Edge effects
+    if sections['edge_effects'] and _edge_results:
+        report_sections.append(qc_edge_effects_section(data_key, _edge_results))
+    
+    # Complete Scientific Formulas
+    if sections['formulas']:
+        report_sections.append(_QC_FORMULAS_MD)
+        if apply_b_scoring:
+            report_sections.append(_QC_BSCORE_FORMULA_MD)
+        report_sections.append(_QC_GATING_TMPL.format(
+            viability_threshold=manifest['viability_threshold'], z_cutoff=manifest['z_cutoff']
+        ))
+    
+    # Methodology
+    if sections['methodology']:
+        report_sections.append(_QC_METHODOLOGY_TMPL.format(
+            bscore_step="5. B-scoring for row/column bias correction\n" if apply_b_scoring else ""
+        ))
+    
+    return "\n".join(report_sections).encode('utf-8')
+
+
+def render_summary_reference() -> None:
+    """Render the static Summary tab reference expanders.
+
+    The text lives in module-level constants, so each rerun only emits the
+    elements instead of rebuilding the strings.
+    """
+    # Quick reference card
+    with st.expander("📋 Quick Reference Card", expanded=False):
+        st.markdown(_QUICK_REF_MD)
+        
+        st.latex(r"Z = \frac{x - \text{median}(X)}{1.4826 \times \text{MAD}(X)}")
+        st.caption("Robust Z-score calculation")
+        
+        st.latex(r"Ratio = \frac{BG}{BT} \quad \text{(Reporter Signal / ATP Viability)}")
+        st.caption("Normalized reporter activity")
+    
+    # Results interpretation guide
+    with st.expander("🧬 Results Interpretation Guide", expanded=False):
+        # Create interpretation tabs for better organization
+        interp_tab1, interp_tab2, interp_tab3 = st.tabs([
+            "🎯 Hit Classification", "📊 Data Quality", "⚠️ Troubleshooting"
+        ])
+        
+        with interp_tab1:
+            st.markdown(_INTERP_HITS_MD)
+        
+        with interp_tab2:
+            st.markdown(_INTERP_QUALITY_MD)
+        
+        with interp_tab3:
+            st.markdown(_INTERP_TROUBLESHOOTING_MD)
+
+
+def lazy_tabs(labels: List[str], key: str) -> List[Any]:
+    """Create tabs that track which one is open, so hidden tabs can be skipped.
+    
+    Switching tabs reruns the script and only the open tab reports
+    ``open=True``; callers guard each tab body with :func:`tab_is_open`.
+    Streamlit releases without stateful tabs fall back to plain tabs, which
+    always render every tab.
+    """
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return st.tabs(labels)
+
+
+def tab_is_open(tab: Any) -> bool:
+    """Whether a tab's body should run (always True for stateless tabs)."""
+    return getattr(tab, 'open', None) is not False
+
+
 def render_edge_effect_badge(warning_level: WarningLevel) -> str:
     """Render edge effect warning badge with appropriate styling."""
     level_colors = {
@@ -425,6 +1068,222 @@ def render_edge_effect_badge(warning_level: WarningLevel) -> str:
     return f'<span class="badge {color_class}">{warning_level.value}</span>'
 
 
+def identity_display_columns(columns: Tuple[str, ...]) -> List[str]:
+    """Resolve the plate and well identifier columns for a hit table.
+    
+    Each entry of :data:`DISPLAY_COLUMN_ALIASES` maps to the first spelling
+    present in ``columns``; a missing well column falls back to Row and Col.
+    """
+    resolved = {
+        canonical: next((alt for alt in alternatives if alt in columns), None)
+        for canonical, alternatives in DISPLAY_COLUMN_ALIASES.items()
+    }
+    
+    display_cols = [resolved['PlateID']] if resolved['PlateID'] else []
+    if resolved['Well']:
+        display_cols.append(resolved['Well'])
+    elif 'Row' in columns and 'Col' in columns:
+        display_cols.extend(['Row', 'Col'])
+    return display_cols
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def reporter_display_columns(columns: Tuple[str, ...],
+                             rank_by_reporter: str,
+                             apply_b_scoring: bool) -> Tuple[List[str], List[str]]:
+    """Choose the Reporter Hits table columns for a set of data columns.
+    
+    Depends only on the column names and display settings, so it is cached
+    separately from the row selection and survives changes to the hit count.
+    
+    Args:
+        columns: Column names of the processed data
+        rank_by_reporter: "Raw Z" or "B-score"
+        apply_b_scoring: Whether B-score columns were computed
+        
+    Returns:
+        (display columns present in the data, columns to round to 3 places)
+    """
+    # Essential columns
+    display_cols = identity_display_columns(columns) + ['Ratio_lptA', 'Ratio_ldtD']
+    
+    # Add Z-score columns
+    if rank_by_reporter == "B-score" and apply_b_scoring:
+        z_cols = ['B_Z_lptA', 'B_Z_ldtD', 'Z_lptA', 'Z_ldtD']  # Show both for comparison
+    else:
+        z_cols = ['Z_lptA', 'Z_ldtD']
+        if apply_b_scoring:
+            z_cols.extend(['B_Z_lptA', 'B_Z_ldtD'])  # Show B-scores too if available
+    
+    display_cols.extend(z_cols)
+    
+    # Add viability columns
+    viability_cols = [col for col in ['viable_lptA', 'viable_ldtD'] if col in columns]
+    display_cols.extend(viability_cols)
+    
+    # Add hit calling flag
+    display_cols.append('LumHit')
+    
+    # Filter to existing columns and remove duplicates
+    existing_display_cols = pd.Index(display_cols).unique().intersection(columns, sort=False).tolist()
+    
+    return existing_display_cols, ['Ratio_lptA', 'Ratio_ldtD'] + z_cols
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def vitality_display_columns(columns: Tuple[str, ...]) -> Tuple[List[str], List[str]]:
+    """Choose the Vitality Hits table columns for a set of data columns.
+    
+    Args:
+        columns: Column names of the processed data
+        
+    Returns:
+        (display columns present in the data, OD percentage columns)
+    """
+    # Essential columns
+    display_cols = identity_display_columns(columns)
+    
+    # Add OD percentage columns (key for vitality analysis)
+    od_pct_cols = [col for col in ['WT%', 'tolC%', 'SA%'] if col in columns]
+    display_cols.extend(od_pct_cols)
+    
+    # Add raw OD measurements for reference
+    od_raw_cols = [col for col in ['OD_WT', 'OD_tolC', 'OD_SA'] if col in columns]
+    display_cols.extend(od_raw_cols)
+    
+    # Add hit calling flag
+    display_cols.append('OMpatternOK')
+    
+    # Add Z-scores if available (for context)
+    
+    # Filter to existing columns and remove duplicates
+    existing_display_cols = pd.Index(display_cols).unique().intersection(columns, sort=False).tolist()
+    
+    return existing_display_cols, od_pct_cols
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def reporter_hits_display(data_key: str,
+                          _df: pd.DataFrame,
+                          rank_by_reporter: str,
+                          apply_b_scoring: bool,
+                          display_top_n_reporter: int) -> Optional[Tuple[pd.DataFrame, Any, bytes]]:
+    """Rank, slice and format the top reporter hits for the Reporter Hits tab.
+    
+    Cached on ``data_key`` (assigned when the data was processed) and the
+    display settings, so reruns triggered by unrelated widgets reuse the
+    table and its CSV instead of redoing the mask, ranking and formatting.
+    ``_df`` is not hashed.
+    
+    Args:
+        data_key: Identifier of the processed dataset
+        _df: Processed plate data
+        rank_by_reporter: "Raw Z" or "B-score"
+        apply_b_scoring: Whether B-score columns were computed
+        display_top_n_reporter: Number of hits to show
+        
+    Returns:
+        (display frame, table for st.dataframe, CSV bytes), or None if the
+        display columns are missing
+    """
+    reporter_hits_df = _df.loc[_df['reporter_hit'].to_numpy(dtype=bool, na_value=False)]
+    
+    # Rank hits by selected metric
+    if rank_by_reporter == "B-score" and apply_b_scoring and all(col in reporter_hits_df.columns for col in ['B_Z_lptA', 'B_Z_ldtD']):
+        rank_cols = ['B_Z_lptA', 'B_Z_ldtD']
+    elif all(col in reporter_hits_df.columns for col in ['Z_lptA', 'Z_ldtD']):
+        rank_cols = ['Z_lptA', 'Z_ldtD']
+    else:
+        rank_cols = None
+    
+    if rank_cols:
+        # Max |Z| of the two reporters on the raw arrays; fmax skips a
+        # missing reporter and wells with neither rank last
+        scores = np.abs(reporter_hits_df[rank_cols].to_numpy(dtype=float))
+        rank_score = np.fmax(scores[:, 0], scores[:, 1])
+        rank_score = np.nan_to_num(rank_score, nan=-np.inf)
+    else:
+        rank_score = np.zeros(len(reporter_hits_df))
+    
+    # Partial selection of the top N row labels instead of a full sort; only
+    # these rows are copied and formatted below
+    top_index = reporter_hits_df.index[top_n_indices(rank_score, display_top_n_reporter)]
+    
+    existing_display_cols, numeric_cols = reporter_display_columns(
+        tuple(reporter_hits_df.columns), rank_by_reporter, apply_b_scoring
+    )
+    
+    if not existing_display_cols:
+        return None
+    
+    # Format the displayed rows only
+    reporter_display = narrow_display_floats(reporter_hits_df.loc[top_index, existing_display_cols])
+    
+    # Round numeric columns in a single call, checking dtypes once
+    is_num = {col: pd.api.types.is_numeric_dtype(dtype) for col, dtype in reporter_display.dtypes.items()}
+    reporter_display = reporter_display.round({col: 3 for col in numeric_cols if is_num.get(col)})
+    
+    return (reporter_display, *display_table_and_csv(reporter_display))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def vitality_hits_display(data_key: str,
+                          _df: pd.DataFrame,
+                          sort_by_vitality: str,
+                          display_top_n_vitality: int) -> Optional[Tuple[pd.DataFrame, Any, bytes]]:
+    """Select and format the top vitality hits for the Vitality Hits tab.
+    
+    Cached like :func:`reporter_hits_display`; ``_df`` is not hashed.
+    
+    Args:
+        data_key: Identifier of the processed dataset
+        _df: Processed plate data
+        sort_by_vitality: Sort option label from the tab's selectbox
+        display_top_n_vitality: Number of hits to show
+        
+    Returns:
+        (display frame, table for st.dataframe, CSV bytes), or None if the
+        display columns are missing
+    """
+    vitality_hits_df = _df.loc[_df['vitality_hit'].to_numpy(dtype=bool, na_value=False)]
+    
+    # Pick the top N row labels by the selected metric (partial selection, no
+    # full sort); only these rows are copied and formatted below
+    sort_options = {
+        "tolC% (ascending)": ('tolC%', True),
+        "WT% (descending)": ('WT%', False),
+        "SA% (descending)": ('SA%', False),
+    }
+    sort_col, ascending = sort_options.get(sort_by_vitality, (None, False))
+    if sort_col in vitality_hits_df.columns:
+        sort_values = vitality_hits_df[sort_col].to_numpy(dtype=float, na_value=np.nan)
+        top_index = vitality_hits_df.index[top_n_indices(sort_values, display_top_n_vitality, ascending)]
+    else:
+        top_index = vitality_hits_df.index[:display_top_n_vitality]
+    
+    existing_display_cols, od_pct_cols = vitality_display_columns(tuple(vitality_hits_df.columns))
+    
+    if not existing_display_cols:
+        return None
+    
+    # Format the displayed rows only
+    vitality_display = narrow_display_floats(vitality_hits_df.loc[top_index, existing_display_cols])
+    
+    # Check column dtypes once for both rounding steps
+    is_num = {col: pd.api.types.is_numeric_dtype(dtype) for col, dtype in vitality_display.dtypes.items()}
+    
+    # Convert OD percentages to percentage format (one 2-D block op) and round
+    pct_cols = [col for col in od_pct_cols if is_num.get(col)]
+    if pct_cols:
+        vitality_display[pct_cols] = (vitality_display[pct_cols] * 100).round(1)
+    
+    # Round other numeric columns in a single call
+    numeric_cols = ['Z_lptA', 'Z_ldtD', 'B_Z_lptA', 'B_Z_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA']
+    vitality_display = vitality_display.round({col: 3 for col in numeric_cols if is_num.get(col)})
+    
+    return (vitality_display, *display_table_and_csv(vitality_display))
+
+
 def get_plate_families(df: pd.DataFrame) -> Dict[str, List[str]]:
     """
     Group plates by their parent microbial extract number.
@@ -460,26 +1319,100 @@ def get_plate_families(df: pd.DataFrame) -> Dict[str, List[str]]:
     return families
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def dataset_plate_families(data_key: str, _df: pd.DataFrame) -> Dict[str, List[str]]:
+    """Cached :func:`get_plate_families` for a processed dataset.
+    
+    Keyed on ``data_key`` like the hit tables, so the Heatmaps tab does not
+    rescan PlateID and regroup the plates on every rerun.
+    """
+    return get_plate_families(_df)
+
+
+@st.cache_resource(max_entries=16)
+def hit_flow_sankey(total_wells: int,
+                    reporter_hits: int,
+                    vitality_hits: int,
+                    platform_hits: int) -> go.Figure:
+    """Build the Sankey diagram of the hit calling pipeline.
+    
+    The figure depends only on the four counts, so one shared figure per set
+    of counts is kept instead of rebuilding and revalidating it each rerun.
+    Callers must not modify the returned figure.
+    """
+    fig = go.Figure(data=[go.Sankey(
+        node = dict(
+            pad = 15,
+            thickness = 20,
+            line = dict(color = "black", width = 0.5),
+            label = [
+                f"Total Wells<br>({total_wells})",
+                f"Reporter Hits<br>({reporter_hits})", 
+                f"Vitality Hits<br>({vitality_hits})",
+                f"Platform Hits<br>({platform_hits})"
+            ],
+            color = ["lightblue", "orange", "lightgreen", "crimson"]
+        ),
+        link = dict(
+            source = [0, 0, 1, 2],
+            target = [1, 2, 3, 3], 
+            value = [reporter_hits, vitality_hits, platform_hits, platform_hits],
+            color = ["rgba(255,165,0,0.6)", "rgba(144,238,144,0.6)", 
+                   "rgba(220,20,60,0.8)", "rgba(220,20,60,0.8)"]
+        )
+    )])
+    
+    fig.update_layout(
+        title="OM Permeabilizer Discovery Pipeline",
+        height=400,
+        margin=dict(l=50, r=50, t=60, b=50)
+    )
+    
+    return fig
+
+
+def z_histogram(values: pd.Series, title: str, color: str, cutoff: float) -> go.Figure:
+    """Histogram of a Z-score column with dashed +/- threshold lines.
+    
+    Bins are counted with np.histogram and drawn as a bar trace, so the
+    browser receives 50 bar heights instead of every well's value.
+    """
+    data = values.to_numpy(dtype=float, na_value=np.nan)
+    counts, edges = np.histogram(data[~np.isnan(data)], bins=50)
+    
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color,
+        name=values.name
+    ))
+    fig.update_layout(title=title, xaxis_title=values.name, yaxis_title="count", bargap=0)
+    fig.add_vline(x=cutoff, line_dash="dash", line_color="red", annotation_text=f"Threshold: {cutoff}")
+    fig.add_vline(x=-cutoff, line_dash="dash", line_color="red")
+    
+    return fig
+
+
 def create_plate_heatmap(df: pd.DataFrame, metric: str, plate_id: str) -> go.Figure:
     """Create a heatmap for a single plate."""
-    plate_df = df[df['PlateID'] == plate_id].copy() if 'PlateID' in df.columns else df.copy()
+    plate_df = df[df['PlateID'] == plate_id] if 'PlateID' in df.columns else df
     
     # Create 8x12 matrix
     matrix = np.full((8, 12), np.nan)
     
-    # Map row letters to indices
-    row_mapping = {chr(ord('A') + i): i for i in range(8)}
-    
-    for _, row in plate_df.iterrows():
-        if 'Row' in row and 'Col' in row and metric in row:
-            try:
-                row_idx = row_mapping.get(str(row['Row']).upper(), None)
-                col_idx = int(row['Col']) - 1
-                
-                if row_idx is not None and 0 <= col_idx < 12:
-                    matrix[row_idx, col_idx] = row[metric]
-            except (ValueError, TypeError):
-                continue
+    if metric in plate_df.columns and {'Row', 'Col'}.issubset(plate_df.columns):
+        # Processed plates carry precomputed grid indices; derive them otherwise
+        if not set(GRID_INDEX_COLUMNS).issubset(plate_df.columns):
+            plate_df = add_grid_indices(plate_df)
+        
+        # Scatter all wells into the matrix at once
+        row_idx = plate_df['_RowIdx'].to_numpy(dtype=float, na_value=np.nan)
+        col_idx = plate_df['_ColIdx'].to_numpy(dtype=float, na_value=np.nan)
+        values = pd.to_numeric(plate_df[metric], errors='coerce').to_numpy(dtype=float)
+        
+        valid = (row_idx >= 0) & (row_idx < 8) & (col_idx >= 0) & (col_idx < 12)
+        matrix[row_idx[valid].astype(int), col_idx[valid].astype(int)] = values[valid]
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
@@ -502,6 +1435,36 @@ def create_plate_heatmap(df: pd.DataFrame, metric: str, plate_id: str) -> go.Fig
     return fig
 
 
+@st.cache_resource(show_spinner=False, max_entries=64)
+def family_heatmap(data_key: str,
+                   _family_df: pd.DataFrame,
+                   family: str,
+                   metric: str,
+                   label: str) -> Optional[go.Figure]:
+    """Build the Heatmaps tab figure of one metric for a plate family.
+    
+    Uses the first plate of the family with data for ``metric``. Figures are
+    shared per dataset, family and metric, so switching data types or
+    reopening the tab reuses them instead of rebuilding the Plotly objects.
+    ``_family_df`` is not hashed. Callers must not modify the returned figure.
+    
+    Returns:
+        The heatmap figure, or None if no plate has data for ``metric``
+    """
+    plates_with_metric = _family_df.loc[_family_df[metric].notna(), 'PlateID'].unique()
+    if len(plates_with_metric) == 0:
+        return None
+    
+    plate_id = plates_with_metric[0]
+    fig = create_plate_heatmap(_family_df, metric, plate_id)
+    fig.update_layout(
+        title=dict(text=f"{label}<br>{plate_id}", font=dict(size=12)),
+        height=300,
+        margin=dict(t=60, b=40, l=40, r=40)
+    )
+    return fig
+
+
 def main() -> None:
     """Main application function."""
     # Load configuration
@@ -557,27 +1520,35 @@ def main() -> None:
     st.title("Plate Data Processing Platform")
     st.subheader("Normalization, scoring, B-scoring, and reporting")
     
+    # Streamlit reruns this whole function on every interaction; bind the
+    # session state proxy once instead of resolving st.session_state each read
+    ss = st.session_state
+    
     # Initialize session state
-    if 'processed_data' not in st.session_state:
-        st.session_state.processed_data = None
-    if 'edge_results' not in st.session_state:
-        st.session_state.edge_results = []
-    if 'processing_summary' not in st.session_state:
-        st.session_state.processing_summary = {}
-    if 'hit_calling_results' not in st.session_state:
-        st.session_state.hit_calling_results = {}
+    if 'processed_data' not in ss:
+        ss.processed_data = None
+    if 'edge_results' not in ss:
+        ss.edge_results = []
+    if 'edge_max_warning' not in ss:
+        ss.edge_max_warning = None
+    if 'processing_summary' not in ss:
+        ss.processing_summary = {}
+    if 'hit_calling_results' not in ss:
+        ss.hit_calling_results = {}
+    if 'qc_report' not in ss:
+        ss.qc_report = None
     # Multi-stage hit calling is always enabled for dual-readout screening
-    st.session_state.multi_stage_enabled = True
+    ss.multi_stage_enabled = True
     
     # Multi-sheet session state
-    if 'sheet_data' not in st.session_state:
-        st.session_state.sheet_data = {}
-    if 'current_sheet' not in st.session_state:
-        st.session_state.current_sheet = None
-    if 'available_sheets' not in st.session_state:
-        st.session_state.available_sheets = []
-    if 'multi_sheet_mode' not in st.session_state:
-        st.session_state.multi_sheet_mode = False
+    if 'sheet_data' not in ss:
+        ss.sheet_data = {}
+    if 'current_sheet' not in ss:
+        ss.current_sheet = None
+    if 'available_sheets' not in ss:
+        ss.available_sheets = []
+    if 'multi_sheet_mode' not in ss:
+        ss.multi_sheet_mode = False
     
     # Sidebar for file upload and configuration
     with st.sidebar:
@@ -602,32 +1573,31 @@ def main() -> None:
         )
         
         # Show sample data info when toggle is on
+        sample_loaded = ss.get('sample_loaded', False)
         if use_sample_data:
             st.info("📊 Using pre-loaded sample data for demonstration")
             # Load sample data into session state
-            if 'sample_loaded' not in st.session_state or not st.session_state.sample_loaded:
+            if not sample_loaded:
                 try:
-                    with open('sample_plate_data.csv', 'rb') as f:
-                        sample_data = f.read()
-                    st.session_state.sample_loaded = True
-                    st.session_state.sample_data = {'sample_plate_data.csv': sample_data}
+                    ss.sample_loaded = sample_loaded = True
+                    ss.sample_data = {'sample_plate_data.csv': load_sample_bytes()}
                 except FileNotFoundError:
                     st.error("Sample data file not found. Please generate it first by running: python sample_data_generator.py")
                     use_sample_data = False
         
         # Multi-sheet processing mode toggle
+        has_multi_sheet_files = False
         if uploaded_files:
             st.success(f"Uploaded {len(uploaded_files)} file(s)")
             
             # Check if any files have multiple sheets
-            has_multi_sheet_files = False
             for file in uploaded_files:
                 if file.name.endswith(('.xlsx', '.xls')):
                     try:
-                        excel_file = pd.ExcelFile(file)
-                        if len(excel_file.sheet_names) > 1:
+                        sheet_names = _upload_sheet_names(file)
+                        if len(sheet_names) > 1:
                             has_multi_sheet_files = True
-                            st.info(f"📊 {file.name}: {len(excel_file.sheet_names)} sheets detected")
+                            st.info(f"📊 {file.name}: {len(sheet_names)} sheets detected")
                         else:
                             st.info(f"📄 {file.name}: 1 sheet")
                     except Exception as e:
@@ -637,17 +1607,17 @@ def main() -> None:
                 st.subheader("📊 Processing Mode")
                 multi_sheet_mode = st.checkbox(
                     "Multi-Sheet Mode",
-                    value=st.session_state.multi_sheet_mode,
+                    value=ss.multi_sheet_mode,
                     help="Process all sheets from Excel files simultaneously"
                 )
-                st.session_state.multi_sheet_mode = multi_sheet_mode
+                ss.multi_sheet_mode = multi_sheet_mode
                 
                 if multi_sheet_mode:
                     st.success("🔄 All Excel sheets will be processed at once")
                 else:
                     st.info("📄 Single-sheet mode: Select specific sheets to process")
             else:
-                st.session_state.multi_sheet_mode = False
+                ss.multi_sheet_mode = False
         
         # Sheet selection - available for both single and multi-sheet modes
         sheet_selections = {}
@@ -655,18 +1625,18 @@ def main() -> None:
             for file in uploaded_files:
                 if file.name.endswith(('.xlsx', '.xls')):
                     try:
-                        excel_file = pd.ExcelFile(file)
-                        if len(excel_file.sheet_names) > 1:
-                            if st.session_state.multi_sheet_mode:
-                                st.write(f"**{file.name}** - {len(excel_file.sheet_names)} sheets will be processed")
+                        sheet_names = _upload_sheet_names(file)
+                        if len(sheet_names) > 1:
+                            if ss.multi_sheet_mode:
+                                st.write(f"**{file.name}** - {len(sheet_names)} sheets will be processed")
                                 # In multi-sheet mode, we'll process all sheets, but still show them for info
                                 with st.expander(f"View sheets in {file.name}"):
-                                    for sheet in excel_file.sheet_names:
+                                    for sheet in sheet_names:
                                         st.write(f"• {sheet}")
                             else:
                                 selected_sheet = st.selectbox(
                                     f"Sheet for {file.name}:",
-                                    excel_file.sheet_names,
+                                    sheet_names,
                                     key=f"sheet_{file.name}"
                                 )
                                 sheet_selections[file.name] = selected_sheet
@@ -674,12 +1644,12 @@ def main() -> None:
                         st.warning(f"Could not read sheets from {file.name}: {e}")
         
         # Sheet selector for multi-sheet mode (after processing)
-        if st.session_state.multi_sheet_mode and st.session_state.sheet_data:
+        if ss.multi_sheet_mode and ss.sheet_data:
             st.subheader("📋 Sheet Selection")
             
             # Build sheet options
             sheet_options = []
-            for sheet_key, sheet_data in st.session_state.sheet_data.items():
+            for sheet_key, sheet_data in ss.sheet_data.items():
                 metadata = sheet_data['metadata']
                 filename = metadata['filename']
                 sheet_name = metadata['sheet_name']
@@ -694,21 +1664,21 @@ def main() -> None:
                     "Select Sheet:",
                     options=[option[1] for option in sheet_options],
                     format_func=lambda x: next(opt[0] for opt in sheet_options if opt[1] == x),
-                    index=0 if st.session_state.current_sheet not in [opt[1] for opt in sheet_options] 
-                          else [opt[1] for opt in sheet_options].index(st.session_state.current_sheet),
+                    index=0 if ss.current_sheet not in [opt[1] for opt in sheet_options] 
+                          else [opt[1] for opt in sheet_options].index(ss.current_sheet),
                     help="Switch between processed sheets instantly",
                     key="sheet_selector"
                 )
                 
                 # Detect and handle selection changes
-                if current_selection != st.session_state.current_sheet:
-                    st.session_state.current_sheet = current_selection
+                if current_selection != ss.current_sheet:
+                    ss.current_sheet = current_selection
                     st.rerun()
                 else:
-                    st.session_state.current_sheet = current_selection
+                    ss.current_sheet = current_selection
                 
                 # Show sheet info
-                current_data = st.session_state.sheet_data[current_selection]
+                current_data = ss.sheet_data[current_selection]
                 if current_data['error']:
                     st.error(f"Error: {current_data['error_message']}")
                 else:
@@ -716,9 +1686,10 @@ def main() -> None:
                     st.success(f"✅ {metadata['total_wells']} wells processed successfully")
         
         # Determine what files to process
+        using_sample_data = use_sample_data and sample_loaded
         files_to_process = uploaded_files
-        if use_sample_data and hasattr(st.session_state, 'sample_loaded') and st.session_state.sample_loaded:
-            files_to_process = st.session_state.sample_data
+        if using_sample_data:
+            files_to_process = ss.sample_data
         
         # Process data button - moved to top of sidebar area
         st.divider()
@@ -828,28 +1799,6 @@ def main() -> None:
                 help="S. aureus min growth percentage (>80%). Gram-positive control with no OM - should be unaffected by OM-disrupting compounds."
             )
         
-        # Build hit calling configuration
-        hit_calling_config = {
-            'hit_calling': {
-                'multi_stage_enabled': True,
-                'reporter': {
-                    'z_threshold_lptA': z_threshold_lptA,
-                    'z_threshold_ldtD': z_threshold_ldtD,
-                    'require_viability': True,
-                    'combine_mode': 'OR'
-                },
-                'vitality': {
-                    'tolC_max_threshold': tolc_max_threshold,
-                    'wt_min_threshold': wt_min_threshold,
-                    'sa_min_threshold': sa_min_threshold,
-                    'require_all_conditions': True
-                },
-                'platform': {
-                    'require_both_stages': True
-                }
-            }
-        }
-        
         # Advanced settings
         with st.expander("🔧 Advanced Settings"):
             edge_effect_threshold = st.slider(
@@ -871,16 +1820,30 @@ def main() -> None:
         with st.expander("📋 Column Mapping"):
             st.write("Manual column mapping (leave empty for auto-detection)")
             
-            required_columns = ['BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA']
-            column_mapping = {}
-            
-            for col in required_columns:
-                mapped_col = st.text_input(f"{col}:", key=f"mapping_{col}", placeholder="Auto-detect")
-                if mapped_col:
-                    column_mapping[col] = mapped_col
+            # One editable table instead of a text input per column
+            mapping_df = pd.DataFrame({
+                'Required': PlateProcessor.REQUIRED_COLUMNS,
+                'Mapped': [''] * len(PlateProcessor.REQUIRED_COLUMNS),
+            })
+            edited_mapping = st.data_editor(
+                mapping_df,
+                key="column_mapping_editor",
+                num_rows="fixed",
+                hide_index=True,
+                use_container_width=True,
+                disabled=['Required'],
+                column_config={
+                    'Mapped': st.column_config.TextColumn(
+                        "Mapped", help="Column name in your file (empty = auto-detect)"
+                    )
+                }
+            )
             
-            if not column_mapping:
-                column_mapping = None
+            column_mapping = {
+                required: str(mapped).strip()
+                for required, mapped in zip(edited_mapping['Required'], edited_mapping['Mapped'])
+                if isinstance(mapped, str) and mapped.strip()
+            } or None
         
         # Methodology and Scientific Background
         st.divider()
@@ -1101,22 +2064,28 @@ def main() -> None:
         
         # Process files when button is clicked
         if process_data:
+            hit_calling_config = build_hit_calling_config(
+                z_threshold_lptA, z_threshold_ldtD,
+                tolc_max_threshold, wt_min_threshold, sa_min_threshold
+            )
             with st.spinner("Processing plate data..."):
                 processed_df = None
                 
                 if files_to_process:
                     # Convert files to bytes for caching
-                    files_data = {}
-                    if hasattr(st.session_state, 'sample_loaded') and st.session_state.sample_loaded:
+                    if using_sample_data:
                         # Use sample data
                         files_data = files_to_process
                     else:
-                        # Use uploaded files
-                        for file in files_to_process:
-                            files_data[file.name] = file.getvalue()
-                    
-                    # Choose processing method based on multi-sheet mode
-                    if st.session_state.multi_sheet_mode:
+                        # Use uploaded files; getvalue() hands back the upload's own
+                        # bytes object (no copy), which the cached steps can hash
+                        files_data = {file.name: file.getvalue() for file in files_to_process}
+                    
+                    # Choose processing method based on multi-sheet mode. The
+                    # multi-sheet path only pays off when an input actually has
+                    # several sheets (CSV and one-sheet workbooks, or the sample
+                    # data, take the lighter single-sheet path)
+                    if ss.multi_sheet_mode and has_multi_sheet_files and not using_sample_data:
                         # Multi-sheet processing
                         sheet_results = process_all_sheets_from_files(
                             files_data, viability_threshold, apply_b_scoring, 
@@ -1124,13 +2093,13 @@ def main() -> None:
                         )
                         
                         # Update session state
-                        st.session_state.sheet_data = sheet_results
+                        ss.sheet_data = sheet_results
                         
                         # Set default current sheet to first successful one
                         successful_sheets = [key for key, data in sheet_results.items() if not data['error']]
                         if successful_sheets:
-                            st.session_state.current_sheet = successful_sheets[0]
-                            st.session_state.available_sheets = [
+                            ss.current_sheet = successful_sheets[0]
+                            ss.available_sheets = [
                                 (data['metadata']['filename'], data['metadata']['sheet_name'], key)
                                 for key, data in sheet_results.items()
                             ]
@@ -1152,14 +2121,16 @@ def main() -> None:
                         # Force rerun to show the sheet selector dropdown
                         st.rerun()
                     else:
-                        # Single-sheet processing (existing logic)
+                        # Single-sheet processing (existing logic); drop any earlier
+                        # multi-sheet results so the tabs show this run
+                        ss.sheet_data = {}
                         processed_df = process_uploaded_files(
                             files_data, sheet_selections, viability_threshold, 
                             apply_b_scoring, True, hit_calling_config, column_mapping  # Always enable hit calling
                         )
                 
                 if processed_df is not None:
-                    st.session_state.processed_data = processed_df
+                    ss.processed_data = processed_df
                     
                     # Calculate edge effects
                     if len(processed_df) > 0:
@@ -1167,51 +2138,61 @@ def main() -> None:
                             thresholds={'warn_d': edge_effect_threshold},
                             spatial_enabled=enable_spatial_analysis
                         )
-                        st.session_state.edge_results = edge_detector.detect_edge_effects_dataframe(
+                        ss.edge_results = edge_detector.detect_edge_effects_dataframe(
                             processed_df, metric="Z_lptA"
                         )
+                        ss.edge_max_warning = max_warning_level(ss.edge_results)
+                    
+                    # Split into per-plate frames once (single groupby pass) and
+                    # share them between the summary and hit calling
+                    plate_data = dict(tuple(processed_df.groupby('PlateID', sort=False)))
                     
                     # Calculate processing summary
                     processor = PlateProcessor(viability_threshold)
-                    for plate_id in processed_df['PlateID'].unique():
-                        plate_df = processed_df[processed_df['PlateID'] == plate_id]
-                        processor.processed_plates[plate_id] = plate_df
+                    processor.processed_plates.update(plate_data)
                     
-                    st.session_state.processing_summary = processor.get_processing_summary()
+                    ss.processing_summary = processor.get_processing_summary()
                     
                     # Calculate hit calling analysis if multi-stage mode is enabled
                     # Always perform hit analysis for dual-readout screening
                     try:
-                        plate_data = {plate_id: processed_df[processed_df['PlateID'] == plate_id] 
-                                    for plate_id in processed_df['PlateID'].unique()}
                         hit_analysis = analyze_multi_plate_hits(plate_data, hit_calling_config)
-                        st.session_state.hit_calling_results = hit_analysis
+                        ss.hit_calling_results = hit_analysis
                     except Exception as e:
                         logger.warning(f"Hit calling analysis failed: {e}")
-                        st.session_state.hit_calling_results = {}
+                        ss.hit_calling_results = {}
+                    
+                    ss.processed_data = to_arrow_dtypes(processed_df)
+                    ss.processed_data_key = uuid.uuid4().hex
                 else:
                     st.error("Failed to process data. Please check your files and try again.")
     
+    # Sheet selection state is final from here on; read it once
+    multi_sheet_mode = ss.multi_sheet_mode
+    sheet_data = ss.sheet_data
+    current_sheet = ss.current_sheet
+    
     # Helper function to get current sheet data
     def get_current_sheet_data():
         """Get the current sheet's data based on multi-sheet mode."""
-        if st.session_state.multi_sheet_mode and st.session_state.sheet_data:
-            current_sheet = st.session_state.current_sheet
-            if current_sheet and current_sheet in st.session_state.sheet_data:
-                return st.session_state.sheet_data[current_sheet]
+        if multi_sheet_mode and sheet_data:
+            if current_sheet and current_sheet in sheet_data:
+                return sheet_data[current_sheet]
         
         # Fallback to legacy single-sheet data
         return {
-            'processed_data': st.session_state.get('processed_data'),
-            'edge_results': st.session_state.get('edge_results', []),
-            'processing_summary': st.session_state.get('processing_summary', {}),
-            'hit_calling_results': st.session_state.get('hit_calling_results', {}),
+            'processed_data': ss.get('processed_data'),
+            'data_key': ss.get('processed_data_key'),
+            'edge_results': ss.get('edge_results', []),
+            'edge_max_warning': ss.get('edge_max_warning'),
+            'processing_summary': ss.get('processing_summary', {}),
+            'hit_calling_results': ss.get('hit_calling_results', {}),
             'error': False,
             'error_message': None
         }
     
     # Display current plate indicator for multi-sheet mode
-    if st.session_state.multi_sheet_mode and st.session_state.sheet_data and st.session_state.current_sheet:
+    if multi_sheet_mode and sheet_data and current_sheet:
         current_data = get_current_sheet_data()
         if not current_data['error']:
             metadata = current_data['metadata']
@@ -1220,480 +2201,232 @@ def main() -> None:
             wells_count = metadata['total_wells']
             st.info(f"📋 **Currently viewing:** {sheet_name} ({wells_count:,} wells)")
     
-    # Main content tabs - dual-readout compound screening interface
-    summary_tab, reporter_hits_tab, vitality_hits_tab, hit_calling_tab, viz_tab, heatmaps_tab, qc_tab = st.tabs([
+    # Main content tabs - dual-readout compound screening interface. Only the
+    # open tab's body runs on a rerun
+    summary_tab, reporter_hits_tab, vitality_hits_tab, hit_calling_tab, viz_tab, heatmaps_tab, qc_tab = lazy_tabs([
         "📊 Summary", 
         "🧬 Reporter Hits",
         "⚡ Vitality Hits", 
         "🔬 Hit Calling",
         "📈 Visualizations", 
-        "🔥 Heatmaps", 
-        "📋 QC Report"
-    ])
-    
-    # Get current sheet data
-    current_data = get_current_sheet_data()
-    df = current_data['processed_data']
-    edge_results = current_data['edge_results']
-    summary = current_data['processing_summary']
-    hit_calling_results = current_data['hit_calling_results']
-    
-    # Check for sheet errors
-    if current_data['error']:
-        st.error(f"Sheet processing failed: {current_data['error_message']}")
-        st.stop()
-    
-    # Summary Tab
-    with summary_tab:
-        st.header("Summary")
-        
-        # Scientific Methodology - Prominent box
-        methodology_container = st.container()
-        with methodology_container:
-            st.markdown("### 🔬 Scientific Methodology")
-            
-            with st.expander("📖 **Detailed Scientific Background**", expanded=True):
-                method_tabs = st.tabs(["🔬 Platform Overview", "🧬 Biological Foundation", "📊 Statistical Methods", "✅ Quality Control"])
-                
-                with method_tabs[0]:
-                    st.markdown("""
-                    **The BREAKthrough Platform** represents a next-generation approach to antimicrobial discovery, specifically designed to identify compounds that disrupt the Gram-negative outer membrane (OM). 
-                    
-                    Developed as part of the European Union's Horizon Europe Programme, this platform addresses the critical need for novel antibiotics against multi-drug resistant pathogens by targeting the OM permeability barrier that protects Gram-negative bacteria. 
-                    
-                    The platform integrates **dual-reporter stress response monitoring** with **three-strain selectivity profiling** to provide mechanistically informed hit identification with reduced false positive rates.
-                    """)
-                
-                with method_tabs[1]:
-                    st.markdown("""
-                    **Outer Membrane Biology:** The outer membrane of Gram-negative bacteria serves as the primary permeability barrier limiting antibiotic efficacy. LPS transport via the Lpt machinery and peptidoglycan remodeling through L,D-transpeptidases represent critical envelope biogenesis pathways.
-                    
-                    **Stress Response Systems:** The σE and Cpx envelope stress response systems detect and respond to OM perturbations:
-                    - **lptA (σE-regulated):** LPS transport-specific monitoring
-                    - **ldtD (Cpx-regulated):** Structural compensation responses
-                    
-                    This **dual-reporter design** increases mechanistic specificity while reducing artifacts from non-specific stress responses.
-                    """)
-                
-                with method_tabs[2]:  
-                    st.markdown("""
-                    **Reporter Ratio Normalization:** BG/BT ratios provide internal normalization critical for robust screening:
-                    - **β-galactosidase (BG):** Transcriptional stress response intensity  
-                    - **ATP (BT):** Viable cell mass via BacTiter-Glo
-                    - **Correction for:** Inoculum density, growth effects, pipetting errors, plate variations
-                    
-                    **Robust Statistics:** Median/MAD methods tolerate outliers unlike mean/SD:
-                    - **Formula:** Z = (value - median) / (1.4826 × MAD)
-                    - **Advantage:** Stable with up to 50% outlier contamination
-                    - **B-scoring:** Median-polish removes spatial artifacts when detected
-                    """)
-                
-                with method_tabs[3]:
-                    st.markdown("""
-                    **Quality Control Framework:**
-                    - **Edge Effects:** Spatial correlation analysis detects periphery artifacts
-                    - **Row/Column Bias:** Identifies systematic pipetting or gradient effects  
-                    - **Statistical Distribution:** Flags unusual Z-score patterns or hit rates
-                    - **ATP Viability Gating:** f=0.3 threshold excludes cytotoxic artifacts
-                    
-                    **Expected Performance:**
-                    - Hit rates: ~1% of compound libraries
-                    - Validation success: 10-30% confirmation in secondary assays
-                    - Z' factor: >0.5 for robust assay windows
-                    """)
-                
-                st.info("💡 **This methodology ensures high-confidence identification of outer membrane permeabilizers with reduced false discovery rates.**")
-        
-        st.markdown("---")  # Visual separator
-        
-        if df is not None and len(df) > 0:
-            # Metrics row
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    "Plates", 
-                    summary.get('plate_count', 0),
-                    help="Number of plates processed"
-                )
-            
-            with col2:
-                st.metric(
-                    "Total Wells", 
-                    summary.get('total_wells', 0),
-                    help="Total number of wells across all plates"
-                )
-            
-            with col3:
-                missing_pct = 0
-                if summary.get('total_wells', 0) > 0:
-                    total_measurements = summary.get('total_wells', 0) * len(['BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA'])
-                    missing_measurements = df[['BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA']].isna().sum().sum()
-                    missing_pct = (missing_measurements / total_measurements) * 100
-                
-                st.metric(
-                    "Missing %", 
-                    f"{missing_pct:.1f}%",
-                    help="Percentage of missing measurements"
-                )
-                
-            # Hit Calling Summary (if multi-stage mode is enabled and results are available)
-            if hit_calling_results and any(col in df.columns for col in ['reporter_hit', 'vitality_hit', 'platform_hit']):
-                st.subheader("Hit Calling Summary")
-                
-                hit_col1, hit_col2, hit_col3, hit_col4 = st.columns(4)
-                
-                with hit_col1:
-                    reporter_hits = df['reporter_hit'].sum() if 'reporter_hit' in df.columns else 0
-                    reporter_rate = (reporter_hits / len(df)) * 100 if len(df) > 0 else 0
-                    st.metric(
-                        "Reporter Hits",
-                        f"{reporter_hits:,}",
-                        f"{reporter_rate:.1f}%",
-                        help="Stage 1: Z-score ≥ 2.0 AND viable"
-                    )
-                
-                with hit_col2:
-                    vitality_hits = df['vitality_hit'].sum() if 'vitality_hit' in df.columns else 0  
-                    vitality_rate = (vitality_hits / len(df)) * 100 if len(df) > 0 else 0
-                    st.metric(
-                        "Vitality Hits",
-                        f"{vitality_hits:,}",
-                        f"{vitality_rate:.1f}%", 
-                        help="Stage 2: Growth pattern analysis"
-                    )
-                
-                with hit_col3:
-                    platform_hits = df['platform_hit'].sum() if 'platform_hit' in df.columns else 0
-                    platform_rate = (platform_hits / len(df)) * 100 if len(df) > 0 else 0
-                    st.metric(
-                        "Platform Hits", 
-                        f"{platform_hits:,}",
-                        f"{platform_rate:.1f}%",
-                        help="Stage 3: Reporter AND Vitality"
-                    )
-                
-                with hit_col4:
-                    # Hit progression efficiency
-                    if reporter_hits > 0:
-                        progression_rate = (platform_hits / reporter_hits) * 100
-                        st.metric(
-                            "Progression Rate",
-                            f"{progression_rate:.1f}%", 
-                            help="Platform hits / Reporter hits"
-                        )
-                    else:
-                        st.metric("Progression Rate", "N/A", help="No reporter hits found")
-            
-            # Edge Effect Badge
-            st.subheader("Edge Effect Status")
-            if edge_results:
-                # Get the most severe warning level
-                warning_levels = [result.warning_level for result in edge_results if hasattr(result, 'warning_level')]
-                max_warning = max(warning_levels) if warning_levels else WarningLevel.INFO
-                st.markdown(render_edge_effect_badge(max_warning), unsafe_allow_html=True)
-                
-                # Expandable diagnostics
-                with st.expander("🔍 Edge Effect Diagnostics"):
-                    for result in edge_results:
-                        st.write(f"**Plate {result.plate_id} ({result.metric})**")
-                        
-                        diag_col1, diag_col2, diag_col3 = st.columns(3)
-                        with diag_col1:
-                            st.metric("Effect Size (d)", f"{result.effect_size_d:.3f}")
-                        with diag_col2:
-                            st.metric("Edge Wells", result.n_edge_wells)
-                        with diag_col3:
-                            st.metric("Interior Wells", result.n_interior_wells)
-                        
-                        if not np.isnan(result.row_correlation):
-                            st.write(f"Row trend correlation: {result.row_correlation:.3f}")
-                        if not np.isnan(result.col_correlation):
-                            st.write(f"Column trend correlation: {result.col_correlation:.3f}")
-                        
-                        # Corner effects
-                        corner_issues = [f"{k}: {v:.1f} MADs" for k, v in result.corner_deviations.items() 
-                                       if not np.isnan(v) and v > 1.2]
-                        if corner_issues:
-                            st.write("Corner effects:", ", ".join(corner_issues))
-                        
-                        st.divider()
-            else:
-                st.info("No edge effect analysis available. Process data first.")
-            
-            # Quick reference card
-            with st.expander("📋 Quick Reference Card", expanded=False):
-                st.markdown("""
-                **⚡ At-a-Glance Summary**
-                
-                | **Measurement** | **Biological Meaning** | **Hit Criteria** |
-                |----------------|------------------------|------------------|
-                | **lptA Z-score** | LPS transport stress | ≥ 2.0 (+ viability) |
-                | **ldtD Z-score** | Peptidoglycan remodeling | ≥ 2.0 (+ viability) |
-                | **WT Growth** | Intact OM resistance | > 80% (normal) |
-                | **ΔtolC Growth** | Compromised OM sensitivity | ≤ 80% (inhibited) |
-                | **SA Growth** | Gram-positive control | > 80% (unaffected) |
-                
-                **🎯 Hit Classification:**
-                - **Reporter Hit:** lptA OR ldtD activated + viable
-                - **Vitality Hit:** WT>80% + ΔtolC≤80% + SA>80%
-                - **Platform Hit:** Reporter Hit AND Vitality Hit
-                
-                **📊 Expected Rates (from 880 extracts):**
-                - Reporter hits: ~8% | Vitality hits: ~6.5% | Platform hits: ~1%
-                
-                **⚠️ Key Quality Checks:**
-                - Viability: BT ≥ 30% of plate median
-                - Edge effects: Check spatial bias warnings  
-                - B-scores: Use when systematic row/column bias detected
-                
-                **📐 Key Formulas:**
-                """)
-                
-                st.latex(r"Z = \frac{x - \text{median}(X)}{1.4826 \times \text{MAD}(X)}")
-                st.caption("Robust Z-score calculation")
-                
-                st.latex(r"Ratio = \frac{BG}{BT} \quad \text{(Reporter Signal / ATP Viability)}")
-                st.caption("Normalized reporter activity")
-            
-            # Results interpretation guide
-            with st.expander("🧬 Results Interpretation Guide", expanded=False):
-                # Create interpretation tabs for better organization
-                interp_tab1, interp_tab2, interp_tab3 = st.tabs([
-                    "🎯 Hit Classification", "📊 Data Quality", "⚠️ Troubleshooting"
-                ])
-                
-                with interp_tab1:
-                    st.markdown("""
-                    **Understanding Your Screening Results**
-                    
-                    ### 🔬 Reporter Hits (Stage 1): Biological Response
-                    
-                    **High lptA Z-scores (≥ 2.0):**
-                    • **Mechanistic interpretation**: σE stress response activation
-                    • **Biological meaning**: LPS transport disruption, OM protein misfolding
-                    • **Pathway specificity**: Outer membrane biogenesis stress
-                    • **Clinical relevance**: Targets essential OM assembly machinery
-                    
-                    **High ldtD Z-scores (≥ 2.0):**
-                    • **Mechanistic interpretation**: Cpx envelope stress activation
-                    • **Biological meaning**: Peptidoglycan remodeling, structural compensation
-                    • **Cellular response**: Adaptive mechanism to maintain envelope integrity
-                    • **Indicator function**: Detects combined OM/peptidoglycan perturbation
-                    
-                    **Dual-positive reporters (lptA+ and ldtD+):**
-                    • **Highest confidence**: Orthogonal evidence of OM disruption
-                    • **Synergistic stress**: Multiple envelope systems activated simultaneously
-                    • **Priority hits**: Most likely to have genuine OM-targeting activity
-                    • **Mechanism diversity**: May affect multiple envelope pathways
-                    
-                    ### ⚡ Vitality Hits (Stage 2): Selectivity Profiling
-                    
-                    **Ideal selectivity pattern (WT > 80%, ΔtolC ≤ 80%, SA > 80%):**
-                    • **WT resistance**: Intact OM provides natural protection
-                    • **ΔtolC sensitivity**: Compromised efflux enhances compound accumulation
-                    • **S. aureus tolerance**: Lack of OM target confers resistance
-                    • **Therapeutic relevance**: Selective targeting minimizes host toxicity
-                    
-                    **Alternative patterns and interpretations:**
-                    • **All strains sensitive**: Broad-spectrum cytotoxin (deprioritize)
-                    • **Only WT affected**: Unusual, may target WT-specific pathways
-                    • **Variable S. aureus**: May have secondary Gram-positive targets
-                    • **Dose-dependent**: Different patterns at varying concentrations
-                    
-                    ### 🎯 Platform Hits (Stage 3): High-Confidence Candidates
-                    
-                    **Integration of biological and phenotypic evidence:**
-                    • **Mechanistic plausibility**: Reporter activation consistent with OM targeting
-                    • **Selectivity confirmation**: Differential strain susceptibility pattern
-                    • **Statistical significance**: Robust scoring across multiple metrics
-                    • **Quality control**: Passes viability gating and spatial artifact checks
-                    
-                    **Therapeutic potential:**
-                    • **Antibiotic adjuvants**: Enhance existing drug efficacy
-                    • **Combination therapy**: Synergize with conventional antibiotics
-                    • **Resistance circumvention**: Overcome OM-mediated resistance
-                    • **Novel mechanisms**: Alternative to traditional antimicrobial targets
-                    
-                    **Expected outcomes:**
-                    • **Hit rate**: ~1% of screened compounds (library-dependent)
-                    • **Validation success**: 10-30% confirm in secondary assays
-                    • **Lead compounds**: 1-5% advance to optimization
-                    • **Clinical candidates**: <1% reach preclinical development
-                    """)
-                
-                with interp_tab2:
-                    st.markdown("""
-                    ### 📊 Statistical Quality Indicators
-                    
-                    **Z-score interpretation:**
-                    • **Z ≥ 3.0**: Strong hits, high confidence (>99.7% significance)
-                    • **Z 2.0-3.0**: Moderate hits, good confidence (95-99.7% significance)
-                    • **Z 1.5-2.0**: Weak hits, consider with caution (87-95% significance)
-                    • **Z < 1.5**: Below detection threshold, likely inactive
-                    
-                    **B-score vs. Raw Z-score comparison:**
-                    • **Concordant hits**: Both methods agree → High confidence
-                    • **B-score exclusive**: May be artifacts corrected by spatial adjustment
-                    • **Raw Z exclusive**: May be systematic bias amplified by B-scoring
-                    • **Magnitude differences**: B-scoring can enhance or diminish signals
-                    
-                    **Viability gating impact:**
-                    • **ATP-filtered hits**: Focus on viable cellular responses
-                    • **Below threshold**: May indicate cytotoxicity or assay failure
-                    • **Borderline viability**: Interpret with caution, may be stress-induced
-                    • **Viability recovery**: Some compounds may allow adaptation
-                    
-                    ### 🗺️ Spatial Pattern Recognition
-                    
-                    **Legitimate biological patterns:**
-                    • **Random distribution**: Expected for genuine bioactive compounds
-                    • **Clustered hits**: May indicate structural similarity or concentration gradients
-                    • **Isolated signals**: Single well hits require confirmation
-                    • **Replicate consistency**: Activity reproducible across plate replicates
-                    
-                    **Technical artifacts to avoid:**
-                    • **Edge enhancement**: Systematic elevation at plate periphery
-                    • **Row/column streaks**: Linear patterns suggesting systematic bias
-                    • **Corner effects**: Extreme values in plate corners
-                    • **Gradient patterns**: Smooth transitions suggesting technical variation
-                    
-                    ### 📈 Multi-Plate Analysis
-                    
-                    **Cross-plate validation:**
-                    • **Reproducible hits**: Active across multiple plates/experiments
-                    • **Plate-specific artifacts**: Activity limited to single plates
-                    • **Concentration-response**: Consistent potency across dose ranges
-                    • **Batch effects**: Account for reagent/media lot variations
-                    """)
-                
-                with interp_tab3:
-                    st.markdown("""
-                    ### ⚠️ Common Issues and Troubleshooting
-                    
-                    **Low hit rates (<0.1%):**
-                    • **Library composition**: May lack bioactive compounds
-                    • **Assay sensitivity**: Thresholds too stringent
-                    • **Screening conditions**: Suboptimal compound concentrations
-                    • **Reporter system**: Check positive controls and strain viability
-                    
-                    **Excessive hit rates (>5%):**
-                    • **Systematic bias**: Check for edge effects or pipetting errors
-                    • **Contamination**: Bacterial, chemical, or cross-well contamination
-                    • **Assay artifacts**: Non-specific compound interactions
-                    • **Threshold adjustment**: Consider more stringent cutoffs
-                    
-                    **Inconsistent selectivity patterns:**
-                    • **Strain viability**: Verify all strains grow comparably
-                    • **OM integrity**: Confirm ΔtolC strain phenotype
-                    • **Growth conditions**: Optimize media and incubation parameters
-                    • **Compound stability**: Check for degradation or precipitation
-                    
-                    **Edge effects dominating results:**
-                    • **Plate handling**: Review pipetting and incubation protocols
-                    • **Environmental control**: Minimize temperature/humidity gradients
-                    • **Plate sealing**: Prevent evaporation and contamination
-                    • **B-score correction**: Apply spatial bias correction methods
-                    
-                    **Viability issues:**
-                    • **Low ATP signals**: Check bacterial growth conditions
-                    • **Reagent quality**: Verify BacTiter-Glo performance
-                    • **Incubation timing**: Optimize assay duration
-                    • **Threshold adjustment**: May need library-specific optimization
-                    
-                    ### 🔄 Follow-up Studies
-                    
-                    **Secondary assays for hit validation:**
-                    • **Dose-response curves**: Confirm concentration-dependent activity
-                    • **Time-course studies**: Assess kinetics of reporter activation
-                    • **Mechanism-of-action**: Additional envelope stress markers
-                    • **Synergy testing**: Combination with known antibiotics
+        "🔥 Heatmaps", 
+        "📋 QC Report"
+    ], key="main_tab")
+    
+    # Get current sheet data
+    current_data = get_current_sheet_data()
+    df = current_data['processed_data']
+    edge_results = current_data['edge_results']
+    summary = current_data['processing_summary']
+    hit_calling_results = current_data['hit_calling_results']
+    data_key = current_data.get('data_key')
+    
+    # Check for sheet errors
+    if current_data['error']:
+        st.error(f"Sheet processing failed: {current_data['error_message']}")
+        st.stop()
+    
+    # Summary Tab
+    if tab_is_open(summary_tab):
+        with summary_tab:
+            st.header("Summary")
+            
+            # Scientific Methodology - Prominent box
+            methodology_container = st.container()
+            with methodology_container:
+                st.markdown("### 🔬 Scientific Methodology")
+                
+                with st.expander("📖 **Detailed Scientific Background**", expanded=True):
+                    method_tabs = st.tabs(["🔬 Platform Overview", "🧬 Biological Foundation", "📊 Statistical Methods", "✅ Quality Control"])
                     
-                    **Orthogonal validation methods:**
-                    • **Live/dead staining**: Direct viability assessment
-                    • **OM permeability**: Fluorescent probe uptake assays
-                    • **Electron microscopy**: Morphological changes
-                    • **Proteomics**: Global stress response analysis
+                    with method_tabs[0]:
+                        st.markdown("""
+                        **The BREAKthrough Platform** represents a next-generation approach to antimicrobial discovery, specifically designed to identify compounds that disrupt the Gram-negative outer membrane (OM). 
+                        
+                        Developed as part of the European Union's Horizon Europe Programme, this platform addresses the critical need for novel antibiotics against multi-drug resistant pathogens by targeting the OM permeability barrier that protects Gram-negative bacteria. 
+                        
+                        The platform integrates **dual-reporter stress response monitoring** with **three-strain selectivity profiling** to provide mechanistically informed hit identification with reduced false positive rates.
+                        """)
                     
-                    ### 📋 Quality Control Checklist
+                    with method_tabs[1]:
+                        st.markdown("""
+                        **Outer Membrane Biology:** The outer membrane of Gram-negative bacteria serves as the primary permeability barrier limiting antibiotic efficacy. LPS transport via the Lpt machinery and peptidoglycan remodeling through L,D-transpeptidases represent critical envelope biogenesis pathways.
+                        
+                        **Stress Response Systems:** The σE and Cpx envelope stress response systems detect and respond to OM perturbations:
+                        - **lptA (σE-regulated):** LPS transport-specific monitoring
+                        - **ldtD (Cpx-regulated):** Structural compensation responses
+                        
+                        This **dual-reporter design** increases mechanistic specificity while reducing artifacts from non-specific stress responses.
+                        """)
+                    
+                    with method_tabs[2]:  
+                        st.markdown("""
+                        **Reporter Ratio Normalization:** BG/BT ratios provide internal normalization critical for robust screening:
+                        - **β-galactosidase (BG):** Transcriptional stress response intensity  
+                        - **ATP (BT):** Viable cell mass via BacTiter-Glo
+                        - **Correction for:** Inoculum density, growth effects, pipetting errors, plate variations
+                        
+                        **Robust Statistics:** Median/MAD methods tolerate outliers unlike mean/SD:
+                        - **Formula:** Z = (value - median) / (1.4826 × MAD)
+                        - **Advantage:** Stable with up to 50% outlier contamination
+                        - **B-scoring:** Median-polish removes spatial artifacts when detected
+                        """)
+                    
+                    with method_tabs[3]:
+                        st.markdown("""
+                        **Quality Control Framework:**
+                        - **Edge Effects:** Spatial correlation analysis detects periphery artifacts
+                        - **Row/Column Bias:** Identifies systematic pipetting or gradient effects  
+                        - **Statistical Distribution:** Flags unusual Z-score patterns or hit rates
+                        - **ATP Viability Gating:** f=0.3 threshold excludes cytotoxic artifacts
+                        
+                        **Expected Performance:**
+                        - Hit rates: ~1% of compound libraries
+                        - Validation success: 10-30% confirmation in secondary assays
+                        - Z' factor: >0.5 for robust assay windows
+                        """)
                     
-                    **Before concluding analysis:**
-                    - ✅ Check positive/negative controls
-                    - ✅ Verify edge effect warnings
-                    - ✅ Review spatial heatmaps for artifacts
-                    - ✅ Confirm viability gating appropriateness
-                    - ✅ Compare B-score vs. raw Z-score results
-                    - ✅ Assess hit distribution across plates
-                    - ✅ Validate selectivity patterns make biological sense
-                    """)
-                
-            
-            # Download buttons
-            st.subheader("Downloads")
-            download_col1, download_col2 = st.columns(2)
+                    st.info("💡 **This methodology ensures high-confidence identification of outer membrane permeabilizers with reduced false discovery rates.**")
             
-            with download_col1:
-                # Combined CSV download
-                csv_data = df.to_csv(index=False)
-                st.download_button(
-                    "📥 Download Combined CSV",
-                    csv_data,
-                    file_name="combined_plate_data.csv",
-                    mime="text/csv",
-                    help="Download all processed plate data as CSV"
-                )
+            st.markdown("---")  # Visual separator
             
-            with download_col2:
-                # ZIP bundle download
-                if st.button("📦 Download ZIP Bundle"):
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        # Add CSV data
-                        zip_file.writestr("combined_data.csv", csv_data)
-                        
-                        # Add processing summary
-                        summary_yaml = yaml.dump(summary, default_flow_style=False)
-                        zip_file.writestr("processing_summary.yaml", summary_yaml)
-                        
-                        # Add edge effect results if available
-                        if edge_results:
-                            edge_data = []
-                            for result in edge_results:
-                                edge_data.append(result._asdict())
-                            edge_yaml = yaml.dump(edge_data, default_flow_style=False)
-                            zip_file.writestr("edge_effects.yaml", edge_yaml)
+            if df is not None and len(df) > 0:
+                # Metrics row
+                total_wells = summary.get('total_wells', 0)
+                missing_pct = 0
+                if total_wells > 0:
+                    # Single NumPy reduction over the raw measurement block
+                    measurements = df[PlateProcessor.REQUIRED_COLUMNS].to_numpy(dtype=float)
+                    missing_pct = np.isnan(measurements).mean() * 100 if measurements.size else 0
+                
+                # (label, value, delta, help) per metric, rendered in one loop
+                overview_metrics = [
+                    ("Plates", summary.get('plate_count', 0), None, "Number of plates processed"),
+                    ("Total Wells", total_wells, None, "Total number of wells across all plates"),
+                    ("Missing %", f"{missing_pct:.1f}%", None, "Percentage of missing measurements"),
+                ]
+                for column, (label, value, delta, help_text) in zip(st.columns(len(overview_metrics)), overview_metrics):
+                    column.metric(label, value, delta, help=help_text)
+                    
+                # Hit Calling Summary (if multi-stage mode is enabled and results are available)
+                hit_cols = [col for col in ['reporter_hit', 'vitality_hit', 'platform_hit'] if col in df.columns]
+                if hit_calling_results and hit_cols:
+                    st.subheader("Hit Calling Summary")
+                    
+                    # Count all hit flags in one pass over the column block
+                    hit_counts = dict(zip(hit_cols, df[hit_cols].to_numpy(dtype=bool, na_value=False).sum(axis=0).tolist()))
+                    n_wells = len(df)
+                    reporter_hits = hit_counts.get('reporter_hit', 0)
+                    vitality_hits = hit_counts.get('vitality_hit', 0)
+                    platform_hits = hit_counts.get('platform_hit', 0)
                     
+                    # Hit progression efficiency
+                    progression = f"{platform_hits / reporter_hits * 100:.1f}%" if reporter_hits > 0 else "N/A"
+                    
+                    hit_metrics = [
+                        ("Reporter Hits", f"{reporter_hits:,}", f"{reporter_hits / n_wells * 100:.1f}%",
+                         "Stage 1: Z-score ≥ 2.0 AND viable"),
+                        ("Vitality Hits", f"{vitality_hits:,}", f"{vitality_hits / n_wells * 100:.1f}%",
+                         "Stage 2: Growth pattern analysis"),
+                        ("Platform Hits", f"{platform_hits:,}", f"{platform_hits / n_wells * 100:.1f}%",
+                         "Stage 3: Reporter AND Vitality"),
+                        ("Progression Rate", progression, None,
+                         "Platform hits / Reporter hits" if reporter_hits > 0 else "No reporter hits found"),
+                    ]
+                    for column, (label, value, delta, help_text) in zip(st.columns(len(hit_metrics)), hit_metrics):
+                        column.metric(label, value, delta, help=help_text)
+                
+                # Edge Effect Badge
+                st.subheader("Edge Effect Status")
+                if edge_results:
+                    # Most severe warning level, precomputed when edges were detected
+                    max_warning = current_data.get('edge_max_warning') or WarningLevel.INFO
+                    st.markdown(render_edge_effect_badge(max_warning), unsafe_allow_html=True)
+                    
+                    # Expandable diagnostics
+                    with st.expander("🔍 Edge Effect Diagnostics"):
+                        for result in edge_results:
+                            st.write(f"**Plate {result.plate_id} ({result.metric})**")
+                            
+                            diag_col1, diag_col2, diag_col3 = st.columns(3)
+                            with diag_col1:
+                                st.metric("Effect Size (d)", f"{result.effect_size_d:.3f}")
+                            with diag_col2:
+                                st.metric("Edge Wells", result.n_edge_wells)
+                            with diag_col3:
+                                st.metric("Interior Wells", result.n_interior_wells)
+                            
+                            if not math.isnan(result.row_correlation):
+                                st.write(f"Row trend correlation: {result.row_correlation:.3f}")
+                            if not math.isnan(result.col_correlation):
+                                st.write(f"Column trend correlation: {result.col_correlation:.3f}")
+                            
+                            # Corner effects
+                            corner_issues = [f"{k}: {v:.1f} MADs" for k, v in result.corner_deviations.items() 
+                                           if not math.isnan(v) and v > 1.2]
+                            if corner_issues:
+                                st.write("Corner effects:", ", ".join(corner_issues))
+                            
+                            st.divider()
+                else:
+                    st.info("No edge effect analysis available. Process data first.")
+                
+                # Static reference material
+                render_summary_reference()
+                
+                # Download buttons
+                st.subheader("Downloads")
+                download_col1, download_col2 = st.columns(2)
+                
+                with download_col1:
+                    # Combined CSV download (serialized once per dataset, not per rerun)
+                    csv_data = combined_csv_bytes(df)
                     st.download_button(
-                        "📥 Download ZIP Bundle",
-                        zip_buffer.getvalue(),
-                        file_name="plate_analysis_bundle.zip",
-                        mime="application/zip",
-                        help="Download complete analysis bundle with CSV, summary, and edge effects"
+                        "📥 Download Combined CSV",
+                        csv_data,
+                        file_name="combined_plate_data.csv",
+                        mime="text/csv",
+                        help="Download all processed plate data as CSV"
                     )
-        else:
-            st.info("👆 Upload and process plate data to see summary metrics and edge effect diagnostics.")
-            
-            # Show sample data structure
-            st.subheader("Expected Data Structure")
-            sample_cols = ['PlateID', 'Well', 'Row', 'Col', 'BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA']
-            # pandas (pd) is already imported at the top of the file
-            sample_data = pd.DataFrame({
-                col: ['Plate001', 'A01', 'A', '1', '1000', '2000', '800', '1500', '0.5', '0.3', '0.4'] if i == 0 
-                     else ['Plate001', 'A02', 'A', '2', '1200', '1800', '900', '1400', '0.6', '0.4', '0.5'] if i == 1
-                     else ['...'] * len(sample_cols)
-                for i, col in enumerate(sample_cols)
-            })
-            st.dataframe(sample_data, use_container_width=True)
+                
+                with download_col2:
+                    # ZIP bundle download
+                    if st.button("📦 Download ZIP Bundle"):
+                        zip_data = analysis_bundle_bytes(df, summary, edge_effects_to_dataframe(edge_results))
+                        
+                        st.download_button(
+                            "📥 Download ZIP Bundle",
+                            zip_data,
+                            file_name="plate_analysis_bundle.zip",
+                            mime="application/zip",
+                            help="Download complete analysis bundle with CSV, summary, and edge effects"
+                        )
+            else:
+                st.info("👆 Upload and process plate data to see summary metrics and edge effect diagnostics.")
+                
+                # Show sample data structure
+                st.subheader("Expected Data Structure")
+                sample_cols = ['PlateID', 'Well', 'Row', 'Col', 'BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA']
+                # pandas (pd) is already imported at the top of the file
+                sample_data = pd.DataFrame({
+                    col: ['Plate001', 'A01', 'A', '1', '1000', '2000', '800', '1500', '0.5', '0.3', '0.4'] if i == 0 
+                         else ['Plate001', 'A02', 'A', '2', '1200', '1800', '900', '1400', '0.6', '0.4', '0.5'] if i == 1
+                         else ['...'] * len(sample_cols)
+                    for i, col in enumerate(sample_cols)
+                })
+                st.dataframe(sample_data, use_container_width=True)
     
     # Reporter Hits Tab
-    if reporter_hits_tab is not None:
+    if tab_is_open(reporter_hits_tab):
         with reporter_hits_tab:
             st.header("🧬 Reporter Hits")
             
             if df is not None and len(df) > 0:
                 # Check if reporter hit data is available
                 if 'reporter_hit' in df.columns:
-                    reporter_hits_df = df[df['reporter_hit'] == True].copy()
+                    # Only the hit count is needed here; the cached table builder
+                    # selects the hit rows itself
+                    reporter_count = int(df['reporter_hit'].to_numpy(dtype=bool, na_value=False).sum())
                     
                     # Controls for Reporter Hits
                     control_col1, control_col2 = st.columns(2)
@@ -1707,7 +2440,7 @@ def main() -> None:
                         )
                     
                     with control_col2:
-                        max_hits = len(reporter_hits_df) if len(reporter_hits_df) > 0 else 100
+                        max_hits = reporter_count if reporter_count > 0 else 100
                         display_top_n_reporter = st.number_input(
                             "Display Top N:",
                             min_value=min(10, max_hits),
@@ -1719,81 +2452,22 @@ def main() -> None:
                     
                     # Display reporter hits summary
                     total_wells = len(df)
-                    reporter_count = len(reporter_hits_df)
                     reporter_rate = (reporter_count / total_wells * 100) if total_wells > 0 else 0
                     
                     st.write(f"**Found {reporter_count:,} reporter hits ({reporter_rate:.1f}% of {total_wells:,} wells)**")
                     st.write("Reporter hits are compounds that show Z-score ≥ 2.0 for lptA OR ldtD **AND** pass viability gates (ATP levels).")
                     
-                    if len(reporter_hits_df) > 0:
-                        # Rank hits by selected metric
-                        if rank_by_reporter == "B-score" and apply_b_scoring and all(col in reporter_hits_df.columns for col in ['B_Z_lptA', 'B_Z_ldtD']):
-                            reporter_hits_df['rank_score'] = reporter_hits_df[['B_Z_lptA', 'B_Z_ldtD']].abs().max(axis=1)
-                        elif all(col in reporter_hits_df.columns for col in ['Z_lptA', 'Z_ldtD']):
-                            reporter_hits_df['rank_score'] = reporter_hits_df[['Z_lptA', 'Z_ldtD']].abs().max(axis=1)
-                        else:
-                            reporter_hits_df['rank_score'] = 0
-                        
-                        reporter_hits_df = reporter_hits_df.sort_values('rank_score', ascending=False).head(display_top_n_reporter)
-                        
-                        # Prepare display columns for reporter hits
-                        display_cols = []
-                        
-                        # Essential columns
-                        essential_cols = [
-                            ('PlateID', ['PlateID', 'Plate_ID', 'plate_id']),
-                            ('Well', ['Well', 'WellID', 'well_id']),
-                            ('Ratio_lptA', ['Ratio_lptA']),
-                            ('Ratio_ldtD', ['Ratio_ldtD'])
-                        ]
-                        
-                        for col_name, alternatives in essential_cols:
-                            for alt in alternatives:
-                                if alt in reporter_hits_df.columns:
-                                    display_cols.append(alt)
-                                    break
-                            else:
-                                if col_name == 'Well' and 'Row' in reporter_hits_df.columns and 'Col' in reporter_hits_df.columns:
-                                    display_cols.extend(['Row', 'Col'])
-                        
-                        # Add Z-score columns
-                        if rank_by_reporter == "B-score" and apply_b_scoring:
-                            z_cols = ['B_Z_lptA', 'B_Z_ldtD', 'Z_lptA', 'Z_ldtD']  # Show both for comparison
-                        else:
-                            z_cols = ['Z_lptA', 'Z_ldtD']
-                            if apply_b_scoring:
-                                z_cols.extend(['B_Z_lptA', 'B_Z_ldtD'])  # Show B-scores too if available
-                        
-                        display_cols.extend(z_cols)
-                        
-                        # Add viability columns
-                        viability_cols = [col for col in ['viable_lptA', 'viable_ldtD'] if col in reporter_hits_df.columns]
-                        display_cols.extend(viability_cols)
-                        
-                        # Add hit calling flag
-                        display_cols.append('LumHit')
-                        
-                        # Filter to existing columns and remove duplicates
-                        existing_display_cols = list(dict.fromkeys([col for col in display_cols if col in reporter_hits_df.columns]))
+                    if reporter_count > 0:
+                        reporter_table = reporter_hits_display(
+                            data_key, df, rank_by_reporter, apply_b_scoring, display_top_n_reporter
+                        )
                         
-                        if existing_display_cols:
-                            # Format the dataframe for display
-                            reporter_display = reporter_hits_df[existing_display_cols].copy()
-                            
-                            # Drop the ranking score column if it exists
-                            if 'rank_score' in reporter_display.columns:
-                                reporter_display = reporter_display.drop(columns=['rank_score'])
-                            
-                            # Round numeric columns
-                            numeric_cols = ['Ratio_lptA', 'Ratio_ldtD'] + [col for col in z_cols if col in reporter_display.columns]
-                            for col in numeric_cols:
-                                if col in reporter_display.columns and pd.api.types.is_numeric_dtype(reporter_display[col]):
-                                    reporter_display[col] = reporter_display[col].round(3)
+                        if reporter_table is not None:
+                            reporter_display, reporter_shown, reporter_csv = reporter_table
                             
-                            st.dataframe(reporter_display, use_container_width=True, height=400)
+                            st.dataframe(reporter_shown, use_container_width=True, height=400)
                             
                             # Download reporter hits
-                            reporter_csv = reporter_display.to_csv(index=False)
                             st.download_button(
                                 f"📥 Download Reporter Hits CSV ({len(reporter_display)} hits)",
                                 reporter_csv,
@@ -1814,14 +2488,16 @@ def main() -> None:
                 st.info("👆 Process plate data first to identify reporter hits.")
 
     # Vitality Hits Tab - only show when multi-stage enabled  
-    if vitality_hits_tab is not None:
+    if tab_is_open(vitality_hits_tab):
         with vitality_hits_tab:
             st.header("⚡ Vitality Hits")
             
             if df is not None and len(df) > 0:
                 # Check if vitality hit data is available
                 if 'vitality_hit' in df.columns:
-                    vitality_hits_df = df[df['vitality_hit'] == True].copy()
+                    # Only the hit count is needed here; the cached table builder
+                    # selects the hit rows itself
+                    vitality_count = int(df['vitality_hit'].to_numpy(dtype=bool, na_value=False).sum())
                     
                     # Controls for Vitality Hits
                     control_col1, control_col2 = st.columns(2)
@@ -1835,91 +2511,34 @@ def main() -> None:
                         )
                     
                     with control_col2:
-                        vitality_count = len(vitality_hits_df) if len(vitality_hits_df) > 0 else 100
+                        max_vitality = vitality_count if vitality_count > 0 else 100
                         display_top_n_vitality = st.number_input(
                             "Display Top N:",
-                            min_value=min(10, vitality_count),
-                            max_value=min(1000, vitality_count),
-                            value=min(100, vitality_count, max(10, vitality_count)),
-                            step=1 if vitality_count < 10 else 10,
+                            min_value=min(10, max_vitality),
+                            max_value=min(1000, max_vitality),
+                            value=min(100, max_vitality, max(10, max_vitality)),
+                            step=1 if max_vitality < 10 else 10,
                             key="vitality_top_n"
                         )
                     
                     # Display vitality hits summary
                     total_wells = len(df)
-                    vitality_count = len(vitality_hits_df)
                     vitality_rate = (vitality_count / total_wells * 100) if total_wells > 0 else 0
                     
                     st.write(f"**Found {vitality_count:,} vitality hits ({vitality_rate:.1f}% of {total_wells:,} wells)**")
                     st.write("Vitality hits show the desired growth pattern: **tolC% ≤ 80%** (inhibited), **WT% > 80%** AND **SA% > 80%** (surviving).")
                     
-                    if len(vitality_hits_df) > 0:
-                        # Sort hits by selected metric
-                        if sort_by_vitality == "tolC% (ascending)" and 'tolC%' in vitality_hits_df.columns:
-                            vitality_hits_df = vitality_hits_df.sort_values('tolC%', ascending=True).head(display_top_n_vitality)
-                        elif sort_by_vitality == "WT% (descending)" and 'WT%' in vitality_hits_df.columns:
-                            vitality_hits_df = vitality_hits_df.sort_values('WT%', ascending=False).head(display_top_n_vitality)
-                        elif sort_by_vitality == "SA% (descending)" and 'SA%' in vitality_hits_df.columns:
-                            vitality_hits_df = vitality_hits_df.sort_values('SA%', ascending=False).head(display_top_n_vitality)
-                        else:
-                            vitality_hits_df = vitality_hits_df.head(display_top_n_vitality)
-                        
-                        # Prepare display columns for vitality hits
-                        display_cols = []
-                        
-                        # Essential columns
-                        essential_cols = [
-                            ('PlateID', ['PlateID', 'Plate_ID', 'plate_id']),
-                            ('Well', ['Well', 'WellID', 'well_id'])
-                        ]
-                        
-                        for col_name, alternatives in essential_cols:
-                            for alt in alternatives:
-                                if alt in vitality_hits_df.columns:
-                                    display_cols.append(alt)
-                                    break
-                            else:
-                                if col_name == 'Well' and 'Row' in vitality_hits_df.columns and 'Col' in vitality_hits_df.columns:
-                                    display_cols.extend(['Row', 'Col'])
-                        
-                        # Add OD percentage columns (key for vitality analysis)
-                        od_pct_cols = [col for col in ['WT%', 'tolC%', 'SA%'] if col in vitality_hits_df.columns]
-                        display_cols.extend(od_pct_cols)
-                        
-                        # Add raw OD measurements for reference
-                        od_raw_cols = [col for col in ['OD_WT', 'OD_tolC', 'OD_SA'] if col in vitality_hits_df.columns]
-                        display_cols.extend(od_raw_cols)
-                        
-                        # Add hit calling flag
-                        display_cols.append('OMpatternOK')
-                        
-                        # Add Z-scores if available (for context)
-                        
-                        # Filter to existing columns and remove duplicates
-                        existing_display_cols = list(dict.fromkeys([col for col in display_cols if col in vitality_hits_df.columns]))
+                    if vitality_count > 0:
+                        vitality_table = vitality_hits_display(
+                            data_key, df, sort_by_vitality, display_top_n_vitality
+                        )
                         
-                        if existing_display_cols:
-                            # Format the dataframe for display
-                            vitality_display = vitality_hits_df[existing_display_cols].copy()
-                            
-                            # Convert OD percentages to percentage format and round
-                            for col in od_pct_cols:
-                                if col in vitality_display.columns and pd.api.types.is_numeric_dtype(vitality_display[col]):
-                                    vitality_display[col] = (vitality_display[col] * 100).round(1)
+                        if vitality_table is not None:
+                            vitality_display, vitality_shown, vitality_csv = vitality_table
                             
-                            # Round other numeric columns
-                            numeric_cols = [col for col in ['Z_lptA', 'Z_ldtD', 'B_Z_lptA', 'B_Z_ldtD', 'OD_WT', 'OD_tolC', 'OD_SA'] if col in vitality_display.columns]
-                            for col in numeric_cols:
-                                if col in vitality_display.columns and pd.api.types.is_numeric_dtype(vitality_display[col]):
-                                    if col.startswith('OD_'):
-                                        vitality_display[col] = vitality_display[col].round(3)
-                                    else:
-                                        vitality_display[col] = vitality_display[col].round(3)
-                            
-                            st.dataframe(vitality_display, use_container_width=True, height=400)
+                            st.dataframe(vitality_shown, use_container_width=True, height=400)
                             
                             # Download vitality hits
-                            vitality_csv = vitality_display.to_csv(index=False)
                             st.download_button(
                                 f"📥 Download Vitality Hits CSV ({len(vitality_display)} hits)",
                                 vitality_csv,
@@ -1928,7 +2547,7 @@ def main() -> None:
                             )
                             
                             # Show vitality criteria summary
-                            if len(od_pct_cols) >= 3:
+                            if {'WT%', 'tolC%', 'SA%'} <= set(vitality_display.columns):
                                 st.subheader("Vitality Criteria Summary")
                                 criteria_col1, criteria_col2, criteria_col3 = st.columns(3)
                                 
@@ -1958,7 +2577,7 @@ def main() -> None:
                 st.info("👆 Process plate data first to identify vitality hits.")
     
     # Hit Calling Tab - only show when multi-stage enabled
-    if hit_calling_tab is not None:
+    if tab_is_open(hit_calling_tab):
         with hit_calling_tab:
             st.header("🔬 Multi-Stage Hit Calling Pipeline")
             
@@ -2014,34 +2633,8 @@ def main() -> None:
                         st.subheader("🔬 Biological Hit Calling Flow")
                         st.caption("Flow shows compound filtering through biological evidence requirements")
                         
-                        # Create Sankey flow diagram
-                        fig_sankey = go.Figure(data=[go.Sankey(
-                            node = dict(
-                                pad = 15,
-                                thickness = 20,
-                                line = dict(color = "black", width = 0.5),
-                                label = [
-                                    f"Total Wells<br>({total_wells})",
-                                    f"Reporter Hits<br>({reporter_hits})", 
-                                    f"Vitality Hits<br>({vitality_hits})",
-                                    f"Platform Hits<br>({platform_hits})"
-                                ],
-                                color = ["lightblue", "orange", "lightgreen", "crimson"]
-                            ),
-                            link = dict(
-                                source = [0, 0, 1, 2],
-                                target = [1, 2, 3, 3], 
-                                value = [reporter_hits, vitality_hits, platform_hits, platform_hits],
-                                color = ["rgba(255,165,0,0.6)", "rgba(144,238,144,0.6)", 
-                                       "rgba(220,20,60,0.8)", "rgba(220,20,60,0.8)"]
-                            )
-                        )])
-                        
-                        fig_sankey.update_layout(
-                            title="OM Permeabilizer Discovery Pipeline",
-                            height=400,
-                            margin=dict(l=50, r=50, t=60, b=50)
-                        )
+                        # Flow diagram figure is built once per distinct set of counts
+                        fig_sankey = hit_flow_sankey(total_wells, reporter_hits, vitality_hits, platform_hits)
                         st.plotly_chart(fig_sankey, use_container_width=True)
                     
                     # Hit analysis report
@@ -2057,670 +2650,499 @@ def main() -> None:
                 st.info("📊 Process plate data to see multi-stage hit calling analysis for outer membrane permeabilizer discovery.")
     
     # Visualizations Tab
-    with viz_tab:
-        st.header("Visualizations")
-        
-        if df is not None and len(df) > 0:
-            # Legend expertise level selector - Prominent section
-            st.markdown("### 📖 Figure Legends & Explanations")
+    if tab_is_open(viz_tab):
+        with viz_tab:
+            st.header("Visualizations")
             
-            legend_control_container = st.container()
-            with legend_control_container:
-                expertise_col1, expertise_col2, expertise_col3 = st.columns([1, 2, 3])
-                
-                with expertise_col1:
-                    legend_expertise = st.selectbox(
-                        "**Detail Level:**",
-                        ["Basic", "Intermediate", "Expert"],
-                        index=1,  # Default to Intermediate
-                        help="Choose how much scientific detail to include in figure legends"
-                    )
-                    expertise_level = ExpertiseLevel(legend_expertise.lower())
-                
-                with expertise_col2:
-                    # Show character count info
-                    char_info = {
-                        "Basic": "~500 chars",
-                        "Intermediate": "~1200 chars", 
-                        "Expert": "~2500 chars"
-                    }
-                    st.markdown(f"**Content:** {char_info[legend_expertise]}")
-                    st.markdown("**Includes:** Context + Methods + Interpretation")
-                
-                with expertise_col3:
-                    if legend_expertise == "Basic":
-                        st.info("🟢 **Basic Level** - Essential context for general understanding")
-                    elif legend_expertise == "Intermediate":  
-                        st.info("🟡 **Intermediate Level** - Balanced detail with biological and statistical context")
+            if df is not None and len(df) > 0:
+                from visualizations.legends.models import ChartType, ExpertiseLevel
+                from visualizations.legends.integration import StreamlitIntegration, VisualizationIntegrator
+                
+                # Legend expertise level selector - Prominent section
+                st.markdown("### 📖 Figure Legends & Explanations")
+                
+                legend_control_container = st.container()
+                with legend_control_container:
+                    expertise_col1, expertise_col2, expertise_col3 = st.columns([1, 2, 3])
+                    
+                    with expertise_col1:
+                        legend_expertise = st.selectbox(
+                            "**Detail Level:**",
+                            ["Basic", "Intermediate", "Expert"],
+                            index=1,  # Default to Intermediate
+                            help="Choose how much scientific detail to include in figure legends"
+                        )
+                        expertise_level = ExpertiseLevel(legend_expertise.lower())
+                    
+                    with expertise_col2:
+                        # Show character count info
+                        char_info = {
+                            "Basic": "~500 chars",
+                            "Intermediate": "~1200 chars", 
+                            "Expert": "~2500 chars"
+                        }
+                        st.markdown(f"**Content:** {char_info[legend_expertise]}")
+                        st.markdown("**Includes:** Context + Methods + Interpretation")
+                    
+                    with expertise_col3:
+                        if legend_expertise == "Basic":
+                            st.info("🟢 **Basic Level** - Essential context for general understanding")
+                        elif legend_expertise == "Intermediate":  
+                            st.info("🟡 **Intermediate Level** - Balanced detail with biological and statistical context")
+                        else:
+                            st.info("🔴 **Expert Level** - Comprehensive methodology, formulas, and scientific references")
+                
+                st.markdown("**📊 Each visualization below includes an expandable scientific legend tailored to your selected detail level.**")
+                st.markdown("---")
+                
+                # Initialize legend integration
+                integrator = VisualizationIntegrator()
+                st_integration = StreamlitIntegration(integrator)
+                
+                # Create 2x2 grid
+                viz_col1, viz_col2 = st.columns(2)
+                
+                with viz_col1:
+                    # Histogram of Raw Z_lptA
+                    st.subheader("Raw Z_lptA Distribution")
+                    if 'Z_lptA' in df.columns:
+                        fig1 = z_histogram(df['Z_lptA'], "Raw Z_lptA Distribution", 'steelblue', z_cutoff)
+                        st.plotly_chart(fig1, use_container_width=True)
+                        
+                        # Add scientific legend
+                        legend = integrator.legend_manager.create_legend(
+                            data=df,
+                            chart_type=ChartType.HISTOGRAM,
+                            expertise_level=expertise_level
+                        )
+                        
+                        with st.expander("📖 Z_lptA Distribution Legend", expanded=False):
+                            content = st_integration.formatter.create_expandable_legend(legend)
+                            st.markdown(content)
                     else:
-                        st.info("🔴 **Expert Level** - Comprehensive methodology, formulas, and scientific references")
-            
-            st.markdown("**📊 Each visualization below includes an expandable scientific legend tailored to your selected detail level.**")
-            st.markdown("---")
-            
-            # Initialize legend integration
-            integrator = VisualizationIntegrator()
-            st_integration = StreamlitIntegration(integrator)
-            
-            # Create 2x2 grid
-            viz_col1, viz_col2 = st.columns(2)
-            
-            with viz_col1:
-                # Histogram of Raw Z_lptA
-                st.subheader("Raw Z_lptA Distribution")
-                if 'Z_lptA' in df.columns:
-                    fig1 = px.histogram(
-                        df, 
-                        x='Z_lptA', 
-                        nbins=50,
-                        title="Raw Z_lptA Distribution",
-                        color_discrete_sequence=['steelblue']
-                    )
-                    fig1.add_vline(x=z_cutoff, line_dash="dash", line_color="red", annotation_text=f"Threshold: {z_cutoff}")
-                    fig1.add_vline(x=-z_cutoff, line_dash="dash", line_color="red")
-                    st.plotly_chart(fig1, use_container_width=True)
-                    
-                    # Add scientific legend
-                    legend = integrator.legend_manager.create_legend(
-                        data=df,
-                        chart_type=ChartType.HISTOGRAM,
-                        expertise_level=expertise_level
-                    )
-                    
-                    with st.expander("📖 Z_lptA Distribution Legend", expanded=False):
-                        content = st_integration.formatter.create_expandable_legend(legend)
-                        st.markdown(content)
-                else:
-                    st.warning("Z_lptA column not available")
-            
-            with viz_col2:
-                # Histogram of Raw Z_ldtD
-                st.subheader("Raw Z_ldtD Distribution")
-                if 'Z_ldtD' in df.columns:
-                    fig2 = px.histogram(
-                        df, 
-                        x='Z_ldtD', 
-                        nbins=50,
-                        title="Raw Z_ldtD Distribution",
-                        color_discrete_sequence=['darkgreen']
-                    )
-                    fig2.add_vline(x=z_cutoff, line_dash="dash", line_color="red", annotation_text=f"Threshold: {z_cutoff}")
-                    fig2.add_vline(x=-z_cutoff, line_dash="dash", line_color="red")
-                    st.plotly_chart(fig2, use_container_width=True)
-                    
-                    # Add scientific legend
-                    legend = integrator.legend_manager.create_legend(
-                        data=df,
-                        chart_type=ChartType.HISTOGRAM,
-                        expertise_level=expertise_level
-                    )
-                    
-                    with st.expander("📖 Z_ldtD Distribution Legend", expanded=False):
-                        content = st_integration.formatter.create_expandable_legend(legend)
-                        st.markdown(content)
-                else:
-                    st.warning("Z_ldtD column not available")
-            
-            # Second row
-            viz_col3, viz_col4 = st.columns(2)
-            
-            with viz_col3:
-                # Scatter plot of ratios
-                st.subheader("Ratio Correlation")
-                if all(col in df.columns for col in ['Ratio_lptA', 'Ratio_ldtD', 'PlateID']):
-                    fig3 = px.scatter(
-                        df,
-                        x='Ratio_lptA',
-                        y='Ratio_ldtD',
-                        color='PlateID',
-                        title="Ratio_lptA vs Ratio_ldtD",
-                        hover_data=['Well'] if 'Well' in df.columns else None
-                    )
-                    st.plotly_chart(fig3, use_container_width=True)
-                    
-                    # Add scientific legend
-                    legend = integrator.legend_manager.create_legend(
-                        data=df,
-                        chart_type=ChartType.SCATTER_PLOT,
-                        expertise_level=expertise_level
-                    )
-                    
-                    with st.expander("📖 Ratio Correlation Legend", expanded=False):
-                        content = st_integration.formatter.create_expandable_legend(legend)
-                        st.markdown(content)
-                else:
-                    st.warning("Required ratio columns not available")
-            
-            with viz_col4:
-                # Viability counts by plate
-                st.subheader("Viability by Plate")
-                if 'viability_ok_lptA' in df.columns and 'PlateID' in df.columns:
-                    # Create a proper DataFrame for the bar chart
-                    viability_summary = df.groupby('PlateID')['viability_ok_lptA'].value_counts().unstack(fill_value=0)
-                    
-                    # Create the DataFrame in the right format for plotly
-                    plot_data = []
-                    for plate in viability_summary.index:
-                        viable_count = viability_summary.loc[plate].get(True, 0)
-                        non_viable_count = viability_summary.loc[plate].get(False, 0)
+                        st.warning("Z_lptA column not available")
+                
+                with viz_col2:
+                    # Histogram of Raw Z_ldtD
+                    st.subheader("Raw Z_ldtD Distribution")
+                    if 'Z_ldtD' in df.columns:
+                        fig2 = z_histogram(df['Z_ldtD'], "Raw Z_ldtD Distribution", 'darkgreen', z_cutoff)
+                        st.plotly_chart(fig2, use_container_width=True)
                         
-                        plot_data.append({
-                            'PlateID': plate,
-                            'Status': 'Viable',
-                            'Count': viable_count
-                        })
-                        plot_data.append({
-                            'PlateID': plate,
-                            'Status': 'Non-Viable',
-                            'Count': non_viable_count
+                        # Add scientific legend
+                        legend = integrator.legend_manager.create_legend(
+                            data=df,
+                            chart_type=ChartType.HISTOGRAM,
+                            expertise_level=expertise_level
+                        )
+                        
+                        with st.expander("📖 Z_ldtD Distribution Legend", expanded=False):
+                            content = st_integration.formatter.create_expandable_legend(legend)
+                            st.markdown(content)
+                    else:
+                        st.warning("Z_ldtD column not available")
+                
+                # Second row
+                viz_col3, viz_col4 = st.columns(2)
+                
+                with viz_col3:
+                    # Scatter plot of ratios
+                    st.subheader("Ratio Correlation")
+                    if all(col in df.columns for col in ['Ratio_lptA', 'Ratio_ldtD', 'PlateID']):
+                        fig3 = px.scatter(
+                            df,
+                            x='Ratio_lptA',
+                            y='Ratio_ldtD',
+                            color='PlateID',
+                            title="Ratio_lptA vs Ratio_ldtD",
+                            hover_data=['Well'] if 'Well' in df.columns else None
+                        )
+                        st.plotly_chart(fig3, use_container_width=True)
+                        
+                        # Add scientific legend
+                        legend = integrator.legend_manager.create_legend(
+                            data=df,
+                            chart_type=ChartType.SCATTER_PLOT,
+                            expertise_level=expertise_level
+                        )
+                        
+                        with st.expander("📖 Ratio Correlation Legend", expanded=False):
+                            content = st_integration.formatter.create_expandable_legend(legend)
+                            st.markdown(content)
+                    else:
+                        st.warning("Required ratio columns not available")
+                
+                with viz_col4:
+                    # Viability counts by plate
+                    st.subheader("Viability by Plate")
+                    if 'viability_ok_lptA' in df.columns and 'PlateID' in df.columns:
+                        # Per-plate viable/non-viable counts: two bincounts over the
+                        # factorized plate codes (missing flags count as neither)
+                        plate_codes, plates = pd.factorize(df['PlateID'], sort=True)
+                        flags = df['viability_ok_lptA']
+                        viable = flags.to_numpy(dtype=bool, na_value=False)
+                        non_viable = flags.notna().to_numpy() & ~viable
+                        has_plate = plate_codes >= 0
+                        viable_counts = np.bincount(plate_codes[viable & has_plate], minlength=len(plates))
+                        non_viable_counts = np.bincount(plate_codes[non_viable & has_plate], minlength=len(plates))
+                        
+                        # Long format for plotly
+                        plot_df = pd.DataFrame({
+                            'PlateID': np.concatenate([plates, plates]),
+                            'Status': ['Viable'] * len(plates) + ['Non-Viable'] * len(plates),
+                            'Count': np.concatenate([viable_counts, non_viable_counts])
                         })
-                    
-                    plot_df = pd.DataFrame(plot_data)
-                    
-                    fig4 = px.bar(
-                        plot_df,
-                        x='PlateID',
-                        y='Count',
-                        color='Status',
-                        title="Viability Counts by Plate (lptA)",
-                        color_discrete_map={'Viable': 'lightblue', 'Non-Viable': 'lightcoral'}
-                    )
-                    fig4.update_layout(showlegend=True)
-                    st.plotly_chart(fig4, use_container_width=True)
-                    
-                    # Add scientific legend
-                    legend = integrator.legend_manager.create_legend(
-                        data=df,
-                        chart_type=ChartType.BAR_CHART,
-                        expertise_level=expertise_level
-                    )
-                    
-                    with st.expander("📖 Viability Analysis Legend", expanded=False):
-                        content = st_integration.formatter.create_expandable_legend(legend)
-                        st.markdown(content)
-                else:
-                    st.warning("Viability data not available")
-        else:
-            st.info("👆 Process plate data first to see visualizations.")
+                        
+                        fig4 = px.bar(
+                            plot_df,
+                            x='PlateID',
+                            y='Count',
+                            color='Status',
+                            title="Viability Counts by Plate (lptA)",
+                            color_discrete_map={'Viable': 'lightblue', 'Non-Viable': 'lightcoral'}
+                        )
+                        fig4.update_layout(showlegend=True)
+                        st.plotly_chart(fig4, use_container_width=True)
+                        
+                        # Add scientific legend
+                        legend = integrator.legend_manager.create_legend(
+                            data=df,
+                            chart_type=ChartType.BAR_CHART,
+                            expertise_level=expertise_level
+                        )
+                        
+                        with st.expander("📖 Viability Analysis Legend", expanded=False):
+                            content = st_integration.formatter.create_expandable_legend(legend)
+                            st.markdown(content)
+                    else:
+                        st.warning("Viability data not available")
+            else:
+                st.info("👆 Process plate data first to see visualizations.")
     
     # Heatmaps Tab
-    with heatmaps_tab:
-        st.header("Heatmaps")
-        
-        if df is not None and len(df) > 0 and 'PlateID' in df.columns:
-            # Legend expertise level selector for heatmaps - Prominent section  
-            st.markdown("### 📖 Heatmap Legends & Scientific Context")
-            
-            heatmap_legend_container = st.container()
-            with heatmap_legend_container:
-                heatmap_expertise_col1, heatmap_expertise_col2, heatmap_expertise_col3 = st.columns([1, 2, 3])
-                
-                with heatmap_expertise_col1:
-                    heatmap_legend_expertise = st.selectbox(
-                        "**Detail Level:**",
-                        ["Basic", "Intermediate", "Expert"],
-                        index=1,  # Default to Intermediate
-                        help="Choose how much scientific detail to include in heatmap legends",
-                        key="heatmap_expertise"
+    if tab_is_open(heatmaps_tab):
+        with heatmaps_tab:
+            st.header("Heatmaps")
+            
+            if df is not None and len(df) > 0 and 'PlateID' in df.columns:
+                from visualizations.legends.models import ChartType, ExpertiseLevel
+                from visualizations.legends.integration import StreamlitIntegration, VisualizationIntegrator
+                
+                # Legend expertise level selector for heatmaps - Prominent section  
+                st.markdown("### 📖 Heatmap Legends & Scientific Context")
+                
+                heatmap_legend_container = st.container()
+                with heatmap_legend_container:
+                    heatmap_expertise_col1, heatmap_expertise_col2, heatmap_expertise_col3 = st.columns([1, 2, 3])
+                    
+                    with heatmap_expertise_col1:
+                        heatmap_legend_expertise = st.selectbox(
+                            "**Detail Level:**",
+                            ["Basic", "Intermediate", "Expert"],
+                            index=1,  # Default to Intermediate
+                            help="Choose how much scientific detail to include in heatmap legends",
+                            key="heatmap_expertise"
+                        )
+                        heatmap_expertise_level = ExpertiseLevel(heatmap_legend_expertise.lower())
+                    
+                    with heatmap_expertise_col2:
+                        # Show character count info
+                        char_info = {
+                            "Basic": "~500 chars",
+                            "Intermediate": "~1200 chars", 
+                            "Expert": "~2500 chars"
+                        }
+                        st.markdown(f"**Content:** {char_info[heatmap_legend_expertise]}")
+                        st.markdown("**Focus:** Spatial patterns + Biology + Statistics")
+                    
+                    with heatmap_expertise_col3:
+                        if heatmap_legend_expertise == "Basic":
+                            st.info("🟢 **Basic Level** - Essential heatmap interpretation for spatial patterns")
+                        elif heatmap_legend_expertise == "Intermediate":  
+                            st.info("🟡 **Intermediate Level** - Biological significance + statistical methods for heatmaps")
+                        else:
+                            st.info("🔴 **Expert Level** - Complete methodology + spatial analysis + edge effects")
+                            
+                st.markdown("**🔥 Each heatmap below includes a scientific legend explaining spatial patterns, biological significance, and statistical interpretation.**")
+                st.markdown("---")
+                
+                # Initialize legend integration for heatmaps
+                heatmap_integrator = VisualizationIntegrator()
+                heatmap_st_integration = StreamlitIntegration(heatmap_integrator)
+                # Get plate families (computed once per processed dataset)
+                plate_families = dataset_plate_families(data_key, df)
+                
+                # Controls
+                heatmap_col1, heatmap_col2, heatmap_col3 = st.columns(3)
+                
+                with heatmap_col1:
+                    # Data type selection
+                    data_type_options = []
+                    
+                    # Check which data types are available
+                    if any(col in df.columns for col in ['BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD']):
+                        data_type_options.append("Raw Signals")
+                    if any(col in df.columns for col in ['Ratio_lptA', 'Ratio_ldtD']):
+                        data_type_options.append("Ratios")
+                    if any(col in df.columns for col in ['Z_lptA', 'Z_ldtD', 'B_Z_lptA', 'B_Z_ldtD']):
+                        data_type_options.append("Z-Scores")
+                    if any(col in df.columns for col in ['OD_WT', 'OD_tolC', 'OD_SA', 'OD_norm_WT', 'OD_norm_tolC', 'OD_norm_SA']):
+                        data_type_options.append("Viability")
+                    
+                    selected_data_type = st.selectbox(
+                        "Data Type:",
+                        data_type_options,
+                        help="Select type of data to visualize across all plates"
                     )
-                    heatmap_expertise_level = ExpertiseLevel(heatmap_legend_expertise.lower())
-                
-                with heatmap_expertise_col2:
-                    # Show character count info
-                    char_info = {
-                        "Basic": "~500 chars",
-                        "Intermediate": "~1200 chars", 
-                        "Expert": "~2500 chars"
-                    }
-                    st.markdown(f"**Content:** {char_info[heatmap_legend_expertise]}")
-                    st.markdown("**Focus:** Spatial patterns + Biology + Statistics")
-                
-                with heatmap_expertise_col3:
-                    if heatmap_legend_expertise == "Basic":
-                        st.info("🟢 **Basic Level** - Essential heatmap interpretation for spatial patterns")
-                    elif heatmap_legend_expertise == "Intermediate":  
-                        st.info("🟡 **Intermediate Level** - Biological significance + statistical methods for heatmaps")
-                    else:
-                        st.info("🔴 **Expert Level** - Complete methodology + spatial analysis + edge effects")
-                        
-            st.markdown("**🔥 Each heatmap below includes a scientific legend explaining spatial patterns, biological significance, and statistical interpretation.**")
-            st.markdown("---")
-            
-            # Initialize legend integration for heatmaps
-            heatmap_integrator = VisualizationIntegrator()
-            heatmap_st_integration = StreamlitIntegration(heatmap_integrator)
-            # Get plate families
-            plate_families = get_plate_families(df)
-            
-            # Controls
-            heatmap_col1, heatmap_col2, heatmap_col3 = st.columns(3)
-            
-            with heatmap_col1:
-                # Data type selection
-                data_type_options = []
-                
-                # Check which data types are available
-                if any(col in df.columns for col in ['BG_lptA', 'BT_lptA', 'BG_ldtD', 'BT_ldtD']):
-                    data_type_options.append("Raw Signals")
-                if any(col in df.columns for col in ['Ratio_lptA', 'Ratio_ldtD']):
-                    data_type_options.append("Ratios")
-                if any(col in df.columns for col in ['Z_lptA', 'Z_ldtD', 'B_Z_lptA', 'B_Z_ldtD']):
-                    data_type_options.append("Z-Scores")
-                if any(col in df.columns for col in ['OD_WT', 'OD_tolC', 'OD_SA', 'OD_norm_WT', 'OD_norm_tolC', 'OD_norm_SA']):
-                    data_type_options.append("Viability")
-                
-                selected_data_type = st.selectbox(
-                    "Data Type:",
-                    data_type_options,
-                    help="Select type of data to visualize across all plates"
-                )
-            
-            with heatmap_col2:
-                # Extract family selection
-                extract_families = sorted(plate_families.keys())
-                selected_family = st.selectbox(
-                    "Microbial Extract:",
-                    extract_families,
-                    help="Select microbial extract to show all associated plates"
-                )
-            
-            with heatmap_col3:
-                # Edge effects overlay
-                show_edge_effects = st.checkbox(
-                    "Show Edge Effects",
-                    value=True,
-                    help="Highlight wells with detected edge effects"
-                )
-            
-            if selected_data_type and selected_family:
-                family_plates = plate_families[selected_family]
-                
-                # Define metrics based on data type
-                metrics_to_show = []
-                if selected_data_type == "Raw Signals":
-                    metrics_to_show = [('BG_lptA', 'Beta-gal lptA'), ('BT_lptA', 'BacTiter lptA'), 
-                                     ('BG_ldtD', 'Beta-gal ldtD'), ('BT_ldtD', 'BacTiter ldtD')]
-                elif selected_data_type == "Ratios":
-                    metrics_to_show = [('Ratio_lptA', 'Ratio lptA'), ('Ratio_ldtD', 'Ratio ldtD')]
-                elif selected_data_type == "Z-Scores":
-                    metrics_to_show = [('Z_lptA', 'Z-score lptA'), ('Z_ldtD', 'Z-score ldtD')]
-                    if 'B_Z_lptA' in df.columns:
-                        metrics_to_show.extend([('B_Z_lptA', 'B-score lptA'), ('B_Z_ldtD', 'B-score ldtD')])
-                elif selected_data_type == "Viability":
-                    # Prefer normalized OD if available, otherwise use raw OD
-                    if any(col in df.columns for col in ['OD_norm_WT', 'OD_norm_tolC', 'OD_norm_SA']):
-                        metrics_to_show = [('OD_norm_WT', 'OD WT (norm)'), ('OD_norm_tolC', 'OD tolC (norm)'), ('OD_norm_SA', 'OD SA (norm)')]
-                    else:
-                        metrics_to_show = [('OD_WT', 'OD WT'), ('OD_tolC', 'OD tolC'), ('OD_SA', 'OD SA')]
                 
-                # Filter to only show metrics that exist in the data
-                available_metrics = [(metric, label) for metric, label in metrics_to_show if metric in df.columns]
+                with heatmap_col2:
+                    # Extract family selection
+                    extract_families = sorted(plate_families.keys())
+                    selected_family = st.selectbox(
+                        "Microbial Extract:",
+                        extract_families,
+                        help="Select microbial extract to show all associated plates"
+                    )
                 
-                if available_metrics:
-                    st.subheader(f"{selected_data_type} - Extract {selected_family}")
-                    st.info(f"📊 Showing {len(available_metrics)} {selected_data_type.lower()} heatmaps")
-                    
-                    # Get edge effects results if available
-                    edge_results = st.session_state.get('edge_results', [])
-                    edge_warnings = {}
-                    if show_edge_effects and edge_results:
-                        for result in edge_results:
-                            if result.plate_id == selected_family:  # Match by family
-                                edge_warnings[result.metric] = result.warning_level
+                with heatmap_col3:
+                    # Edge effects overlay
+                    show_edge_effects = st.checkbox(
+                        "Show Edge Effects",
+                        value=True,
+                        help="Highlight wells with detected edge effects"
+                    )
+                
+                if selected_data_type and selected_family:
+                    family_plates = plate_families[selected_family]
+                    
+                    # Define metrics based on data type
+                    metrics_to_show = []
+                    if selected_data_type == "Raw Signals":
+                        metrics_to_show = [('BG_lptA', 'Beta-gal lptA'), ('BT_lptA', 'BacTiter lptA'), 
+                                         ('BG_ldtD', 'Beta-gal ldtD'), ('BT_ldtD', 'BacTiter ldtD')]
+                    elif selected_data_type == "Ratios":
+                        metrics_to_show = [('Ratio_lptA', 'Ratio lptA'), ('Ratio_ldtD', 'Ratio ldtD')]
+                    elif selected_data_type == "Z-Scores":
+                        metrics_to_show = [('Z_lptA', 'Z-score lptA'), ('Z_ldtD', 'Z-score ldtD')]
+                        if 'B_Z_lptA' in df.columns:
+                            metrics_to_show.extend([('B_Z_lptA', 'B-score lptA'), ('B_Z_ldtD', 'B-score ldtD')])
+                    elif selected_data_type == "Viability":
+                        # Prefer normalized OD if available, otherwise use raw OD
+                        if any(col in df.columns for col in ['OD_norm_WT', 'OD_norm_tolC', 'OD_norm_SA']):
+                            metrics_to_show = [('OD_norm_WT', 'OD WT (norm)'), ('OD_norm_tolC', 'OD tolC (norm)'), ('OD_norm_SA', 'OD SA (norm)')]
+                        else:
+                            metrics_to_show = [('OD_WT', 'OD WT'), ('OD_tolC', 'OD tolC'), ('OD_SA', 'OD SA')]
                     
-                    # Create grid layout based on number of metrics
-                    n_metrics = len(available_metrics)
-                    if n_metrics <= 2:
-                        cols = n_metrics
-                        rows = 1
-                    elif n_metrics <= 4:
-                        cols = 2
-                        rows = 2
-                    elif n_metrics <= 6:
-                        cols = 3
-                        rows = 2
-                    else:
-                        cols = 4
-                        rows = (n_metrics + 3) // 4
+                    # Filter to only show metrics that exist in the data
+                    available_metrics = [(metric, label) for metric, label in metrics_to_show if metric in df.columns]
                     
-                    # Display heatmaps in grid
-                    for row in range(rows):
-                        metric_cols = st.columns(cols)
-                        for col in range(cols):
-                            metric_idx = row * cols + col
-                            if metric_idx < len(available_metrics):
-                                metric, label = available_metrics[metric_idx]
-                                with metric_cols[col]:
-                                    try:
-                                        # Find the best plate with this metric data
-                                        family_df = df[df['PlateID'].isin(family_plates)]
-                                        plates_with_metric = family_df[family_df[metric].notna()]['PlateID'].unique()
-                                        
-                                        if len(plates_with_metric) > 0:
-                                            # Use the first plate with data for this metric
-                                            plate_id = plates_with_metric[0]
-                                            
-                                            fig = create_plate_heatmap(df, metric, plate_id)
-                                            fig.update_layout(
-                                                title=dict(text=f"{label}<br>{plate_id}", font=dict(size=12)),
-                                                height=300,
-                                                margin=dict(t=60, b=40, l=40, r=40)
-                                            )
-                                            
-                                            # Add edge effects warning if available
-                                            if show_edge_effects and metric in edge_warnings:
-                                                warning_level = edge_warnings[metric]
-                                                if warning_level != WarningLevel.INFO:
-                                                    warning_color = "🟨" if warning_level == WarningLevel.WARN else "🟥"
-                                                    st.caption(f"{warning_color} Edge effects detected")
-                                            
-                                            st.plotly_chart(fig, use_container_width=True)
-                                            
-                                            # Add scientific legend for heatmap
-                                            heatmap_legend = heatmap_integrator.legend_manager.create_legend(
-                                                data=family_df,
-                                                chart_type=ChartType.HEATMAP,
-                                                expertise_level=heatmap_expertise_level
-                                            )
-                                            
-                                            with st.expander(f"📖 {label} Heatmap Legend", expanded=False):
-                                                heatmap_content = heatmap_st_integration.formatter.create_expandable_legend(heatmap_legend)
-                                                st.markdown(heatmap_content)
-                                        else:
-                                            st.warning(f"No data for {label}")
+                    if available_metrics:
+                        st.subheader(f"{selected_data_type} - Extract {selected_family}")
+                        st.info(f"📊 Showing {len(available_metrics)} {selected_data_type.lower()} heatmaps")
+                        
+                        # Get edge effects results if available
+                        edge_results = ss.get('edge_results', [])
+                        edge_warnings = {}
+                        if show_edge_effects and edge_results:
+                            for result in edge_results:
+                                if result.plate_id == selected_family:  # Match by family
+                                    edge_warnings[result.metric] = result.warning_level
+                        
+                        # Create grid layout based on number of metrics
+                        n_metrics = len(available_metrics)
+                        if n_metrics <= 2:
+                            cols = n_metrics
+                            rows = 1
+                        elif n_metrics <= 4:
+                            cols = 2
+                            rows = 2
+                        elif n_metrics <= 6:
+                            cols = 3
+                            rows = 2
+                        else:
+                            cols = 4
+                            rows = (n_metrics + 3) // 4
+                        
+                        # Slice the family out of the full dataset once for all metrics
+                        family_df = df[df['PlateID'].isin(family_plates)]
+                        
+                        # Display heatmaps in grid
+                        for row in range(rows):
+                            metric_cols = st.columns(cols)
+                            for col in range(cols):
+                                metric_idx = row * cols + col
+                                if metric_idx < len(available_metrics):
+                                    metric, label = available_metrics[metric_idx]
+                                    with metric_cols[col]:
+                                        try:
+                                            fig = family_heatmap(data_key, family_df, selected_family, metric, label)
                                             
-                                    except Exception as e:
-                                        st.error(f"Error creating {label} heatmap: {str(e)}")
-                else:
-                    st.warning(f"No {selected_data_type.lower()} data available for extract {selected_family}")
-        else:
-            st.info("👆 Process plate data first to see heatmaps.")
+                                            if fig is not None:
+                                                # Add edge effects warning if available
+                                                if show_edge_effects and metric in edge_warnings:
+                                                    warning_level = edge_warnings[metric]
+                                                    if warning_level != WarningLevel.INFO:
+                                                        warning_color = "🟨" if warning_level == WarningLevel.WARN else "🟥"
+                                                        st.caption(f"{warning_color} Edge effects detected")
+                                                
+                                                st.plotly_chart(fig, use_container_width=True)
+                                                
+                                                # Add scientific legend for heatmap
+                                                heatmap_legend = heatmap_integrator.legend_manager.create_legend(
+                                                    data=family_df,
+                                                    chart_type=ChartType.HEATMAP,
+                                                    expertise_level=heatmap_expertise_level
+                                                )
+                                                
+                                                with st.expander(f"📖 {label} Heatmap Legend", expanded=False):
+                                                    heatmap_content = heatmap_st_integration.formatter.create_expandable_legend(heatmap_legend)
+                                                    st.markdown(heatmap_content)
+                                            else:
+                                                st.warning(f"No data for {label}")
+                                                
+                                        except Exception as e:
+                                            st.error(f"Error creating {label} heatmap: {str(e)}")
+                    else:
+                        st.warning(f"No {selected_data_type.lower()} data available for extract {selected_family}")
+            else:
+                st.info("👆 Process plate data first to see heatmaps.")
     
     # QC Report Tab
-    with qc_tab:
-        st.header("QC Report")
-        
-        if df is not None and len(df) > 0:
-            # Load configuration
-            config = load_config()
-            
-            # QC Dashboard (advanced visualization)
-            if config.get('visualization_features', {}).get('qc_dashboard', {}).get('enabled', True):
-                st.subheader("🔬 Quality Control Dashboard")
-                
-                try:
-                    qc_dashboard = QCDashboard(config)
-                    qc_dashboard.render_dashboard(df)
-                except Exception as e:
-                    st.error(f"Error rendering QC Dashboard: {str(e)}")
-                    logger.error(f"QC Dashboard error: {e}", exc_info=True)
-                
-                st.divider()
-            
-            st.subheader("📋 Quality Control Report Generation")
-            st.write("**Quality Control Report Generation**")
-            
-            # Quick reference formulas
-            with st.expander("📐 Calculation Formulas Reference", expanded=False):
-                st.markdown("**Core Calculations:**")
-                
-                st.markdown("• **Reporter Ratios:** (β-galactosidase signal / ATP viability)")
-                st.latex(r"Ratio_{lptA} = \frac{BG_{lptA}}{BT_{lptA}}, \quad Ratio_{ldtD} = \frac{BG_{ldtD}}{BT_{ldtD}}")
-                
-                st.markdown("• **Robust Z-scores:** (MAD-based, outlier-resistant)")
-                st.latex(r"Z = \frac{x - \text{median}(X)}{1.4826 \times \text{MAD}(X)}")
-                
-                st.markdown("• **Viability Gating:** (ATP-based cell viability filter)")
-                st.latex(r"viable = BT \geq f \times \text{median}(BT_{plate}), \quad f = 0.3")
-                
-                st.markdown("• **OD Normalization:** (plate-relative growth)")
-                st.latex(r"OD_{norm} = \frac{OD}{\text{median}(OD_{plate})}")
-                
-                st.markdown("**Hit Calling Logic:**")
-                
-                st.markdown("• **Reporter Hit:**")
-                st.latex(r"reporter\_hit = (Z_{lptA} \geq 2.0 \lor Z_{ldtD} \geq 2.0) \land viable")
-                
-                st.markdown("• **Vitality Hit:**")
-                st.latex(r"vitality\_hit = (WT > 0.8) \land (\Delta tolC \leq 0.8) \land (SA > 0.8)")
-                
-                st.markdown("• **Platform Hit:**")
-                st.latex(r"platform\_hit = reporter\_hit \land vitality\_hit")
-                
-                st.markdown("**B-score Correction (when enabled):**")
-                
-                st.markdown("• Median-polish iteration:")
-                st.latex(r"X'_{ij} = X_{ij} - \text{median}(row_i), \quad X''_{ij} = X'_{ij} - \text{median}(col_j)")
-                
-                st.markdown("• Robust scaling:")
-                st.latex(r"B = \frac{X''}{1.4826 \times \text{MAD}(X'')}")
-                
-                st.markdown("**Statistical Definitions:**")
-                
-                st.markdown("• **MAD (Median Absolute Deviation):**")
-                st.latex(r"MAD = \text{median}(|X_i - \text{median}(X)|)")
-                
-                st.markdown("• **Consistency Factor:**")
-                st.latex(r"1.4826 \approx \Phi^{-1}(0.75)")
-                st.caption("Inverse normal CDF at 75th percentile for normal distribution consistency")
-                st.markdown("• **Robustness:** Methods resist up to 50% outlier contamination")
+    if tab_is_open(qc_tab):
+        with qc_tab:
+            st.header("QC Report")
             
-            # Publication references section
-            with st.expander("📚 Key Publications & References", expanded=False):
-                st.markdown("""
-                **Primary Literature:**
-                
-                **🔬 Outer Membrane Biology & LPS Transport:**
-                1. **Silhavy, T.J., Kahne, D. and Walker, S.** (2010) 'The Bacterial Cell Envelope', *Cold Spring Harbor Perspectives in Biology*, 2(5), p. a000414.
-                   - Foundational review of Gram-negative cell envelope structure and function
-                
-                2. **Yoon, Y., Song, S.** (2024) 'Structural Insights into the Lipopolysaccharide Transport (Lpt) System as a Novel Antibiotic Target', *J Microbiol.* 62, 261–275.
-                   - Recent structural biology of LPS transport machinery
-                
-                3. **Martorana, A.M. et al.** (2011) 'Complex transcriptional organization regulates an Escherichia coli locus implicated in lipopolysaccharide biogenesis' *Research in Microbiology*, 162(5), pp. 470–482.
-                   - lptA gene regulation and σE stress response pathway
-                
-                **⚡ Peptidoglycan Remodeling & Stress Response:**
-                4. **Morè, N. et al.** (2019) 'Peptidoglycan Remodeling Enables Escherichia coli To Survive Severe Outer Membrane Assembly Defect' *mBio*, 10(1), p. 10.1128/mbio.02729-18.
-                   - ldtD function and 3-3 crosslink formation during OM stress
-                
-                **🎯 OM Permeabilization & Antibiotic Sensitization:**
-                5. **Chan, L.W. et al.** (2021) 'Selective Permeabilization of Gram-Negative Bacterial Membranes Using Multivalent Peptide Constructs for Antibiotic Sensitization' *ACS Infectious Diseases*, 7(4), p. 721.
-                   - Proof-of-concept for OM permeabilizer + antibiotic combination therapy
-                
-                6. **Zhu, S. et al.** (2024) 'The inactivation of tolC sensitizes Escherichia coli to perturbations in lipopolysaccharide transport,' *iScience*, 27(5), p. 109592.
-                   - ΔtolC strain hypersensitivity to OM perturbation
+            if df is not None and len(df) > 0:
+                # Load configuration
+                config = load_config()
                 
-                **📊 Statistical Methods:**
-                7. **Tukey, J.W.** (1977) 'Exploratory Data Analysis', Addison-Wesley.
-                   - Median polish algorithm for B-score calculation
+                # QC Dashboard (advanced visualization)
+                if config.get('visualization_features', {}).get('qc_dashboard', {}).get('enabled', True):
+                    st.subheader("🔬 Quality Control Dashboard")
+                    
+                    try:
+                        from visualizations.advanced.qc_dashboard import QCDashboard
+                        qc_dashboard = QCDashboard(config)
+                        qc_dashboard.render_dashboard(df)
+                    except Exception as e:
+                        st.error(f"Error rendering QC Dashboard: {str(e)}")
+                        logger.error(f"QC Dashboard error: {e}", exc_info=True)
+                    
+                    st.divider()
                 
-                8. **Rousseeuw, P.J. and Croux, C.** (1993) 'Alternatives to the median absolute deviation', *Journal of the American Statistical Association*, 88, pp. 1273-1283.
-                   - Robust statistics and MAD-based scaling
+                st.subheader("📋 Quality Control Report Generation")
+                st.write("**Quality Control Report Generation**")
                 
-                **🏆 Funding Acknowledgment:**
-                - This work is supported by the **BREAKthrough project**, funded by the European Union
-                - Grant focus: Novel antimicrobial strategies against Gram-negative pathogens
-                """)
-            
-            st.divider()
-            
-            # Report options
-            report_col1, report_col2 = st.columns(2)
-            
-            with report_col1:
-                include_formulas = st.checkbox("Include Formulas", value=True)
-                include_methodology = st.checkbox("Include Methodology", value=True)
-            
-            with report_col2:
-                include_edge_effects = st.checkbox("Include Edge Effects", value=bool(edge_results))
-                include_bscore_details = st.checkbox("Include B-score Details", value=apply_b_scoring)
-            
-            if st.button("📋 Generate PDF Report"):
-                with st.spinner("Generating QC report..."):
-                    # Create report manifest
-                    manifest = {
-                        'report_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'plates_processed': summary.get('plate_count', 0),
-                        'total_wells': summary.get('total_wells', 0),
-                        'viability_threshold': viability_threshold,
-                        'z_cutoff': z_cutoff,
-                        'b_scoring_applied': apply_b_scoring,
-                        'edge_effects_detected': len([r for r in edge_results if r.warning_level != WarningLevel.INFO]) if edge_results else 0,
-                        'sections_included': {
-                            'formulas': include_formulas,
-                            'methodology': include_methodology,
-                            'edge_effects': include_edge_effects,
-                            'bscore_details': include_bscore_details
-                        }
-                    }
+                # Quick reference formulas
+                with st.expander("📐 Calculation Formulas Reference", expanded=False):
+                    st.markdown("**Core Calculations:**")
                     
-                    # Display manifest
-                    st.subheader("Report Manifest")
-                    st.code(yaml.dump(manifest, default_flow_style=False), language='yaml')
+                    st.markdown("• **Reporter Ratios:** (β-galactosidase signal / ATP viability)")
+                    st.latex(r"Ratio_{lptA} = \frac{BG_{lptA}}{BT_{lptA}}, \quad Ratio_{ldtD} = \frac{BG_{ldtD}}{BT_{ldtD}}")
                     
-                    # For now, create a comprehensive text report
-                    # (PDF generation would require additional libraries like reportlab)
-                    report_sections = []
+                    st.markdown("• **Robust Z-scores:** (MAD-based, outlier-resistant)")
+                    st.latex(r"Z = \frac{x - \text{median}(X)}{1.4826 \times \text{MAD}(X)}")
                     
-                    # Header
-                    report_sections.append("# Plate Data Processing QC Report")
-                    report_sections.append(f"Generated: {manifest['report_date']}")
-                    report_sections.append("")
+                    st.markdown("• **Viability Gating:** (ATP-based cell viability filter)")
+                    st.latex(r"viable = BT \geq f \times \text{median}(BT_{plate}), \quad f = 0.3")
                     
-                    # Summary
-                    report_sections.append("## Summary")
-                    report_sections.append(f"- Plates processed: {manifest['plates_processed']}")
-                    report_sections.append(f"- Total wells: {manifest['total_wells']}")
-                    report_sections.append(f"- Viability threshold: {manifest['viability_threshold']}")
-                    report_sections.append(f"- Z-score cutoff: {manifest['z_cutoff']}")
-                    report_sections.append(f"- B-scoring applied: {manifest['b_scoring_applied']}")
-                    report_sections.append("")
+                    st.markdown("• **OD Normalization:** (plate-relative growth)")
+                    st.latex(r"OD_{norm} = \frac{OD}{\text{median}(OD_{plate})}")
                     
-                    # Edge effects
-                    if include_edge_effects and edge_results:
-                        report_sections.append("## Edge Effects Analysis")
-                        for result in edge_results:
-                            report_sections.append(f"### Plate {result.plate_id}")
-                            report_sections.append(f"- Warning level: {result.warning_level.value}")
-                            report_sections.append(f"- Effect size (d): {result.effect_size_d:.3f}")
-                            report_sections.append(f"- Edge wells: {result.n_edge_wells}")
-                            report_sections.append(f"- Interior wells: {result.n_interior_wells}")
-                            if not np.isnan(result.row_correlation):
-                                report_sections.append(f"- Row correlation: {result.row_correlation:.3f}")
-                            if not np.isnan(result.col_correlation):
-                                report_sections.append(f"- Column correlation: {result.col_correlation:.3f}")
-                            report_sections.append("")
+                    st.markdown("**Hit Calling Logic:**")
                     
-                    # Complete Scientific Formulas
-                    if include_formulas:
-                        report_sections.append("## Scientific Calculation Formulas")
-                        
-                        report_sections.append("### 1. Reporter Signal Processing")
-                        report_sections.append("**BetaGlo/BacTiter Ratios (Normalized Reporter Activity):**")
-                        report_sections.append("- Ratio_lptA = BG_lptA / BT_lptA")
-                        report_sections.append("- Ratio_ldtD = BG_ldtD / BT_ldtD")
-                        report_sections.append("")
-                        report_sections.append("**Biochemical Basis:**")
-                        report_sections.append("- BG (BetaGlo): β-galactosidase activity from lacZ reporter")
-                        report_sections.append("- BT (BacTiter): ATP-dependent luciferase activity (viability)")
-                        report_sections.append("- Ratio normalizes reporter signal to viable cell count")
-                        report_sections.append("")
-                        
-                        report_sections.append("### 2. Growth Measurements")
-                        report_sections.append("**OD Normalization (Plate-Relative Growth):**")
-                        report_sections.append("- OD_WT_norm = OD_WT / median(OD_WT_plate)")
-                        report_sections.append("- OD_tolC_norm = OD_tolC / median(OD_tolC_plate)")
-                        report_sections.append("- OD_SA_norm = OD_SA / median(OD_SA_plate)")
-                        report_sections.append("")
-                        
-                        report_sections.append("### 3. Robust Statistical Scoring")
-                        report_sections.append("**Robust Z-scores (MAD-based, outlier-resistant):**")
-                        report_sections.append("- Z = (value - median) / (1.4826 × MAD)")
-                        report_sections.append("- MAD = median(|values - median(values)|)")
-                        report_sections.append("- 1.4826 = consistency factor for normal distributions")
-                        report_sections.append("")
-                        report_sections.append("**Statistical Advantages:**")
-                        report_sections.append("- Resistant to outliers (up to 50% contamination)")
-                        report_sections.append("- No assumption of normal distribution")
-                        report_sections.append("- More stable than mean/standard deviation")
-                        report_sections.append("")
-                        
-                        if apply_b_scoring:
-                            report_sections.append("### 4. B-score Spatial Correction")
-                            report_sections.append("**Median Polish Algorithm:**")
-                            report_sections.append("1. Subtract row medians: X'ᵢⱼ = Xᵢⱼ - median(row_i)")
-                            report_sections.append("2. Subtract column medians: X''ᵢⱼ = X'ᵢⱼ - median(col_j)")
-                            report_sections.append("3. Iterate until convergence (tolerance = 1e-6)")
-                            report_sections.append("4. Apply robust scaling: B = X'' / (1.4826 × MAD(X''))")
-                            report_sections.append("")
-                        
-                        report_sections.append("### 5. Viability Gating")
-                        report_sections.append("**ATP-based Viability Filter:**")
-                        report_sections.append(f"- viability_ok = BT ≥ {viability_threshold} × median(BT_plate)")
-                        report_sections.append("- Excludes wells with insufficient ATP for reliable measurements")
-                        report_sections.append("- Based on D-luciferin + ATP → oxyluciferin + light reaction")
-                        report_sections.append("")
-                        
-                        report_sections.append("### 6. Multi-Stage Hit Calling")
-                        report_sections.append("**Stage 1 - Reporter Hits:**")
-                        report_sections.append(f"- lptA_hit = (Z_lptA ≥ {z_cutoff}) AND viability_ok")
-                        report_sections.append(f"- ldtD_hit = (Z_ldtD ≥ {z_cutoff}) AND viability_ok")
-                        report_sections.append("- reporter_hit = lptA_hit OR ldtD_hit")
-                        report_sections.append("")
-                        report_sections.append("**Stage 2 - Vitality Hits:**")
-                        report_sections.append("- WT_resist = OD_WT_norm > 0.8 (intact OM protection)")
-                        report_sections.append("- tolC_sensitive = OD_tolC_norm ≤ 0.8 (compromised OM vulnerability)")
-                        report_sections.append("- SA_unaffected = OD_SA_norm > 0.8 (no OM target)")
-                        report_sections.append("- vitality_hit = WT_resist AND tolC_sensitive AND SA_unaffected")
-                        report_sections.append("")
-                        report_sections.append("**Stage 3 - Platform Hits:**")
-                        report_sections.append("- platform_hit = reporter_hit AND vitality_hit")
-                        report_sections.append("- High-confidence OM permeabilizers with dual evidence")
-                        report_sections.append("")
+                    st.markdown("• **Reporter Hit:**")
+                    st.latex(r"reporter\_hit = (Z_{lptA} \geq 2.0 \lor Z_{ldtD} \geq 2.0) \land viable")
                     
-                    # Methodology
-                    if include_methodology:
-                        report_sections.append("## Methodology")
-                        report_sections.append("This analysis follows the plate data processing pipeline:")
-                        report_sections.append("1. Data validation and column mapping")
-                        report_sections.append("2. Ratio calculations (BG/BT)")
-                        report_sections.append("3. Robust Z-score calculation using median and MAD")
-                        report_sections.append("4. Viability gating based on ATP levels")
-                        if apply_b_scoring:
-                            report_sections.append("5. B-scoring for row/column bias correction")
-                        report_sections.append("6. Edge effect detection and quality assessment")
-                        report_sections.append("")
+                    st.markdown("• **Vitality Hit:**")
+                    st.latex(r"vitality\_hit = (WT > 0.8) \land (\Delta tolC \leq 0.8) \land (SA > 0.8)")
                     
-                    report_text = "\n".join(report_sections)
+                    st.markdown("• **Platform Hit:**")
+                    st.latex(r"platform\_hit = reporter\_hit \land vitality\_hit")
+                    
+                    st.markdown("**B-score Correction (when enabled):**")
+                    
+                    st.markdown("• Median-polish iteration:")
+                    st.latex(r"X'_{ij} = X_{ij} - \text{median}(row_i), \quad X''_{ij} = X'_{ij} - \text{median}(col_j)")
+                    
+                    st.markdown("• Robust scaling:")
+                    st.latex(r"B = \frac{X''}{1.4826 \times \text{MAD}(X'')}")
+                    
+                    st.markdown("**Statistical Definitions:**")
+                    
+                    st.markdown("• **MAD (Median Absolute Deviation):**")
+                    st.latex(r"MAD = \text{median}(|X_i - \text{median}(X)|)")
+                    
+                    st.markdown("• **Consistency Factor:**")
+                    st.latex(r"1.4826 \approx \Phi^{-1}(0.75)")
+                    st.caption("Inverse normal CDF at 75th percentile for normal distribution consistency")
+                    st.markdown("• **Robustness:** Methods resist up to 50% outlier contamination")
+                
+                # Publication references section
+                with st.expander("📚 Key Publications & References", expanded=False):
+                    st.markdown(_QC_REFERENCES_MD)
+                
+                st.divider()
+                
+                # Report options
+                report_col1, report_col2 = st.columns(2)
+                
+                with report_col1:
+                    include_formulas = st.checkbox("Include Formulas", value=True)
+                    include_methodology = st.checkbox("Include Methodology", value=True)
+                
+                with report_col2:
+                    include_edge_effects = st.checkbox("Include Edge Effects", value=bool(edge_results))
+                    include_bscore_details = st.checkbox("Include B-score Details", value=apply_b_scoring)
+                
+                if st.button("📋 Generate PDF Report"):
+                    with st.spinner("Generating QC report..."):
+                        # Create report manifest
+                        generated_at = datetime.now()
+                        manifest = {
+                            'report_date': generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+                            'plates_processed': summary.get('plate_count', 0),
+                            'total_wells': summary.get('total_wells', 0),
+                            'viability_threshold': viability_threshold,
+                            'z_cutoff': z_cutoff,
+                            'b_scoring_applied': apply_b_scoring,
+                            'edge_effects_detected': sum(r.warning_level is not WarningLevel.INFO for r in edge_results),
+                            'sections_included': dict(zip(QC_REPORT_SECTIONS, (
+                                include_formulas, include_methodology, include_edge_effects, include_bscore_details
+                            )))
+                        }
+                        
+                        # Keep the report manifest so option toggles and the
+                        # download click do not discard it; the text itself
+                        # is built when the download is requested
+                        ss.qc_report = {
+                            'data_key': data_key,
+                            'manifest': manifest,
+                            'manifest_json': bundle_json_bytes(manifest).decode('utf-8'),
+                            'file_name': f"qc_report_{generated_at.strftime('%Y%m%d_%H%M%S')}.txt"
+                        }
+                
+                qc_report = ss.qc_report
+                if qc_report and qc_report['data_key'] == data_key:
+                    # Display manifest
+                    st.subheader("Report Manifest")
+                    st.code(qc_report['manifest_json'], language='json')
                     
                     # Offer download
+                    report_data = partial(qc_report_bytes, data_key, edge_results, qc_report['manifest'])
                     st.download_button(
                         "📥 Download Text Report",
-                        report_text,
-                        file_name=f"qc_report_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                        report_data if DEFERRED_DOWNLOADS else report_data(),
+                        file_name=qc_report['file_name'],
                         mime="text/plain"
                     )
                     
                     st.success("Report generated successfully!")
-        else:
-            st.info("👆 Process plate data first to generate QC report.")
+            else:
+                st.info("👆 Process plate data first to generate QC report.")
     
     # BREAKthrough project footer
-    st.markdown("""
-    ---
-    <div style='text-align: center; padding: 2rem 0 1rem 0; color: #6b7280;'>
-        <p style='margin: 0; font-size: 0.9rem;'>
-            🏆 <strong>BREAKthrough Project</strong> - Novel Antimicrobial Strategies Against Gram-Negative Pathogens
-        </p>
-        <p style='margin: 0.5rem 0 0 0; font-size: 0.8rem;'>
-            🇪🇺 Funded by the European Union | 🧬 Advancing Combination Therapy Research
-        </p>
-        <p style='margin: 0.5rem 0 0 0; font-size: 0.7rem; color: #9ca3af;'>
-            Platform for identifying outer membrane permeabilizers as antibiotic adjuvants
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
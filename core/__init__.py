@@ -44,6 +44,7 @@ from .statistics import (
     nan_safe_median,
     robust_zscore,
     summary_statistics,
+    top_n_indices,
 )
 # Analytics integration imports - import these directly when needed
 # from .analytics_integration import (
@@ -77,6 +78,7 @@ __all__ = [
     "robust_zscore",
     "calculate_robust_zscore",
     "summary_statistics",
+    "top_n_indices",
     
     # Validation and utilities
     "validate_plate_columns",
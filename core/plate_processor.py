@@ -10,9 +10,13 @@ in the PRD document.
 
 from __future__ import annotations
 
+import html
+import io
 import logging
+import re
+import zipfile
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import IO, Any, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -23,14 +27,22 @@ from .calculations import (
     validate_plate_columns,
     process_multi_stage_hit_calling,
 )
-from .well_position_utils import standardize_well_position_columns, WellPositionError
+from .well_position_utils import add_grid_indices, standardize_well_position_columns, WellPositionError
 
 logger = logging.getLogger(__name__)
 
 # Type aliases
 PathLike = Union[str, Path]
+FileSource = Union[str, Path, IO[bytes], pd.ExcelFile]
 DataFrameLike = pd.DataFrame
 
+# Optional Rust-based Excel reader (pandas >= 2.2 engine="calamine")
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = tuple(int(p) for p in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
 
 class PlateProcessingError(Exception):
     """Custom exception for plate processing errors."""
@@ -89,14 +101,21 @@ class PlateProcessor:
         logger.info(f"Initialized PlateProcessor with viability_threshold={viability_threshold}")
     
     def load_plate_data(self, 
-                       file_path: PathLike, 
+                       file_path: FileSource, 
                        sheet_name: Optional[str] = None,
+                       file_format: Optional[str] = None,
                        **kwargs) -> pd.DataFrame:
         """Load plate data from Excel or CSV file.
         
         Args:
-            file_path: Path to the data file
+            file_path: Path to the data file, an open binary file-like object
+                (e.g. ``io.BytesIO`` of an upload) or an already opened
+                ``pd.ExcelFile``. File-like objects are typed from their
+                ``name`` attribute and default to Excel when it is missing.
             sheet_name: Excel sheet name (None for CSV or first sheet)
+            file_format: Explicit format ('csv', 'xlsx' or 'xls') overriding
+                detection; needed for unnamed streams such as
+                ``tempfile.SpooledTemporaryFile`` holding CSV data
             **kwargs: Additional arguments passed to pandas read functions
             
         Returns:
@@ -111,39 +130,78 @@ class PlateProcessor:
             >>> len(df) > 0
             True
         """
-        file_path = Path(file_path)
+        if isinstance(file_path, pd.ExcelFile) or hasattr(file_path, "read"):
+            # In-memory source: no path checks, type comes from the buffer name
+            source = file_path
+            source_name = getattr(file_path, "name", None) or "<buffer>"
+            suffix = Path(str(source_name)).suffix.lower() or '.xlsx'
+            if isinstance(file_path, pd.ExcelFile):
+                suffix = '.xlsx'
+        else:
+            source = Path(file_path)
+            source_name = source
+            suffix = source.suffix.lower()
+            
+            if not source.exists():
+                raise PlateProcessingError(f"File not found: {source}")
         
-        if not file_path.exists():
-            raise PlateProcessingError(f"File not found: {file_path}")
+        if file_format:
+            suffix = '.' + file_format.lower().lstrip('.')
         
-        logger.info(f"Loading plate data from {file_path}")
+        logger.info(f"Loading plate data from {source_name}")
         
         try:
             # Determine file type and load accordingly
-            if file_path.suffix.lower() in ['.xlsx', '.xls']:
+            if suffix in ['.xlsx', '.xls'] and CALAMINE_AVAILABLE:
+                # Fast path: calamine parses the workbook natively
+                if isinstance(source, pd.ExcelFile):
+                    df = source.parse(sheet_name=sheet_name or 0, **kwargs)
+                else:
+                    kwargs.setdefault('engine', 'calamine')
+                    df = pd.read_excel(source, sheet_name=sheet_name or 0, **kwargs)
+                logger.debug(f"Loaded sheet '{sheet_name or 'first'}' from Excel file")
+                
+            elif suffix == '.xlsx' and not kwargs:
+                # Stream cell values with openpyxl in read-only mode
+                if isinstance(source, pd.ExcelFile) and source.engine == "openpyxl":
+                    df = _read_openpyxl_sheet(source.book, sheet_name)
+                elif isinstance(source, pd.ExcelFile):
+                    df = source.parse(sheet_name=sheet_name or 0)
+                else:
+                    from openpyxl import load_workbook
+                    
+                    workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+                    try:
+                        df = _read_openpyxl_sheet(workbook, sheet_name)
+                    finally:
+                        workbook.close()
+                logger.debug(f"Loaded sheet '{sheet_name or 'first'}' from Excel file")
+                    
+            elif suffix in ['.xlsx', '.xls']:
                 # Excel file
                 if sheet_name is None:
                     # Load first sheet
-                    df = pd.read_excel(file_path, **kwargs)
+                    df = pd.read_excel(source, **kwargs)
                     logger.debug(f"Loaded first sheet from Excel file")
                 else:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
+                    df = pd.read_excel(source, sheet_name=sheet_name, **kwargs)
                     logger.debug(f"Loaded sheet '{sheet_name}' from Excel file")
                     
-            elif file_path.suffix.lower() == '.csv':
+            elif suffix == '.csv':
                 # CSV file
-                df = pd.read_csv(file_path, **kwargs)
+                df = pd.read_csv(source, **kwargs)
                 logger.debug(f"Loaded CSV file")
                 
             else:
-                raise PlateProcessingError(f"Unsupported file format: {file_path.suffix}")
+                raise PlateProcessingError(f"Unsupported file format: {suffix}")
             
             # Validate loaded data
             if df.empty:
-                raise PlateProcessingError(f"Loaded file is empty: {file_path}")
+                raise PlateProcessingError(f"Loaded file is empty: {source_name}")
             
-            # Clean column names (remove leading/trailing whitespace)
-            df.columns = df.columns.str.strip()
+            # Clean column names (remove leading/trailing whitespace);
+            # engines differ in whether numeric headers come back as str
+            df.columns = [str(col).strip() for col in df.columns]
             
             logger.info(f"Successfully loaded {len(df)} rows, {len(df.columns)} columns")
             logger.debug(f"Columns: {list(df.columns)}")
@@ -153,7 +211,33 @@ class PlateProcessor:
         except Exception as e:
             if isinstance(e, PlateProcessingError):
                 raise
-            raise PlateProcessingError(f"Failed to load {file_path}: {e}") from e
+            raise PlateProcessingError(f"Failed to load {source_name}: {e}") from e
+    
+    def load_from_excelfile(self,
+                            excel_file: pd.ExcelFile,
+                            sheet_name: Optional[str] = None) -> pd.DataFrame:
+        """Load one sheet from an already opened workbook.
+        
+        Opening a workbook unzips and parses it; keeping a single
+        ``pd.ExcelFile`` open and calling this per sheet avoids repeating
+        that work for every sheet of a multi-sheet file.
+        
+        Args:
+            excel_file: Open workbook, e.g. ``pd.ExcelFile(io.BytesIO(data))``
+            sheet_name: Sheet to load (None for the first sheet)
+            
+        Returns:
+            DataFrame with loaded plate data
+            
+        Raises:
+            PlateProcessingError: If the sheet cannot be loaded or is empty
+        """
+        if not isinstance(excel_file, pd.ExcelFile):
+            raise PlateProcessingError(
+                f"Expected pd.ExcelFile, got {type(excel_file).__name__}"
+            )
+        
+        return self.load_plate_data(excel_file, sheet_name=sheet_name)
     
     def auto_detect_columns(self, df: pd.DataFrame) -> dict[str, str]:
         """Automatically detect and map required columns.
@@ -237,7 +321,9 @@ class PlateProcessor:
             df: DataFrame with original column names
             
         Returns:
-            DataFrame with renamed columns
+            DataFrame with renamed columns. Column data is shared with ``df``
+            rather than copied, so treat the result as read-only; the
+            processing pipeline copies before modifying it.
             
         Raises:
             ColumnMappingError: If mapping columns don't exist in DataFrame
@@ -257,8 +343,9 @@ class PlateProcessor:
         # Create reverse mapping for renaming
         rename_mapping = {actual: std for std, actual in self.column_mapping.items()}
         
-        # Apply mapping - only rename the mapped columns, keep others as-is
-        mapped_df = df.rename(columns=rename_mapping)
+        # Apply mapping - only rename the mapped columns, keep others as-is.
+        # Only the column labels change, so reuse the underlying data blocks.
+        mapped_df = df.rename(columns=rename_mapping, copy=False)
         
         logger.debug(f"Applied column mapping: {len(rename_mapping)} columns renamed")
         return mapped_df
@@ -398,6 +485,10 @@ class PlateProcessor:
             if 'PlateID' not in processed_df.columns:
                 processed_df['PlateID'] = plate_id
             
+            # Cache integer well coordinates for plate-matrix consumers; the
+            # frame was built above, so no copy is needed
+            add_grid_indices(processed_df, inplace=True)
+            
             # Calculate and log summary
             summary = calculate_plate_summary(processed_df)
             logger.info(f"Plate {plate_id} processed: {summary['total_wells']} wells, "
@@ -475,12 +566,13 @@ class PlateProcessor:
         return processed_df
     
     def process_multiple_plates(self, 
-                               plate_files: dict[str, PathLike],
+                               plate_files: dict[str, FileSource],
                                sheet_names: Optional[dict[str, str]] = None) -> pd.DataFrame:
         """Process multiple plates and combine results.
         
         Args:
-            plate_files: Dictionary mapping plate IDs to file paths
+            plate_files: Dictionary mapping plate IDs to file paths or
+                file-like objects accepted by :meth:`load_plate_data`
             sheet_names: Optional dictionary mapping plate IDs to Excel sheet names
             
         Returns:
@@ -628,6 +720,90 @@ def process_plate_file(file_path: PathLike,
     return processed_df
 
 
+def excel_engine(suffix: str = '.xlsx') -> Optional[str]:
+    """Preferred pandas Excel engine for a file suffix.
+    
+    Uses calamine when ``python-calamine`` is installed, otherwise openpyxl
+    for ``.xlsx`` and the pandas default for legacy ``.xls``.
+    
+    Args:
+        suffix: File suffix including the dot
+        
+    Returns:
+        Engine name for ``pd.read_excel``/``pd.ExcelFile`` (None = pandas default)
+    """
+    if CALAMINE_AVAILABLE:
+        return "calamine"
+    return "openpyxl" if suffix.lower() == '.xlsx' else None
+
+
+def _read_openpyxl_sheet(workbook: Any, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    """Build a DataFrame from a read-only openpyxl worksheet.
+    
+    The first row supplies the column names; fully blank rows and trailing
+    empty columns are dropped, matching ``pd.read_excel`` for plate exports.
+    
+    Args:
+        workbook: openpyxl Workbook opened with ``read_only=True``
+        sheet_name: Sheet to read (None for the first sheet)
+        
+    Returns:
+        DataFrame with the sheet contents
+    """
+    if sheet_name is None:
+        worksheet = workbook.worksheets[0]
+    elif sheet_name in workbook.sheetnames:
+        worksheet = workbook[sheet_name]
+    else:
+        raise PlateProcessingError(f"Worksheet named '{sheet_name}' not found")
+    
+    rows = [row for row in worksheet.iter_rows(values_only=True)
+            if any(value is not None for value in row)]
+    if not rows:
+        return pd.DataFrame()
+    
+    width = max(
+        max(i for i, value in enumerate(row) if value is not None) + 1
+        for row in rows
+    )
+    header = rows[0][:width]
+    columns = [
+        str(name) if name is not None else f"Unnamed: {i}"
+        for i, name in enumerate(header)
+    ]
+    columns += [f"Unnamed: {i}" for i in range(len(columns), width)]
+    
+    return pd.DataFrame.from_records([row[:width] for row in rows[1:]], columns=columns)
+
+
+# <sheet name="..."/> entries in xl/workbook.xml (optionally namespace-prefixed)
+_XLSX_SHEET_PATTERN = re.compile(rb'<(?:\w+:)?sheet\s[^>]*?\bname="([^"]*)"')
+
+
+def read_xlsx_sheet_names(source: Union[PathLike, bytes]) -> Optional[list[str]]:
+    """Read sheet names from an .xlsx workbook without parsing it.
+
+    Sheet names are listed in the small ``xl/workbook.xml`` part of the zip
+    container, so only that entry is inflated instead of the whole workbook.
+
+    Args:
+        source: Path to the workbook or its raw bytes
+
+    Returns:
+        Sheet names in workbook order, or None if the source is not a zipped
+        workbook (e.g. legacy .xls) and a full reader is needed
+    """
+    zip_source = io.BytesIO(source) if isinstance(source, bytes) else source
+    try:
+        with zipfile.ZipFile(zip_source) as archive:
+            workbook_xml = archive.read('xl/workbook.xml')
+    except (KeyError, zipfile.BadZipFile):
+        return None
+
+    return [html.unescape(match.group(1).decode('utf-8'))
+            for match in _XLSX_SHEET_PATTERN.finditer(workbook_xml)]
+
+
 def get_available_excel_sheets(file_path: PathLike) -> list[str]:
     """Get list of available sheet names in an Excel file.
     
@@ -646,7 +822,11 @@ def get_available_excel_sheets(file_path: PathLike) -> list[str]:
         raise PlateProcessingError(f"File is not Excel format: {file_path}")
     
     try:
-        excel_file = pd.ExcelFile(file_path)
-        return excel_file.sheet_names
+        sheet_names = read_xlsx_sheet_names(file_path)
+        if sheet_names is not None:
+            return sheet_names
+        
+        with pd.ExcelFile(file_path, engine=excel_engine(file_path.suffix)) as excel_file:
+            return excel_file.sheet_names
     except Exception as e:
         raise PlateProcessingError(f"Could not read Excel file {file_path}: {e}") from e
\ No newline at end of file
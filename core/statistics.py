@@ -19,6 +19,15 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Optional C nanmedian; much cheaper than NumPy's on plate-sized arrays.
+# Takes an int axis or None (no axis tuples or keepdims).
+try:
+    from bottleneck import nanmedian
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    from numpy import nanmedian
+    BOTTLENECK_AVAILABLE = False
+
 # Type aliases for clarity
 ArrayLike = Union[np.ndarray, pd.Series, list[float]]
 Float = Union[float, np.floating]
@@ -52,10 +61,10 @@ def nan_safe_median(values: ArrayLike) -> Float:
         logger.debug("All values are NaN in nan_safe_median")
         return np.nan
     
-    # Use numpy's nanmedian for robust calculation
+    # Use nanmedian (bottleneck when installed) for robust calculation
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", RuntimeWarning)
-        result = np.nanmedian(values_array)
+        result = nanmedian(values_array)
     
     return float(result)
 
@@ -105,7 +114,7 @@ def mad(values: ArrayLike) -> Float:
     # Calculate MAD as median of absolute deviations
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", RuntimeWarning)
-        mad_value = np.nanmedian(abs_deviations)
+        mad_value = nanmedian(abs_deviations)
     
     result = float(mad_value) if not np.isnan(mad_value) else np.nan
     
@@ -336,4 +345,42 @@ def count_valid_values(values: ArrayLike) -> int:
         return 0
     
     values_array = np.asarray(values, dtype=float)
-    return int(np.sum(~np.isnan(values_array)))
\ No newline at end of file
+    return int(np.sum(~np.isnan(values_array)))
+
+
+def top_n_indices(values: ArrayLike, n: int, ascending: bool = False) -> np.ndarray:
+    """Positions of the ``n`` largest (or smallest) values, best first.
+    
+    Uses ``np.partition`` to find the cutoff value in linear time and then
+    sorts only the selected values, instead of sorting the whole array. NaN
+    values are never selected. Ties keep their original order, including
+    at the cutoff, so the result matches a stable full sort.
+    
+    Args:
+        values: Array-like sequence of numeric values
+        n: Number of positions to return
+        ascending: Select the smallest values instead of the largest
+        
+    Returns:
+        Integer positions into ``values``, at most ``n`` long
+    """
+    values_array = np.asarray(values, dtype=float)
+    positions = np.flatnonzero(~np.isnan(values_array))
+    keys = values_array[positions] if ascending else -values_array[positions]
+    
+    k = min(max(n, 0), len(positions))
+    if k == 0:
+        return positions[:0]
+    
+    if k < len(keys):
+        # Everything strictly better than the cutoff, then the earliest
+        # positions tied with it until k are taken
+        kth = np.partition(keys, k - 1)[k - 1]
+        better = np.flatnonzero(keys < kth)
+        tied = np.flatnonzero(keys == kth)[:k - len(better)]
+        selected = np.sort(np.concatenate([better, tied]))
+    else:
+        selected = np.arange(len(keys))
+    
+    order = selected[np.argsort(keys[selected], kind='stable')]
+    return positions[order]
@@ -357,6 +357,41 @@ def standardize_well_position_columns(df: pd.DataFrame,
             raise WellPositionError(f"Failed to standardize well positions: {e}") from e
 
 
+# Integer grid index columns cached on processed plates (internal, not exported)
+GRID_INDEX_COLUMNS = ['_RowIdx', '_ColIdx']
+
+
+def add_grid_indices(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """Add zero-based integer row/column indices for each well.
+
+    The indices are computed once so plate matrices (heatmaps, edge and
+    B-score layouts) can be filled by direct indexing instead of re-parsing
+    row letters on every render. Wells with unparseable positions get <NA>.
+
+    Args:
+        df: DataFrame with Row and Col columns
+        inplace: Add the columns to ``df`` itself instead of a copy; for
+            callers that own a freshly built frame
+
+    Returns:
+        DataFrame with added _RowIdx and _ColIdx (nullable Int8) columns
+        (``df`` itself when ``inplace`` is True)
+
+    Raises:
+        WellPositionError: If Row or Col columns are missing
+    """
+    missing_cols = [col for col in ('Row', 'Col') if col not in df.columns]
+    if missing_cols:
+        raise WellPositionError(f"Missing required columns: {missing_cols}")
+
+    row_mapping = {letter: i for i, letter in enumerate(string.ascii_uppercase)}
+
+    result = df if inplace else df.copy()
+    result['_RowIdx'] = result['Row'].astype(str).str.upper().map(row_mapping).astype('Int8')
+    result['_ColIdx'] = (pd.to_numeric(result['Col'], errors='coerce') - 1).astype('Int8')
+    return result
+
+
 def get_well_position_summary(df: pd.DataFrame) -> dict:
     """Get a summary of well position data in the DataFrame.
     
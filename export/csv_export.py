@@ -111,8 +111,9 @@ class CSVExporter:
         # Get available columns in standard order
         available_cols = [col for col in self.STANDARD_COLUMNS if col in df.columns]
         
-        # Add any additional columns not in standard list
-        extra_cols = [col for col in df.columns if col not in available_cols]
+        # Add any additional columns not in standard list (internal "_" columns are dropped)
+        extra_cols = [col for col in df.columns
+                      if col not in available_cols and not str(col).startswith('_')]
         final_cols = available_cols + sorted(extra_cols)
         
         return df[final_cols]
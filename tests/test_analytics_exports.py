@@ -0,0 +1,42 @@
+"""Unit tests for the analytics package namespace.
+
+Tests cover the lazily loaded public API declared in analytics/__init__.py.
+"""
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+import analytics
+
+
+class TestAnalyticsExports:
+    """Test cases for the analytics package exports."""
+
+    def test_exports_resolve_to_submodules(self):
+        """Every exported name resolves to the object defined in its submodule."""
+        for name, module_name in analytics._LAZY_EXPORTS.items():
+            module = importlib.import_module(f"analytics.{module_name}")
+            assert getattr(analytics, name) is getattr(module, name)
+
+    def test_type_checking_imports_match_exports(self):
+        """The TYPE_CHECKING imports list the same names as __all__."""
+        tree = ast.parse(Path(analytics.__file__).read_text(encoding='utf-8'))
+        type_checking = next(
+            node for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, 'id', None) == 'TYPE_CHECKING'
+        )
+        imported = {
+            (node.module, alias.name)
+            for node in type_checking.body if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+
+        assert imported == {(module, name) for name, module in analytics._LAZY_EXPORTS.items()}
+
+    def test_unknown_attribute(self):
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="not_an_export"):
+            analytics.not_an_export
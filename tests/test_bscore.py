@@ -88,9 +88,34 @@ class TestMedianPolish:
         
         # Check that valid positions have reasonable residuals
         valid_residuals = residuals[~np.isnan(residuals)]
-        assert len(valid_residuals) == 6  # 9 - 3 NaN values
+        assert len(valid_residuals) == 9  # 12 - 3 NaN values
         assert np.abs(np.mean(valid_residuals)) < 1.0
-    
+
+    def test_median_polish_numba_matches_numpy(self, monkeypatch):
+        """Test that the numba kernel gives the same effects as the NumPy sweeps."""
+        import analytics.bscore as bscore
+
+        if not bscore.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+
+        np.random.seed(5)
+        matrices = [
+            np.random.randn(8, 12) + np.arange(12) * 0.3,
+            np.where(np.random.rand(16, 24) < 0.1, np.nan, np.random.randn(16, 24)),
+            np.where(np.random.rand(32, 48) < 0.1, np.nan, np.random.randn(32, 48)),  # quickselect lines
+            np.random.randn(3, 4),
+        ]
+        matrices[3][1, :] = np.nan  # all-NaN row
+
+        for matrix in matrices:
+            jit_result = median_polish(matrix, return_components=True)
+            with monkeypatch.context() as m:
+                m.setattr(bscore, "NUMBA_AVAILABLE", False)
+                numpy_result = median_polish(matrix, return_components=True)
+
+            for jit_part, numpy_part in zip(jit_result, numpy_result):
+                np.testing.assert_allclose(jit_part, numpy_part, rtol=1e-12, atol=1e-12)
+
     def test_median_polish_return_components(self):
         """Test that return_components=True works correctly."""
         matrix = np.array([
@@ -186,11 +211,12 @@ class TestCalculateBScore:
     
     def test_calculate_bscore_with_missing_values(self):
         """Test B-score calculation with missing values."""
+        # Additive trend plus noise; a purely additive plate polishes to zero MAD
         matrix = np.array([
-            [1.0, 2.0, 3.0, np.nan],
-            [2.0, 3.0, np.nan, 5.0],
-            [3.0, np.nan, 5.0, 6.0],
-            [np.nan, 5.0, 6.0, 7.0]
+            [1.04, 1.96, 3.19, np.nan],
+            [1.84, 3.11, np.nan, 5.28],
+            [2.79, np.nan, 4.81, 6.01],
+            [np.nan, 4.93, 5.63, 6.78]
         ])
         
         bscores = calculate_bscore(matrix)
@@ -205,7 +231,25 @@ class TestCalculateBScore:
         valid_bscores = bscores[~np.isnan(bscores)]
         assert len(valid_bscores) == 12  # 16 - 4 NaN
         assert np.abs(np.mean(valid_bscores)) < 0.5
-    
+
+    def test_calculate_bscore_out_buffer(self):
+        """Test that B-scores can be written into a caller-provided array."""
+        np.random.seed(7)
+        matrix = np.random.randn(8, 12)
+        matrix[2, 5] = np.nan
+        out = np.empty_like(matrix)
+
+        result = calculate_bscore(matrix, out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(out, calculate_bscore(matrix))
+
+        with pytest.raises(BScoreError, match="out has shape"):
+            calculate_bscore(matrix, out=np.empty((8, 11)))
+
+        # Zero MAD fills the buffer with NaN
+        assert np.all(np.isnan(calculate_bscore(np.ones((4, 6)), out=np.zeros((4, 6)))))
+
     def test_calculate_bscore_constant_matrix(self):
         """Test B-score calculation with constant values (zero MAD case)."""
         # All values are the same
@@ -330,6 +374,74 @@ class TestBScoreProcessor:
             if len(valid_values) > 10:  # Only check if sufficient data
                 assert abs(valid_values.mean()) < 0.5, f"Mean of {col} not close to 0: {valid_values.mean()}"
                 assert 0.5 < valid_values.std() < 2.0, f"Std of {col} not reasonable: {valid_values.std()}"
+
+        # The input frame gains no columns
+        assert not any(col.startswith('B_') for col in sample_plate_data.columns)
+
+    def test_calculate_bscores_batch(self):
+        """Test vectorized B-scoring over a stack of plates."""
+        np.random.seed(789)
+        processor = BScoreProcessor(max_iter=20)
+        
+        n_plates, n_rows, n_cols = 3, 8, 12
+        row_effects = np.random.randn(n_plates, n_rows, 1) * 3
+        col_effects = np.random.randn(n_plates, 1, n_cols) * 3
+        noise = np.random.randn(n_plates, n_rows, n_cols)
+        matrices = 10 + row_effects + col_effects + noise
+        matrices[1, 2, 3] = np.nan
+        matrices[2, 4, 5] += 25  # strong hit on plate 3
+        
+        bscores = processor.calculate_bscores_batch(matrices)
+        
+        assert bscores.shape == matrices.shape
+        assert np.isnan(bscores[1, 2, 3])
+        assert np.sum(np.isnan(bscores)) == 1
+        
+        # Plates are scored independently of each other
+        for i in range(n_plates):
+            single = processor.calculate_bscores_batch(matrices[i:i + 1])
+            np.testing.assert_allclose(bscores[i], single[0], equal_nan=True)
+        
+        # Row/column effects are removed and the hit stands out
+        for i in range(n_plates):
+            assert abs(np.nanmedian(bscores[i])) < 1e-9
+        assert bscores[2, 4, 5] > 5
+        
+        with pytest.raises(ValueError, match="Expected 3D"):
+            processor.calculate_bscores_batch(matrices[0])
+    
+    def test_calculate_bscores_batch_constant_plate(self):
+        """Test that a plate with zero residual MAD gets NaN B-scores."""
+        processor = BScoreProcessor()
+        
+        matrices = np.stack([np.full((8, 12), 3.0), np.random.randn(8, 12)])
+        bscores = processor.calculate_bscores_batch(matrices)
+        
+        assert np.all(np.isnan(bscores[0]))
+        assert not np.any(np.isnan(bscores[1]))
+    
+    def test_calculate_bscores_for_plates(self, sample_plate_data):
+        """Test batch B-scoring on a multi-plate DataFrame."""
+        processor = BScoreProcessor()
+        
+        plate2 = sample_plate_data.sample(frac=1, random_state=0).copy()
+        plate2['PlateID'] = 'TestPlate2'
+        combined = pd.concat([sample_plate_data, plate2], ignore_index=True)
+        
+        result = processor.calculate_bscores_for_plates(combined, ['Z_lptA'])
+        
+        assert 'B_Z_lptA' in result.columns
+        assert len(result) == len(combined)
+        
+        # Same wells on both plates (shuffled row order) get the same B-scores
+        keyed = result.set_index(['PlateID', 'Row', 'Col'])['B_Z_lptA']
+        np.testing.assert_allclose(
+            keyed.loc['TestPlate1'].sort_index().to_numpy(),
+            keyed.loc['TestPlate2'].sort_index().to_numpy(),
+        )
+        
+        with pytest.raises(ValueError, match="Missing required columns"):
+            processor.calculate_bscores_for_plates(combined.drop(columns='PlateID'), ['Z_lptA'])
     
     def test_calculate_bscores_missing_columns(self, sample_plate_data):
         """Test error handling for missing columns."""
@@ -362,7 +474,59 @@ class TestBScoreProcessor:
         # Clear cache
         processor.clear_cache()
         assert len(processor.cache) == 0
-    
+
+    def test_non_default_index(self, sample_plate_data):
+        """Test that B-scores map back by position for a plate sliced from a larger frame."""
+        processor = BScoreProcessor(cache_enabled=False)
+        shuffled = sample_plate_data.sample(frac=1, random_state=0)
+        shuffled.index = shuffled.index + 1000
+
+        expected = processor.calculate_bscores_for_plate(sample_plate_data, metrics=['Z_lptA'])
+        result = processor.calculate_bscores_for_plate(shuffled, metrics=['Z_lptA'])
+
+        pd.testing.assert_series_equal(result['B_Z_lptA'].sort_index(),
+                                       expected['B_Z_lptA'].set_axis(expected.index + 1000))
+
+    def test_metrics_stacked_without_numba(self, monkeypatch, sample_plate_data):
+        """Test that the stacked metric path matches per-metric B-scoring and fills the cache."""
+        import analytics.bscore as bscore
+
+        monkeypatch.setattr(bscore, "NUMBA_AVAILABLE", False)
+        processor = BScoreProcessor(cache_enabled=True)
+
+        with patch.object(processor, 'calculate_bscores_batch',
+                          wraps=processor.calculate_bscores_batch) as batch:
+            result = processor.calculate_bscores_for_plate(sample_plate_data)
+
+        assert batch.call_count == 1
+        assert len(processor.cache) == len(processor.enabled_metrics)
+        for metric in processor.enabled_metrics:
+            matrix = processor._matrix_from_plate_data(sample_plate_data, metric)
+            expected = processor._matrix_to_plate_data(calculate_bscore(matrix), sample_plate_data, f"B_{metric}")
+            np.testing.assert_allclose(result[f"B_{metric}"], expected, atol=1e-5)
+
+    def test_well_positions_parsed_once_per_plate(self, sample_plate_data):
+        """Test that Row/Col parsing is shared by all metrics of a plate."""
+        processor = BScoreProcessor(cache_enabled=False)
+
+        with patch.object(processor, '_well_indices', wraps=processor._well_indices) as well_indices:
+            result = processor.calculate_bscores_for_plate(sample_plate_data)
+
+        assert well_indices.call_count == 1
+        for metric in processor.enabled_metrics:
+            assert result[f"B_{metric}"].notna().all()
+
+    def test_cache_key_distinguishes_missing_wells(self):
+        """Test that cache keys depend on where the NaN wells are."""
+        processor = BScoreProcessor(cache_enabled=True)
+        matrix_a = np.array([[1.0, np.nan], [2.0, 3.0]])
+        matrix_b = np.array([[1.0, 2.0], [np.nan, 3.0]])
+
+        assert processor._get_cache_key('Z_lptA', matrix_a) == processor._get_cache_key('Z_lptA', matrix_a.copy())
+        assert processor._get_cache_key('Z_lptA', matrix_a) != processor._get_cache_key('Z_lptA', matrix_b)
+        assert (processor._get_cache_key('Z_lptA', np.full((2, 2), np.nan))
+                != processor._get_cache_key('Z_lptA', np.full((2, 3), np.nan)))
+
     def test_custom_plate_layout(self, sample_plate_data):
         """Test with custom plate layout (384-well)."""
         processor = BScoreProcessor()
@@ -438,6 +602,19 @@ class TestConvenienceFunctions:
         assert abs(b_scores.mean()) < 0.3
         assert 0.5 < b_scores.std() < 2.0
     
+    def test_apply_bscoring_to_dataframe_shared_processor(self, sample_plate_data):
+        """Test that a passed processor is reused and keeps its cache."""
+        processor = BScoreProcessor()
+
+        first = apply_bscoring_to_dataframe(sample_plate_data, metrics=['Z_lptA'], processor=processor)
+        cached = len(processor.cache)
+        second = apply_bscoring_to_dataframe(sample_plate_data, metrics=['Z_lptA'], processor=processor)
+
+        assert cached == 1
+        assert len(processor.cache) == cached
+        assert processor.enabled_metrics == BScoreProcessor.DEFAULT_METRICS
+        pd.testing.assert_series_equal(first['B_Z_lptA'], second['B_Z_lptA'])
+
     def test_validate_bscore_matrix(self):
         """Test matrix validation function."""
         # Valid matrix
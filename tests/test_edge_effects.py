@@ -4,6 +4,7 @@ Tests cover edge effect detection algorithms, warning level determination,
 and the EdgeEffectDetector class functionality.
 """
 
+import io
 import numpy as np
 import pandas as pd
 import pytest
@@ -17,6 +18,7 @@ from analytics.edge_effects import (
     detect_edge_effects_simple,
     is_edge_effect_significant,
     format_edge_effect_summary,
+    edge_effects_to_dataframe,
 )
 
 
@@ -78,6 +80,20 @@ class TestEdgeEffectDetector:
         # For 6x8, interior should be 4x6 = 24 wells
         assert len(interior_pos_small) == 24
         assert len(edge_pos_small) == 24
+
+        # Positions come back in row-major order
+        assert edge_pos[:13] == [(0, col) for col in range(12)] + [(1, 0)]
+
+    def test_edge_mask_cached_per_layout(self):
+        """Test that the edge mask is built once per layout and is read-only."""
+        from analytics.edge_effects import _edge_mask
+
+        mask = _edge_mask((8, 12))
+
+        assert _edge_mask((8, 12)) is mask
+        assert mask.sum() == 36 and not mask[1:-1, 1:-1].any()
+        with pytest.raises(ValueError):
+            mask[0, 0] = False
     
     def test_extract_well_values(self):
         """Test extraction of values from well positions."""
@@ -337,6 +353,43 @@ class TestEdgeEffectDetector:
         assert plate1_result.effect_size_d > plate2_result.effect_size_d > plate3_result.effect_size_d
         assert plate1_result.warning_level != WarningLevel.INFO  # Should have warning
     
+    def test_detect_batch_matches_single_plate(self):
+        """Test vectorized batch detection against per-plate detection."""
+        detector = EdgeEffectDetector()
+        np.random.seed(7)
+        
+        matrices = np.random.randn(4, 8, 12)
+        matrices[1] += 4                  # strong edge effect:
+        matrices[1, 1:-1, 1:-1] -= 4      # shift perimeter only
+        matrices[2, :, :] = np.arange(12) * 0.5 + matrices[2] * 0.1  # column trend
+        matrices[3, 2:5, 3:7] = np.nan    # missing interior block
+        plate_ids = ['P1', 'P2', 'P3', 'P4']
+        
+        batch = detector.detect_batch(matrices, plate_ids, metric='Z_ldtD')
+        
+        assert [r.plate_id for r in batch] == plate_ids
+        for matrix, plate_id, result in zip(matrices, plate_ids, batch):
+            expected = detector.detect_edge_effects(matrix, 'Z_ldtD', plate_id)
+            for field in ['effect_size_d', 'edge_median', 'interior_median', 'interior_mad',
+                          'row_correlation', 'row_p_value', 'col_correlation', 'col_p_value']:
+                np.testing.assert_allclose(getattr(result, field), getattr(expected, field),
+                                           equal_nan=True, err_msg=field)
+            for field in ['row_correlation', 'row_p_value', 'col_correlation', 'col_p_value']:
+                assert type(getattr(result, field)) is float
+                assert type(getattr(expected, field)) is float
+            for corner, value in expected.corner_deviations.items():
+                np.testing.assert_allclose(result.corner_deviations[corner], value, equal_nan=True)
+            assert result.warning_level == expected.warning_level
+            assert result.n_edge_wells == expected.n_edge_wells
+            assert result.n_interior_wells == expected.n_interior_wells
+        
+        assert batch[1].warning_level == WarningLevel.CRITICAL
+        
+        with pytest.raises(EdgeEffectError, match="Expected 3D"):
+            detector.detect_batch(matrices[0], ['P1'])
+        with pytest.raises(EdgeEffectError, match="plate IDs"):
+            detector.detect_batch(matrices, ['P1'])
+    
     def test_generate_report(self):
         """Test report generation."""
         detector = EdgeEffectDetector()
@@ -523,6 +576,32 @@ class TestConvenienceFunctions:
         assert "CRITICAL" in summary
         assert "0.65" in summary or "0.650" in summary  # Row correlation
         assert "2.5" in summary  # Max corner deviation
+    
+    def test_edge_effects_to_dataframe(self):
+        """Test tabulating results for CSV export."""
+        np.random.seed(42)
+        df = pd.DataFrame({
+            'PlateID': np.repeat(['P1', 'P2'], 96),
+            'Row': np.tile(np.repeat(list('ABCDEFGH'), 12), 2),
+            'Col': np.tile(np.tile(range(1, 13), 8), 2),
+            'Z_lptA': np.random.normal(0, 1, 192)
+        })
+        results = detect_edge_effects_simple(df, 'Z_lptA')
+        
+        table = edge_effects_to_dataframe(results)
+        
+        assert len(table) == len(results)
+        assert list(table['plate_id']) == [r.plate_id for r in results]
+        assert 'corner_deviations' not in table.columns
+        assert {'corner_top_left', 'corner_bottom_right'} <= set(table.columns)
+        assert set(table['warning_level']) <= {level.value for level in WarningLevel}
+        assert table.loc[0, 'corner_top_left'] == pytest.approx(results[0].corner_deviations['top_left'], nan_ok=True)
+        
+        # Round-trips through CSV
+        restored = pd.read_csv(io.StringIO(table.to_csv(index=False)))
+        assert list(restored.columns) == list(table.columns)
+        
+        assert edge_effects_to_dataframe([]).empty
 
 
 class TestErrorHandling:
@@ -579,6 +658,32 @@ class TestErrorHandling:
         with pytest.raises(EdgeEffectError, match="Missing required columns"):
             detector.detect_edge_effects_dataframe(incomplete_df, metric='Z_lptA')
 
+    def test_failing_plate_is_skipped(self):
+        """A plate that fails analysis is skipped; the others still get results."""
+        detector = EdgeEffectDetector()
+        
+        np.random.seed(321)
+        rows = [
+            {'Row': chr(ord('A') + i), 'Col': j, 'Z_lptA': np.random.randn(), 'PlateID': plate_id}
+            for plate_id in ['Good1', 'Bad', 'Good2']
+            for i in range(8)
+            for j in range(1, 13)
+        ]
+        df = pd.DataFrame(rows)
+        df.loc[(df['PlateID'] == 'Bad') & (df['Row'] == 'A') & (df['Col'] == 1), 'Z_lptA'] = 999.0
+        
+        original = detector._calculate_spatial_autocorr
+        
+        def fail_on_bad_plate(matrix):
+            if matrix[0, 0] == 999.0:
+                raise ValueError("bad plate")
+            return original(matrix)
+        
+        with patch.object(detector, '_calculate_spatial_autocorr', side_effect=fail_on_bad_plate):
+            results = detector.detect_edge_effects_dataframe(df, metric='Z_lptA')
+        
+        assert [r.plate_id for r in results] == ['Good1', 'Good2']
+
 
 class TestNumericalStability:
     """Test numerical stability and edge cases."""
@@ -4,6 +4,7 @@ Tests the PlateProcessor class and related functions for data ingestion,
 column mapping, validation, and processing workflow.
 """
 
+import io
 import tempfile
 from pathlib import Path
 
@@ -15,8 +16,10 @@ from core.plate_processor import (
     ColumnMappingError,
     PlateProcessor,
     PlateProcessingError,
+    excel_engine,
     get_available_excel_sheets,
     process_plate_file,
+    read_xlsx_sheet_names,
 )
 
 
@@ -130,6 +133,9 @@ class TestPlateProcessor:
         # Check that other columns are preserved
         assert 'Other_Column' in result.columns
         assert result['Other_Column'].iloc[0] == 'keep'
+        
+        # Check that column data is reused rather than copied
+        assert np.shares_memory(result['BG_lptA'].to_numpy(), df['Custom_BG_lptA'].to_numpy())
     
     def test_apply_column_mapping_missing_column(self):
         """Test error when mapped column doesn't exist."""
@@ -207,6 +213,21 @@ class TestPlateProcessor:
         # Check that plate is stored
         assert 'TestPlate' in processor.processed_plates
     
+    def test_process_single_plate_adds_grid_indices(self):
+        """Test that processed plates carry zero-based row/column indices."""
+        df = pd.DataFrame({
+            'Well': ['A1', 'B3', 'H12'],
+            'BG_lptA': [100, 200, 150], 'BT_lptA': [50, 100, 75],
+            'BG_ldtD': [150, 300, 200], 'BT_ldtD': [75, 150, 100],
+            'OD_WT': [1.0, 2.0, 1.5], 'OD_tolC': [0.8, 1.6, 1.2], 'OD_SA': [1.2, 2.4, 1.8],
+        })
+        
+        result = PlateProcessor().process_single_plate(df, 'TestPlate')
+        
+        assert result['_RowIdx'].tolist() == [0, 1, 7]
+        assert result['_ColIdx'].tolist() == [0, 2, 11]
+        assert str(result['_RowIdx'].dtype) == 'Int8'
+    
     def test_get_processing_summary(self):
         """Test getting processing summary."""
         df = pd.DataFrame({
@@ -300,6 +321,109 @@ class TestFileIOFunctions:
         finally:
             Path(temp_path).unlink()  # Clean up
     
+    def test_load_from_memory_buffers(self):
+        """Test loading CSV and Excel data from in-memory buffers."""
+        data = {
+            'BG_lptA': [100, 200], 'BT_lptA': [50, 100],
+            'BG_ldtD': [150, 300], 'BT_ldtD': [75, 150],
+            'OD_WT': [1.0, 2.0], 'OD_tolC': [0.8, 1.6], 'OD_SA': [1.2, 2.4],
+        }
+        df = pd.DataFrame(data)
+        processor = PlateProcessor()
+        
+        csv_buffer = io.BytesIO(df.to_csv(index=False).encode('utf-8'))
+        csv_buffer.name = 'plate.csv'
+        result = processor.load_plate_data(csv_buffer)
+        assert len(result) == 2
+        assert result['BG_lptA'].iloc[0] == 100
+        
+        excel_buffer = io.BytesIO()
+        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+            df.to_excel(writer, index=False, sheet_name='Data')
+            df.iloc[:1].to_excel(writer, index=False, sheet_name='Other')
+        excel_buffer.seek(0)
+        
+        # Unnamed streams need an explicit format for CSV
+        with tempfile.SpooledTemporaryFile() as spool:
+            spool.write(df.to_csv(index=False).encode('utf-8'))
+            spool.seek(0)
+            result = processor.load_plate_data(spool, file_format='csv')
+        assert len(result) == 2
+        
+        # Unnamed buffers default to Excel; an open ExcelFile serves every sheet
+        with pd.ExcelFile(excel_buffer, engine='openpyxl') as excel_file:
+            assert len(processor.load_plate_data(excel_file, sheet_name='Data')) == 2
+            assert len(processor.load_plate_data(excel_file, sheet_name='Other')) == 1
+    
+    def test_load_excel_read_only_matches_pandas(self):
+        """Test the streaming openpyxl reader against pd.read_excel."""
+        df = pd.DataFrame({
+            'BG_lptA': [100, np.nan, 300], ' BT_lptA ': [50, 100, 150],
+            'Well': ['A1', 'A2', 'A3'],
+        })
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+            df.to_excel(f.name, index=False, sheet_name='Data')
+            temp_path = f.name
+        
+        try:
+            processor = PlateProcessor()
+            result = processor.load_plate_data(temp_path, sheet_name='Data')
+            expected = pd.read_excel(temp_path, sheet_name='Data')
+            expected.columns = expected.columns.str.strip()
+            
+            pd.testing.assert_frame_equal(result, expected)
+            
+            with pytest.raises(PlateProcessingError, match="not found"):
+                processor.load_plate_data(temp_path, sheet_name='Missing')
+        finally:
+            Path(temp_path).unlink()  # Clean up
+    
+    def test_load_from_excelfile(self):
+        """Test loading sheets from an already opened workbook."""
+        df = pd.DataFrame({'BG_lptA': [100, 200], 'BT_lptA': [50, 100]})
+        
+        excel_buffer = io.BytesIO()
+        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+            df.to_excel(writer, index=False, sheet_name='First')
+            (df * 2).to_excel(writer, index=False, sheet_name='Second')
+        excel_buffer.seek(0)
+        
+        processor = PlateProcessor()
+        with pd.ExcelFile(excel_buffer, engine='openpyxl') as excel_file:
+            first = processor.load_from_excelfile(excel_file)
+            second = processor.load_from_excelfile(excel_file, 'Second')
+        
+        assert first['BG_lptA'].tolist() == [100, 200]
+        assert second['BG_lptA'].tolist() == [200, 400]
+        
+        with pytest.raises(PlateProcessingError, match="Expected pd.ExcelFile"):
+            processor.load_from_excelfile(excel_buffer, 'First')
+    
+    @pytest.mark.parametrize("use_calamine", [False, True])
+    def test_load_excel_engines_agree(self, monkeypatch, use_calamine):
+        """Test that calamine and the openpyxl fallback load the same frame."""
+        import core.plate_processor as plate_processor
+        
+        if use_calamine:
+            pytest.importorskip("python_calamine")
+        monkeypatch.setattr(plate_processor, "CALAMINE_AVAILABLE", use_calamine)
+        assert excel_engine('.xlsx') == ('calamine' if use_calamine else 'openpyxl')
+        
+        df = pd.DataFrame({' BG_lptA ': [100.0, 200.0], 2024: ['a', 'b']})
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+            df.to_excel(f.name, index=False, sheet_name='Data')
+            temp_path = f.name
+        
+        try:
+            result = PlateProcessor().load_plate_data(temp_path, sheet_name='Data')
+            
+            # Header names are stripped and stringified whatever the engine
+            assert list(result.columns) == ['BG_lptA', '2024']
+            assert result['BG_lptA'].tolist() == [100.0, 200.0]
+        finally:
+            Path(temp_path).unlink()  # Clean up
+    
     def test_load_nonexistent_file(self):
         """Test error handling for nonexistent file."""
         processor = PlateProcessor()
@@ -445,6 +569,25 @@ class TestExcelSheetFunctions:
                         # Last resort: just pass if we can't clean up
                         pass
     
+    @pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter"])
+    def test_read_xlsx_sheet_names(self, engine):
+        """Test the zip shortcut against a full workbook parse."""
+        pytest.importorskip(engine)
+        names = ['Plate 1', 'R&D "raw"', 'Plätte <2>', 'Summary']
+        
+        buffer = io.BytesIO()
+        with pd.ExcelWriter(buffer, engine=engine) as writer:
+            for name in names:
+                pd.DataFrame({'A': [1]}).to_excel(writer, sheet_name=name, index=False)
+        data = buffer.getvalue()
+        
+        assert read_xlsx_sheet_names(data) == names
+        assert read_xlsx_sheet_names(data) == pd.ExcelFile(io.BytesIO(data)).sheet_names
+    
+    def test_read_xlsx_sheet_names_not_zip(self):
+        """Test that non-xlsx content signals a fallback."""
+        assert read_xlsx_sheet_names(b'col1,col2\n1,2\n') is None
+    
     def test_get_sheets_non_excel_file(self):
         """Test error when trying to get sheets from non-Excel file."""
         with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
@@ -0,0 +1,119 @@
+"""Unit tests for the per-sheet processing pipeline.
+
+Tests cover single-sheet processing, error reporting and the process-pool
+fan-out used for multi-sheet uploads.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import sheet_pipeline
+from analytics.hit_calling import analyze_multi_plate_hits, summarize_plate_analyses
+from analytics.sheet_pipeline import (
+    process_one_sheet,
+    process_sheets_parallel,
+    sheet_error_result,
+)
+
+
+def _raw_plate(seed: int) -> pd.DataFrame:
+    """Create a raw 96-well plate as it would be loaded from an upload."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(8):
+        for j in range(1, 13):
+            rows.append({
+                'Well': f"{chr(ord('A') + i)}{j}",
+                'BG_lptA': rng.uniform(800, 1200), 'BT_lptA': rng.uniform(800, 1200),
+                'BG_ldtD': rng.uniform(800, 1200), 'BT_ldtD': rng.uniform(800, 1200),
+                'OD_WT': rng.uniform(0.5, 1.0), 'OD_tolC': rng.uniform(0.5, 1.0),
+                'OD_SA': rng.uniform(0.5, 1.0),
+            })
+    return pd.DataFrame(rows)
+
+
+class TestSheetPipeline:
+    """Test cases for sheet pipeline functions."""
+
+    def test_process_one_sheet(self):
+        """Test processing a single sheet with B-scoring."""
+        result = process_one_sheet(
+            _raw_plate(1), 'screen.xlsx', 'Plate1',
+            viability_threshold=0.3, apply_bscore=True
+        )
+
+        assert result['error'] is False
+        df = result['processed_data']
+        assert len(df) == 96
+        assert (df['PlateID'] == 'screen_Plate1').all()
+        assert 'B_Z_lptA' in df.columns
+        assert result['metadata']['total_wells'] == 96
+        assert result['metadata']['plate_id'] == 'screen_Plate1'
+
+    def test_process_one_sheet_reports_errors(self):
+        """Test that failures are returned as error entries."""
+        result = process_one_sheet(
+            pd.DataFrame({'foo': [1, 2]}), 'screen.xlsx', 'Bad',
+            viability_threshold=0.3, apply_bscore=False
+        )
+
+        assert result['error'] is True
+        assert result['processed_data'] is None
+        assert result['error_message']
+        assert result.keys() == sheet_error_result('screen.xlsx', 'Bad', '').keys()
+
+    def test_deferred_hit_calling(self):
+        """Test that call_hits=False keeps hit columns but skips the analysis."""
+        config = {'hit_calling': {'multi_stage_enabled': True}}
+        result = process_one_sheet(
+            _raw_plate(2), 'screen.xlsx', 'Plate2',
+            viability_threshold=0.3, apply_bscore=False,
+            hit_calling_config=config, call_hits=False
+        )
+
+        assert result['error'] is False
+        assert 'reporter_hit' in result['processed_data'].columns
+        assert result['hit_calling_results'] == {}
+
+        plate_analyses = analyze_multi_plate_hits(
+            {'screen_Plate2': result['processed_data']}, config
+        )['plate_analyses']
+        summary = summarize_plate_analyses(plate_analyses)
+        assert summary['cross_plate_summary']['total_wells'] == 96
+        assert list(summary['summary_table']['plate_id']) == ['screen_Plate2']
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Test that pooled results match serial processing, in job order."""
+        monkeypatch.setattr(sheet_pipeline, 'POOL_MIN_WELLS', 0)
+        jobs = [
+            {'raw_df': _raw_plate(seed), 'filename': 'screen.xlsx', 'sheet_name': f'S{seed}',
+             'viability_threshold': 0.3, 'apply_bscore': False}
+            for seed in range(3)
+        ]
+
+        parallel = process_sheets_parallel(jobs, max_workers=2)
+        serial = [process_one_sheet(**job) for job in jobs]
+
+        assert [r['metadata']['sheet_name'] for r in parallel] == ['S0', 'S1', 'S2']
+        for par, ser in zip(parallel, serial):
+            pd.testing.assert_frame_equal(par['processed_data'], ser['processed_data'])
+
+    def test_small_uploads_run_serially(self, monkeypatch):
+        """Test that no pool is started below POOL_MIN_WELLS or with one worker."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not be started")
+
+        monkeypatch.setattr(sheet_pipeline, 'ProcessPoolExecutor', no_pool)
+        jobs = [
+            {'raw_df': _raw_plate(seed), 'filename': 'screen.xlsx', 'sheet_name': f'S{seed}',
+             'viability_threshold': 0.3, 'apply_bscore': False}
+            for seed in range(3)
+        ]
+
+        results = process_sheets_parallel(jobs, max_workers=2)
+        assert [r['metadata']['sheet_name'] for r in results] == ['S0', 'S1', 'S2']
+
+        monkeypatch.setattr(sheet_pipeline, 'POOL_MIN_WELLS', 0)
+        results = process_sheets_parallel(jobs, max_workers=1)
+        assert all(r['error'] is False for r in results)
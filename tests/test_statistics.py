@@ -15,6 +15,7 @@ from core.statistics import (
     nan_safe_median,
     robust_zscore,
     summary_statistics,
+    top_n_indices,
 )
 
 
@@ -248,6 +249,29 @@ class TestUtilityFunctions:
         assert count_valid_values([np.nan, np.nan, np.nan]) == 0
         assert count_valid_values([]) == 0
         assert count_valid_values([42]) == 1
+    
+    def test_top_n_indices(self):
+        """Test top-N selection matches a full sort."""
+        values = np.array([3.0, np.nan, 7.0, 1.0, 7.0, -2.0, 5.0])
+        
+        np.testing.assert_array_equal(top_n_indices(values, 3), [2, 4, 6])
+        np.testing.assert_array_equal(top_n_indices(values, 2, ascending=True), [5, 3])
+        np.testing.assert_array_equal(top_n_indices(values, 10), [2, 4, 6, 0, 3, 5])  # NaN skipped
+        assert len(top_n_indices(values, 0)) == 0
+        assert len(top_n_indices([np.nan, np.nan], 5)) == 0
+        
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=1000)
+        np.testing.assert_array_equal(top_n_indices(data, 25), np.argsort(-data)[:25])
+        
+        # Ties at the cutoff go to the earliest positions, as with a stable sort (nlargest)
+        tied = np.array([5, 3, 3, 3, 3, 3, 3, 3, 1, 3, 3, 3, 3.] * 3)
+        np.testing.assert_array_equal(top_n_indices(tied, 4), [0, 13, 26, 1])
+        np.testing.assert_array_equal(top_n_indices(tied, 5, ascending=True),
+                                      np.argsort(tied, kind='stable')[:5])
+        for n in range(len(tied) + 1):
+            np.testing.assert_array_equal(top_n_indices(tied, n),
+                                          np.argsort(-tied, kind='stable')[:n])
 
 
 class TestEdgeCases: